@@ -0,0 +1,181 @@
+"""
+Sync WSGI workers vs the ASGI async read path under simulated database
+latency. Every query sleeps --latency-ms (the round trip to a remote
+Postgres); the sync side serves requests from --workers blocking workers, the
+ASGI side from one event loop with up to --concurrency requests in flight.
+Run from the repository root:
+
+    python -m benchmarks.bench_asgi --latency-ms 20 --requests 300
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+import django
+from django.conf import settings
+
+
+ENDPOINTS = ['/wishes/', '/wishes/?page=2', '/categories/', '/wishes/{wish_id}/', '/speeches/', '/event/']
+
+
+def seed(count):
+    from django.core.management import call_command
+    from social_connect_app.models import SeekersInstitutes, Wishes, WishStatus, Speeches, SpeechStatus, SocialMedia
+
+    call_command('migrate', verbosity=0)
+    user = SeekersInstitutes.objects.create(email='institute@example.com', first_name='Institute')
+    volunteer = SeekersInstitutes.objects.create(email='volunteer@example.com', first_name='Volunteer')
+    for index in range(count):
+        wish = Wishes.objects.create(wish_title=f'Wish {index}', wish_description='Description', created_by=user, category='Education')
+        WishStatus.objects.create(wish=wish, status='In-Progress').picked_by.add(volunteer)
+        speech = Speeches.objects.create(speech_title=f'Speech {index}', speech_description='Description', created_by=user)
+        SpeechStatus.objects.create(speech=speech, status='Created')
+        SocialMedia.objects.create(wish=wish, user=volunteer, url=['https://example.com'])
+    return wish.pk
+
+
+def add_latency(latency):
+    from django.db.backends.signals import connection_created
+
+    def sleep_then_execute(execute, sql, params, many, context):
+        time.sleep(latency)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        # Connections are reopened per request; wrap each wrapper object once.
+        if sleep_then_execute not in connection.execute_wrappers:
+            connection.execute_wrappers.append(sleep_then_execute)
+
+    connection_created.connect(install, weak=False)
+
+
+def url_module(read_views):
+    from django.urls import path
+
+    class URLs:
+        urlpatterns = [
+            path('wishes/', read_views.list_wishes),
+            path('speeches/', read_views.list_speeches),
+            path('categories/', read_views.get_categories),
+            path('wishes/<int:wishID>/', read_views.get_wish_details),
+            path('event/', read_views.event),
+        ]
+
+    return URLs
+
+
+def split(url):
+    path, _, query = url.partition('?')
+    return path, query
+
+
+def run_wsgi(urls, workers):
+    from django.core.handlers.wsgi import WSGIHandler
+
+    handler = WSGIHandler()
+
+    def get(url):
+        path, query = split(url)
+        environ = {
+            'REQUEST_METHOD': 'GET', 'PATH_INFO': path, 'QUERY_STRING': query, 'SERVER_NAME': 'testserver',
+            'SERVER_PORT': '80', 'wsgi.input': BytesIO(), 'wsgi.url_scheme': 'http',
+        }
+        statuses = []
+        body = b''.join(handler(environ, lambda status, headers: statuses.append(status)))
+        assert statuses[0].startswith('200'), (url, statuses[0], body[:200])
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(get, urls))
+    return time.perf_counter() - start
+
+
+def run_asgi(urls, concurrency):
+    from django.core.handlers.asgi import ASGIHandler
+
+    handler = ASGIHandler()
+
+    async def get(url, limit):
+        path, query = split(url)
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET', 'scheme': 'http',
+            'path': path, 'raw_path': path.encode(), 'query_string': query.encode(), 'root_path': '',
+            'headers': [(b'host', b'testserver')], 'client': ('127.0.0.1', 0), 'server': ('testserver', 80),
+        }
+        body_sent = False
+        disconnected = asyncio.Event()
+        messages = []
+
+        async def receive():
+            nonlocal body_sent
+            if not body_sent:
+                body_sent = True
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await disconnected.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            messages.append(message)
+
+        async with limit:
+            await handler(scope, receive, send)
+        assert messages[0]['status'] == 200, (url, messages)
+
+    async def main():
+        limit = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(get(url, limit) for url in urls))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--workers', type=int, default=3, help='sync workers (gunicorn default config uses a few)')
+    parser.add_argument('--concurrency', type=int, default=50, help='requests in flight on the ASGI side')
+    parser.add_argument('--items', type=int, default=50)
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    settings.configure(
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': os.path.join(directory, 'bench.sqlite3')}},
+        INSTALLED_APPS=['django.contrib.contenttypes', 'django.contrib.auth', 'social_connect_app'],
+        ALLOWED_HOSTS=['testserver'],
+        MIDDLEWARE=[],
+        ROOT_URLCONF=None,
+        USE_TZ=True,
+        # Measure the database path, not the per-object cache.
+        OBJECT_CACHE_ENABLED=False,
+    )
+    django.setup()
+
+    from django.urls import clear_url_caches
+    from social_connect_app import views, async_views
+
+    wish_id = seed(args.items)
+    add_latency(args.latency_ms / 1000)
+    urls = [ENDPOINTS[index % len(ENDPOINTS)].format(wish_id=wish_id) for index in range(args.requests)]
+
+    settings.ROOT_URLCONF = url_module(views)
+    clear_url_caches()
+    wsgi_time = run_wsgi(urls, args.workers)
+
+    settings.ROOT_URLCONF = url_module(async_views)
+    clear_url_caches()
+    asgi_time = run_asgi(urls, args.concurrency)
+
+    print(f'{args.requests} requests, {args.latency_ms:g} ms per query')
+    print(f'  WSGI, {args.workers} sync workers        {wsgi_time:7.2f} s  {args.requests / wsgi_time:8.1f} req/s')
+    print(f'  ASGI, {args.concurrency} in flight          {asgi_time:7.2f} s  {args.requests / asgi_time:8.1f} req/s  ({wsgi_time / asgi_time:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,106 @@
+"""
+Full dump of the wishes table: the export/ stream (NDJSON and CSV) against
+scraping wishes/?page=N page by page, with the peak memory of the stream at
+a quarter and at all of the rows. Run from the repository root:
+
+    python -m benchmarks.bench_export --wishes 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+import django
+from django.conf import settings
+
+
+def setup(count):
+    from social_connect_app.models import SeekersInstitutes, Wishes, WishStatus
+
+    seeker = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+    wishes = []
+    for index in range(count):
+        wish = Wishes(wish_title=f'Wish {index}', wish_description='A description of the wish. ' * 8,
+                      created_by=seeker, category='Education', location='Pune', latitude=18.52, longitude=73.85)
+        wish.set_derived_fields()
+        wishes.append(wish)
+    wishes = Wishes.objects.bulk_create(wishes, batch_size=2000)
+    WishStatus.objects.bulk_create([WishStatus(wish=wish) for wish in wishes], batch_size=2000)
+
+
+def consume(output, since):
+    from social_connect_app import export
+
+    rows = size = 0
+    for chunk in export.stream('wishes', output, since):
+        rows += chunk.count(b'\n')
+        size += len(chunk)
+    return rows, size
+
+
+def measure_stream(output, since=None):
+    start = time.perf_counter()
+    rows, size = consume(output, since)
+    elapsed = time.perf_counter() - start
+    # Memory in a second pass: tracemalloc slows allocation down.
+    tracemalloc.start()
+    consume(output, since)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, rows, size
+
+
+def scrape_pages():
+    from django.test import Client
+
+    client = Client()
+    start = time.perf_counter()
+    page, rows = 1, 0
+    while True:
+        data = client.get('/wishes/', {'page': page}).json()['data']
+        rows += len(data['items'])
+        if not data['has_next']:
+            break
+        page += 1
+    return time.perf_counter() - start, page, rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--wishes', type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    settings.configure(
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': os.path.join(directory, 'bench.sqlite3')}},
+        INSTALLED_APPS=['django.contrib.contenttypes', 'django.contrib.auth', 'social_connect_app'],
+        ROOT_URLCONF='social_connect_app.urls',
+        ALLOWED_HOSTS=['testserver'],
+        USE_TZ=True,
+        ASYNC_VIEWS=False,
+        OBJECT_CACHE_ENABLED=False,
+    )
+    django.setup()
+
+    from django.core.management import call_command
+    from social_connect_app.models import Wishes
+
+    call_command('migrate', verbosity=0)
+    setup(args.wishes)
+    # The newest quarter of the rows.
+    quarter = Wishes.objects.order_by('-created_date', '-pk').values_list('created_date', flat=True)[args.wishes // 4 - 1]
+
+    print(f'{args.wishes} wishes')
+    for output in ('ndjson', 'csv'):
+        for label, since in (('quarter', quarter), ('all', None)):
+            elapsed, peak, rows, size = measure_stream(output, since)
+            print(f'  export {output:6} {label:7} {elapsed:7.2f} s  {rows / elapsed:9.0f} rows/s  '
+                  f'{size / 2**20:6.1f} MiB out  peak {peak / 2**20:5.1f} MiB')
+    elapsed, pages, rows = scrape_pages()
+    print(f'  wishes/?page=N   {elapsed:7.2f} s  {rows / elapsed:9.0f} rows/s  {pages} requests')
+
+
+if __name__ == '__main__':
+    main()
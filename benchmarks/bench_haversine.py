@@ -0,0 +1,125 @@
+"""
+Scalar haversine() loop vs the vectorized radius filter used by the location
+views, first on in-memory tuples and then end to end through the ORM on an
+in-memory SQLite database. Run from the repository root:
+
+    python -m benchmarks.bench_haversine --rows 100000 --orm-rows 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+
+import django
+from django.conf import settings
+
+
+LATITUDE, LONGITUDE = 18.52, 73.85
+
+
+def measure(func, *args, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best, peak
+
+
+def report(title, baseline, candidate):
+    (base_result, base_time, base_peak), (result, cand_time, cand_peak) = baseline, candidate
+    if base_result != result:
+        sys.exit(f'{title}: vectorized result differs from the scalar loop')
+
+    print(title)
+    print(f'  loop        {base_time * 1000:9.2f} ms  peak {base_peak / 1024:9.1f} KiB')
+    print(f'  vectorized  {cand_time * 1000:9.2f} ms  peak {cand_peak / 1024:9.1f} KiB')
+    print(f'  speedup     {base_time / cand_time:9.1f}x  ({len(result)} matches)')
+
+
+def random_points(rng, count):
+    return [(LATITUDE + rng.uniform(-2, 2), LONGITUDE + rng.uniform(-2, 2)) for _ in range(count)]
+
+
+def bench_arrays(rows, radius):
+    from social_connect_app.distance import radius_mask, rows_to_arrays
+    from social_connect_app.geo import haversine
+
+    def loop_filter():
+        return [pk for pk, lat, lon in rows if haversine(LATITUDE, LONGITUDE, lat, lon) <= radius]
+
+    def vectorized_filter():
+        pks, latitudes, longitudes = rows_to_arrays(rows)
+        _, mask = radius_mask(LATITUDE, LONGITUDE, latitudes, longitudes, radius)
+        return pks[mask].tolist()
+
+    report(f'arrays: {len(rows)} rows, radius {radius} km', measure(loop_filter), measure(vectorized_filter))
+
+
+def hydrate(queryset, pks):
+    """Model instances for `pks`, in the same order."""
+    objects = queryset.in_bulk(pks)
+    return [objects[pk] for pk in pks if pk in objects]
+
+
+def bench_orm(points, radius):
+    from django.core.management import call_command
+    from social_connect_app.distance import ids_within_radius
+    from social_connect_app.geo import haversine
+    from social_connect_app.models import SeekersInstitutes, Wishes, WishStatus
+
+    call_command('migrate', verbosity=0)
+    user = SeekersInstitutes.objects.create(email='bench@example.com', first_name='Bench')
+    wishes = Wishes.objects.bulk_create(
+        Wishes(wish_title='Wish', wish_description='Description', created_by=user, latitude=lat, longitude=lon)
+        for lat, lon in points
+    )
+    WishStatus.objects.bulk_create(WishStatus(wish=wish) for wish in wishes)
+    queryset = Wishes.objects.all().select_related('wish_status', 'created_by')
+
+    # The location views before the vectorized engine: hydrate every row.
+    def loop_filter():
+        return [
+            wish.pk for wish in queryset.all()
+            if wish.latitude is not None and wish.longitude is not None
+            and haversine(LATITUDE, LONGITUDE, wish.latitude, wish.longitude) <= radius
+        ]
+
+    def vectorized_filter():
+        return [wish.pk for wish in hydrate(queryset, ids_within_radius(queryset, LATITUDE, LONGITUDE, radius))]
+
+    report(f'orm: {len(points)} rows, radius {radius} km', measure(loop_filter), measure(vectorized_filter))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--orm-rows', type=int, default=20_000)
+    parser.add_argument('--radius', type=float, default=10.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    settings.configure(
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        INSTALLED_APPS=['django.contrib.contenttypes', 'django.contrib.auth', 'social_connect_app'],
+        USE_TZ=True,
+    )
+    django.setup()
+
+    rng = random.Random(args.seed)
+    rows = [(pk, lat, lon) for pk, (lat, lon) in enumerate(random_points(rng, args.rows), start=1)]
+    bench_arrays(rows, args.radius)
+
+    if args.orm_rows:
+        bench_orm(random_points(rng, args.orm_rows), args.radius)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Concurrent picks of one wish: the previous pick_wish body (six reads, then
+the M2M add) against picks.pick() (locked status row, one conflict-ignoring
+insert). --threads workers pick the same wish with distinct users; every
+query first sleeps --latency-ms to stand in for the round trip to a remote
+database. Run from the repository root:
+
+    python -m benchmarks.bench_picks --threads 8 --picks 400 --latency-ms 2
+
+SQLite (the default) has a single writer and fails deferred transactions
+that lose the race for it, so there each pick holds a process-wide lock and
+only the round trips are compared. Set DB_ENGINE=postgres and the DB_*
+variables of settings.py to measure row-level locking as well.
+"""
+
+import argparse
+import contextlib
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+from django.conf import settings
+
+
+def database(directory):
+    if os.environ.get('DB_ENGINE') == 'postgres':
+        return {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'social_connect'),
+            'USER': os.environ.get('DB_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+            'TEST': {'NAME': 'bench_picks'},
+        }
+    return {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.path.join(directory, 'bench.sqlite3'),
+        'OPTIONS': {'timeout': 60},
+    }
+
+
+def legacy_pick(wish_id, user_id):
+    """The pick_wish body before picks.pick()."""
+    from django.db import transaction
+    from social_connect_app.models import SeekersInstitutes, Wishes, WishStatus
+    from social_connect_app.stats import record_pick, record_status_change
+
+    wish = Wishes.objects.get(wish_id=wish_id)
+    wish_status, _ = WishStatus.objects.get_or_create(wish=wish)
+    if not SeekersInstitutes.objects.filter(pk=user_id).exists():
+        return False
+    user = SeekersInstitutes.objects.get(pk=user_id)
+    picker_ids = list(wish_status.picked_by.values_list('pk', flat=True))
+    if user.pk in picker_ids:
+        return False
+
+    old_status = wish_status.status
+    wish_status.status = 'In-Progress'
+    with transaction.atomic():
+        wish_status.picked_by.add(user)
+        wish_status.save()
+        record_status_change('wishes', picker_ids, old_status, 'In-Progress')
+        record_pick('wishes', user.pk, 'In-Progress')
+    return True
+
+
+def setup(users):
+    from django.db import connection
+    from social_connect_app.models import SeekersInstitutes, Wishes, WishStatus
+
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA journal_mode=WAL')
+    seeker = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+    SeekersInstitutes.objects.bulk_create([
+        SeekersInstitutes(email=f'volunteer{index}@example.com', first_name='Volunteer') for index in range(users)
+    ])
+    user_ids = list(SeekersInstitutes.objects.exclude(pk=seeker.pk).values_list('pk', flat=True))
+
+    wishes = []
+    for _ in range(2):
+        wish = Wishes.objects.create(wish_title='Popular wish', wish_description='Description', created_by=seeker)
+        WishStatus.objects.create(wish=wish)
+        wishes.append(wish.pk)
+    return wishes, user_ids
+
+
+def add_latency(latency):
+    from django.db.backends.signals import connection_created
+
+    def sleep_then_execute(execute, sql, params, many, context):
+        time.sleep(latency)
+        return execute(sql, params, many, context)
+
+    def install(sender, connection, **kwargs):
+        if sleep_then_execute not in connection.execute_wrappers:
+            connection.execute_wrappers.append(sleep_then_execute)
+
+    connection_created.connect(install, weak=False)
+
+
+def run(pick, wish_id, user_ids, threads):
+    from django.db import connections, DatabaseError
+
+    outcomes = {'picked': 0, 'rejected': 0, 'errors': 0}
+    lock = threading.Lock()
+    writer = threading.Lock() if connections['default'].vendor == 'sqlite' else contextlib.nullcontext()
+
+    def one(user_id):
+        try:
+            with writer:
+                outcome = 'picked' if pick(wish_id, user_id) else 'rejected'
+        except DatabaseError:
+            outcome = 'errors'
+        finally:
+            connections.close_all()
+        with lock:
+            outcomes[outcome] += 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(one, user_ids))
+    return time.perf_counter() - start, outcomes
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--picks', type=int, default=400, help='picks per implementation, one per user')
+    parser.add_argument('--latency-ms', type=float, default=2)
+    parser.add_argument('--duplicates', type=float, default=0.25, help='share of picks that repeat an earlier user')
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp()
+    settings.configure(
+        DATABASES={'default': database(directory)},
+        INSTALLED_APPS=['django.contrib.contenttypes', 'django.contrib.auth', 'social_connect_app'],
+        USE_TZ=True,
+        OBJECT_CACHE_ENABLED=False,
+    )
+    django.setup()
+
+    from django.core.management import call_command
+    from django.db import connection
+    from social_connect_app.models import WishStatus
+    from social_connect_app.picks import pick
+
+    call_command('migrate', verbosity=0)
+    (legacy_wish, new_wish), user_ids = setup(args.picks)
+    # Repeat some users so duplicate detection is exercised under contention.
+    repeats = user_ids[:int(len(user_ids) * args.duplicates)]
+    requests = [user_id for pair in zip(user_ids, repeats + [None] * len(user_ids)) for user_id in pair if user_id]
+    add_latency(args.latency_ms / 1000)
+    connection.close()
+
+    print(f'{len(requests)} picks of one wish ({len(repeats)} repeats), {args.threads} threads, '
+          f'{args.latency_ms:g} ms per query, {connection.vendor}')
+    for name, implementation, wish_id in (
+        ('previous', legacy_pick, legacy_wish),
+        ('picks.pick', lambda wish_id, user_id: pick(WishStatus, wish_id, user_id), new_wish),
+    ):
+        elapsed, outcomes = run(implementation, wish_id, requests, args.threads)
+        pickers = WishStatus.objects.get(wish_id=wish_id).picked_by.count()
+        print(f'  {name:11} {elapsed:7.2f} s  {len(requests) / elapsed:8.1f} picks/s  '
+              f'picked {outcomes["picked"]}, rejected {outcomes["rejected"]}, errors {outcomes["errors"]}, '
+              f'pickers stored {pickers}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""
+Serialization time per 1,000 wishes: the original wish_to_dict() +
+JsonResponse path vs the precomputed field plans + FastJsonResponse (stdlib and
+orjson encoders), plus rendering summary items from values() rows. Run from
+the repository root:
+
+    python -m benchmarks.bench_rendering --items 1000
+"""
+
+import argparse
+import time
+from datetime import datetime, timezone
+
+import django
+from django.conf import settings
+
+
+def legacy_user_to_dict(user):
+    return {
+        'user_id': user.user_id,
+        'email': user.email,
+        'picture': user.picture,
+        'first_name': user.first_name,
+        'last_name': user.family_name
+    }
+
+
+def legacy_wish_to_dict(wish):
+    return {
+        'wish_id': wish.wish_id,
+        'wish_title': wish.wish_title,
+        'wish_description': wish.wish_description,
+        'created_by': legacy_user_to_dict(wish.created_by),
+        'picked_by': [legacy_user_to_dict(user) for user in wish.wish_status.picked_by.all()] if hasattr(wish, 'wish_status') else [],
+        'is_picked': wish.is_picked,
+        'pick_count': wish.pick_count,
+        'status': wish.status,
+        'is_verified': wish.is_verified,
+        'category': wish.category,
+        'location': wish.location,
+        'latitude': wish.latitude,
+        'longitude': wish.longitude,
+        'created_date': wish.created_date.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+
+
+def build_wishes(count):
+    """Unsaved wishes wired up as if loaded with wish_queryset()."""
+    from social_connect_app.models import SeekersInstitutes, Wishes, WishStatus
+
+    creator = SeekersInstitutes(user_id=1, email='creator@example.com', first_name='Créator', family_name='One')
+    pickers = [SeekersInstitutes(user_id=index, email=f'picker{index}@example.com', first_name='Picker') for index in (2, 3)]
+    created = datetime(2024, 7, 20, 13, 23, 5, tzinfo=timezone.utc)
+
+    wishes = []
+    for index in range(1, count + 1):
+        wish = Wishes(
+            wish_id=index, wish_title=f'Wish {index}', wish_description='Books for the school library',
+            created_by=creator, category='Education', location='Pune', latitude=18.52, longitude=73.85,
+            created_date=created, status='In-Progress', pick_count=len(pickers), is_picked=True,
+        )
+        status = WishStatus(id=index, wish=wish, status='In-Progress')
+        picked_by = SeekersInstitutes.objects.none()
+        picked_by._result_cache = pickers
+        status._prefetched_objects_cache = {'picked_by': picked_by}
+        wish.wish_status = status
+        wishes.append(wish)
+    return wishes
+
+
+def timed(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--items', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    settings.configure(
+        DATABASES={'default': {'ENGINE': 'django.db.backends.sqlite3', 'NAME': ':memory:'}},
+        INSTALLED_APPS=['django.contrib.contenttypes', 'django.contrib.auth', 'social_connect_app'],
+        USE_TZ=True,
+    )
+    django.setup()
+
+    from django.http import JsonResponse
+    from social_connect_app import rendering
+    from social_connect_app.rendering import FastJsonResponse, WISH_PLAN, WISH_SUMMARY_PLAN
+
+    wishes = build_wishes(args.items)
+    scale = 1000 / args.items
+
+    legacy, legacy_time = timed(lambda: JsonResponse({'success': True, 'data': {'items': [legacy_wish_to_dict(w) for w in wishes]}}).content, args.repeat)
+    planned, planned_time = timed(lambda: FastJsonResponse({'success': True, 'data': {'items': [WISH_PLAN.render(w) for w in wishes]}}).content, args.repeat)
+    assert legacy == planned, 'plan output is not byte-identical'
+
+    print(f'per 1,000 items ({args.items} rendered, best of {args.repeat})')
+    print(f'  wish_to_dict + JsonResponse        {legacy_time * scale * 1000:8.2f} ms')
+    print(f'  WISH_PLAN + FastJsonResponse       {planned_time * scale * 1000:8.2f} ms  ({legacy_time / planned_time:.1f}x)')
+
+    if rendering.orjson is not None:
+        settings.JSON_RENDERER = 'orjson'
+        _, orjson_time = timed(lambda: FastJsonResponse({'success': True, 'data': {'items': [WISH_PLAN.render(w) for w in wishes]}}).content, args.repeat)
+        settings.JSON_RENDERER = 'json'
+        print(f'  WISH_PLAN + orjson (compact)       {orjson_time * scale * 1000:8.2f} ms  ({legacy_time / orjson_time:.1f}x)')
+
+    rows = [
+        {
+            'wish_id': w.wish_id, 'wish_title': w.wish_title, 'wish_description': w.wish_description,
+            'created_by__picture': None, 'created_by__first_name': w.created_by.first_name,
+            'status': w.status, 'category': w.category, 'created_date': w.created_date,
+        }
+        for w in wishes
+    ]
+    _, rows_time = timed(lambda: [WISH_SUMMARY_PLAN.render_row(row) for row in rows], args.repeat)
+    print(f'  WISH_SUMMARY_PLAN from values()    {rows_time * scale * 1000:8.2f} ms  (dicts only)')
+
+
+if __name__ == '__main__':
+    main()
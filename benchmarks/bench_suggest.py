@@ -0,0 +1,85 @@
+"""
+Prefix suggestion index (social_connect_app/suggest.py): build time and
+memory per 100k entries, lookup latency for 1-4 character prefixes, and the
+cost of an incremental update. Run from the repository root:
+
+    python -m benchmarks.bench_suggest --entries 100000
+"""
+
+import argparse
+import random
+import statistics
+import time
+import tracemalloc
+
+import django
+from django.conf import settings
+
+
+SYLLABLES = ['ka', 'ri', 'mo', 'su', 'ne', 'ta', 'lo', 'vi', 'pa', 'de', 'gu', 'sha', 'an', 'el', 'or', 'bu']
+WORDS = ['lessons', 'kit', 'for', 'children', 'books', 'talk', 'workshop', 'guitar', 'school', 'garden', 'library']
+
+
+def random_rows(rng, count):
+    """(field, text) pairs with a skewed popularity: about a third repeat."""
+    rows = []
+    for index in range(count):
+        if rows and rng.random() < 0.35:
+            rows.append(rng.choice(rows))
+            continue
+        word = ''.join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).capitalize()
+        if index % 10 == 0:
+            rows.append(('location', f'{word}pur'))
+        else:
+            rows.append(('title', f'{word} {" ".join(rng.choices(WORDS, k=rng.randint(1, 5)))}'))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--entries', type=int, default=100_000, help='rows fed to the index')
+    parser.add_argument('--lookups', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args(argv)
+
+    settings.configure(INSTALLED_APPS=['django.contrib.contenttypes', 'django.contrib.auth', 'social_connect_app'])
+    django.setup()
+    from social_connect_app.suggest import PrefixIndex
+
+    rng = random.Random(args.seed)
+    rows = random_rows(rng, args.entries)
+
+    start = time.perf_counter()
+    PrefixIndex(rows)
+    build = time.perf_counter() - start
+
+    tracemalloc.start()
+    index = PrefixIndex(rows)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    per_100k = 100_000 / len(index)
+    print(f'{args.entries} rows -> {len(index)} entries')
+    print(f'  build        {build * 1000:9.1f} ms   ({build * 1000 * per_100k:.1f} ms per 100k entries)')
+    print(f'  memory       {memory / 2**20:9.1f} MiB  ({memory / 2**20 * per_100k:.1f} MiB per 100k entries)')
+
+    texts = [text for _, text in rows]
+    for length in (1, 2, 3, 4):
+        timings = []
+        for _ in range(args.lookups):
+            prefix = rng.choice(texts)[:length]
+            start = time.perf_counter()
+            index.suggest(prefix, 10)
+            timings.append(time.perf_counter() - start)
+        timings.sort()
+        print(f'  lookup {length} ch  p50 {statistics.median(timings) * 1e6:8.1f} us   '
+              f'p99 {timings[int(len(timings) * 0.99)] * 1e6:8.1f} us   max {timings[-1] * 1e6:8.1f} us')
+
+    start = time.perf_counter()
+    for index_number in range(1000):
+        index.add('title', f'New title {index_number}')
+    print(f'  add          {(time.perf_counter() - start) * 1000:9.3f} us per new entry')
+
+
+if __name__ == '__main__':
+    main()
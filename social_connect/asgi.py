@@ -12,5 +12,12 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'social_connect.settings')
+# Serve the async read views (social_connect_app/async_views.py) under ASGI.
+os.environ.setdefault('ASYNC_VIEWS', 'true')
 
 application = get_asgi_application()
+
+# Build the in-memory suggestion index while the worker starts up.
+from social_connect_app import suggest  # noqa: E402
+
+suggest.warm()
@@ -12,6 +12,7 @@ https://docs.djangoproject.com/en/5.0/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -43,6 +44,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'social_connect_app.middleware.RequestMetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -112,6 +114,65 @@ DATABASES = {
   }
 }
 
+# Local runs and benchmarks: DB_ENGINE=sqlite uses db.sqlite3 (or DB_NAME);
+# DB_ENGINE=postgres uses a local Postgres configured through the DB_* variables.
+if os.environ.get('DB_ENGINE') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': os.environ.get('DB_NAME', BASE_DIR / 'db.sqlite3'),
+        }
+    }
+elif os.environ.get('DB_ENGINE') == 'postgres':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.postgresql',
+            'NAME': os.environ.get('DB_NAME', 'social_connect'),
+            'USER': os.environ.get('DB_USER', 'postgres'),
+            'PASSWORD': os.environ.get('DB_PASSWORD', ''),
+            'HOST': os.environ.get('DB_HOST', 'localhost'),
+            'PORT': os.environ.get('DB_PORT', '5432'),
+        }
+    }
+
+# Cache
+# https://docs.djangoproject.com/en/5.0/topics/cache/
+# Redis, shared by every worker, when REDIS_URL is set (as the Railway Redis
+# service does); in-process locmem otherwise. CACHE_BACKEND/CACHE_LOCATION
+# override either.
+
+REDIS_URL = os.environ.get('REDIS_URL')
+
+if REDIS_URL:
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.redis.RedisCache')
+    CACHE_LOCATION = os.environ.get('CACHE_LOCATION', REDIS_URL)
+else:
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache')
+    CACHE_LOCATION = os.environ.get('CACHE_LOCATION', 'social-connect')
+
+CACHES = {
+    'default': {
+        'BACKEND': CACHE_BACKEND,
+        'LOCATION': CACHE_LOCATION,
+        'TIMEOUT': 300,
+    }
+}
+if CACHE_BACKEND.endswith('.LocMemCache'):
+    # Other backends pass OPTIONS on to their client.
+    CACHES['default']['OPTIONS'] = {'MAX_ENTRIES': int(os.environ.get('CACHE_MAX_ENTRIES', 10000))}
+
+# Category list of categories/; per-process with locmem, so other workers
+# see a new category after at most this many seconds.
+CATEGORIES_CACHE_TIMEOUT = int(os.environ.get('CATEGORIES_CACHE_TIMEOUT', 60))
+
+# Versioned per-object cache of serialized wishes/speeches (object_cache.py).
+# It needs a cache shared by every worker (REDIS_URL above): on locmem it
+# stays off unless OBJECT_CACHE_ALLOW_LOCMEM is set, for single-process runs.
+# metrics/ reports whether it is on and its hits and misses.
+OBJECT_CACHE_ENABLED = os.environ.get('OBJECT_CACHE_ENABLED', 'true').lower() == 'true'
+OBJECT_CACHE_ALLOW_LOCMEM = os.environ.get('OBJECT_CACHE_ALLOW_LOCMEM', 'false').lower() == 'true'
+OBJECT_CACHE_TIMEOUT = int(os.environ.get('OBJECT_CACHE_TIMEOUT', 3600))
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -161,3 +222,44 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 
 
+# Response encoder: 'json' keeps responses byte-identical to JsonResponse;
+# 'orjson' (when installed) is faster but emits compact, unescaped JSON.
+JSON_RENDERER = os.environ.get('JSON_RENDERER', 'json')
+
+# Route the read-heavy endpoints to async_views (set by asgi.py).
+ASYNC_VIEWS = os.environ.get('ASYNC_VIEWS', 'false').lower() == 'true'
+
+# Per-request metrics (social_connect_app/middleware.py): one JSON log line per
+# request; a query shape repeated more than QUERY_REPEAT_THRESHOLD times in a
+# request is flagged as a likely N+1.
+REQUEST_METRICS_ENABLED = os.environ.get('REQUEST_METRICS_ENABLED', 'true').lower() == 'true'
+QUERY_REPEAT_THRESHOLD = int(os.environ.get('QUERY_REPEAT_THRESHOLD', 5))
+
+# Prometheus metrics (social_connect_app/metrics.py). With several worker
+# processes, point METRICS_DIR at a directory they share (and empty it on
+# deploy); each worker writes its totals there every METRICS_FLUSH_INTERVAL
+# seconds and metrics/ sums them.
+METRICS_DIR = os.environ.get('METRICS_DIR') or None
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 5))
+
+# Prefix suggestions (social_connect_app/suggest.py): every process keeps at
+# most SUGGEST_MAX_ENTRIES strings in memory and rebuilds them from the
+# database every SUGGEST_MAX_AGE seconds to pick up other processes' writes.
+SUGGEST_MAX_ENTRIES = int(os.environ.get('SUGGEST_MAX_ENTRIES', 100000))
+SUGGEST_MAX_AGE = float(os.environ.get('SUGGEST_MAX_AGE', 600))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {'class': 'logging.StreamHandler'},
+    },
+    'loggers': {
+        'social_connect.requests': {
+            'handlers': ['console'],
+            # Quiet under `manage.py test`; tests capture these with assertLogs().
+            'level': os.environ.get('REQUEST_LOG_LEVEL', 'ERROR' if 'test' in sys.argv[1:2] else 'INFO'),
+            'propagate': False,
+        },
+    },
+}
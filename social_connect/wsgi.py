@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'social_connect.settings')
 
 application = get_wsgi_application()
+
+# Build the in-memory suggestion index while the worker starts up.
+from social_connect_app import suggest  # noqa: E402
+
+suggest.warm()
@@ -1,7 +1,7 @@
 from django.contrib import admin
 
 # Register your models here.
-from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, SocialMedia
+from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, SocialMedia, UserStats, Category
 
 admin.site.register(SocialMedia)
 admin.site.register(Speeches)
@@ -9,4 +9,6 @@ admin.site.register(Wishes)
 admin.site.register(SeekersInstitutes)
 admin.site.register(WishStatus)
 admin.site.register(SpeechStatus)
+admin.site.register(UserStats)
+admin.site.register(Category)
 # admin.site.register(CompletionDetails)
\ No newline at end of file
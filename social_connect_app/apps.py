@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class SocialConnectAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'social_connect_app'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,192 @@
+# social_connect_app/async_views.py
+#
+# Async twins of the read-heavy views in views.py, built on the async ORM
+# (acount(), async for) and the async cache API. Responses are identical to
+# the sync views. urls.py routes to these when settings.ASYNC_VIEWS is on,
+# which asgi.py enables; under WSGI the sync views stay in place.
+
+from django.core.paginator import Paginator
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from django.db.models import Q
+from .models import Wishes, Speeches, SocialMedia
+from .pagination import acursor_page, InvalidCursor
+from .categories import aget_cached_categories
+from .object_cache import aget_payload, aget_payloads
+from .rendering import FastJsonResponse
+from .views import wish_queryset, speech_queryset, wish_to_dict, speech_to_dict, social_media_to_dict, export_options, export_response
+from . import export
+
+
+async def load_wishes(pks):
+    return {wish.pk: wish_to_dict(wish) async for wish in wish_queryset().filter(pk__in=pks)}
+
+
+async def load_speeches(pks):
+    return {speech.pk: speech_to_dict(speech) async for speech in speech_queryset().filter(pk__in=pks)}
+
+
+async def wish_page(items):
+    return await aget_payloads('wish', [item.pk for item in items], load_wishes)
+
+
+async def speech_page(items):
+    return await aget_payloads('speech', [item.pk for item in items], load_speeches)
+
+
+async def social_media_page(items):
+    return [social_media_to_dict(item) for item in items]
+
+
+async def paginate(queryset, per_page, page_number):
+    """Paginator.get_page() with the COUNT query run through the async ORM."""
+    paginator = Paginator(queryset, per_page)
+    paginator.count = await queryset.acount()
+    return paginator, paginator.get_page(page_number)
+
+
+async def cursor_response(request, queryset, render_page, descending=False):
+    try:
+        items, next_cursor = await acursor_page(queryset, request.GET.get('cursor'), 10, descending)
+    except InvalidCursor as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    return FastJsonResponse({
+        'success': True,
+        'data': {
+            'items': await render_page(items),
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }
+    })
+
+
+@require_GET
+async def list_wishes(request):
+    wishes = Wishes.objects.order_by('created_date', 'wish_id')
+    if 'cursor' in request.GET:
+        return await cursor_response(request, wishes.only('wish_id', 'created_date'), wish_page)
+
+    paginator, page_obj = await paginate(wishes.values_list('wish_id', flat=True), 10, request.GET.get('page', 1))
+
+    wishes_list = await aget_payloads('wish', [pk async for pk in page_obj.object_list], load_wishes)
+
+    return FastJsonResponse({
+        'success': True,
+        'data': {
+            'items': wishes_list,
+            'total_pages': paginator.num_pages ,
+            'count': paginator.count,
+            'has_next' : page_obj.has_next(),
+            'has_previous' : page_obj.has_previous()
+        }
+    })
+
+
+@require_GET
+async def list_speeches(request):
+    speeches = Speeches.objects.order_by('created_date', 'speech_id')
+    if 'cursor' in request.GET:
+        return await cursor_response(request, speeches.only('speech_id', 'created_date'), speech_page)
+
+    paginator, page_obj = await paginate(speeches.values_list('speech_id', flat=True), 10, request.GET.get('page', 1))
+
+    speeches_list = await aget_payloads('speech', [pk async for pk in page_obj.object_list], load_speeches)
+
+    return FastJsonResponse({
+        'success': True,
+        'data':  {
+            'items': speeches_list,
+            'total_pages': paginator.num_pages ,
+            'has_next' : page_obj.has_next(),
+            'count': paginator.count,
+            'has_previous' : page_obj.has_previous()
+        }
+    })
+
+
+@require_GET
+async def get_categories(request):
+    try:
+        entry = await aget_cached_categories()
+
+        # What @condition(etag_func=categories_etag) does for the sync view;
+        # its etag_func can't be awaited.
+        etag = quote_etag(entry['etag'])
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = FastJsonResponse({'success': True, 'data': {'categories': entry['categories'], 'counts': entry['counts']}}, status=200)
+        response.headers.setdefault('ETag', etag)
+        return response
+
+    except Exception as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+@require_GET
+async def get_wish_details(request, wishID):
+    try:
+        wish_details = await aget_payload('wish', wishID, load_wishes)
+        if wish_details is None:
+            raise Http404('No Wishes matches the given query.')
+        return FastJsonResponse({'success': True, 'data': wish_details}, status=200)
+
+    except Exception as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+@require_GET
+async def get_speech_details(request, speechID):
+    try:
+        speech_details = await aget_payload('speech', speechID, load_speeches)
+        if speech_details is None:
+            raise Http404('No Speeches matches the given query.')
+        return FastJsonResponse({'success': True, 'data': speech_details}, status=200)
+
+    except Exception as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+@csrf_exempt
+@require_GET
+async def event(request):
+    is_completed = request.GET.get('isCompleted', 'false').lower() == 'true'
+    page_number = request.GET.get('page', 1)
+    items_per_page = 10
+
+    social_media_entries = SocialMedia.objects.select_related('wish', 'speech').order_by('created_date', 'social_media_id')
+
+    if is_completed:
+        social_media_entries = social_media_entries.filter(
+            Q(wish__status='Completed') | Q(speech__status='Completed')
+        )
+
+    if 'cursor' in request.GET:
+        return await cursor_response(request, social_media_entries, social_media_page)
+
+    paginator, page_obj = await paginate(social_media_entries, items_per_page, page_number)
+
+    formatted_items = [social_media_to_dict(item) async for item in page_obj.object_list]
+
+    return FastJsonResponse({
+        'success': True,
+        'data': {
+            'items': formatted_items,
+            'total_pages': paginator.num_pages,
+            'count': paginator.count,
+            'has_next': page_obj.has_next(),
+            'has_previous': page_obj.has_previous()
+        }
+    }, safe=False)
+
+
+@require_GET
+async def export_view(request):
+    options = export_options(request)
+    if isinstance(options, HttpResponse):
+        return options
+    source, output, since = options
+    return export_response(export.astream(source, output, since), source, output)
@@ -0,0 +1,108 @@
+# social_connect_app/categories.py
+
+import hashlib
+import json
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, F, Min
+
+from .models import Category, Wishes, Speeches, category_key, category_slug
+
+
+CATEGORIES_CACHE_KEY = 'social_connect:categories'
+
+DEFAULT_CATEGORIES = [
+    "Education", "Personal", "Other", "Technology", "Finance", "Travel", "Environment",
+    "Hobbies", "Entrepreneurship", "Spirituality and Religion", "Entertainment",
+    "Literature", "Music", "Lifestyle"
+]
+
+
+def _load():
+    # Registry rows no item uses any more are left out; the defaults are
+    # always listed.
+    registry = {
+        category.key: category
+        for category in Category.objects.only('name', 'key', 'slug', 'wish_count', 'speech_count')
+        if category.wish_count or category.speech_count
+    }
+    for name in DEFAULT_CATEGORIES:
+        registry.setdefault(category_key(name), Category(name=name, key=category_key(name), slug=category_slug(name)))
+
+    rows = sorted(registry.values(), key=lambda category: category.name)
+    categories = [category.name for category in rows]
+    counts = [
+        {'name': category.name, 'key': category.key, 'slug': category.slug, 'wish_count': category.wish_count, 'speech_count': category.speech_count}
+        for category in rows
+    ]
+    etag = hashlib.md5(json.dumps(counts).encode()).hexdigest()
+    return {'categories': categories, 'counts': counts, 'etag': etag}
+
+
+def get_cached_categories():
+    """
+    {'categories': [...], 'counts': [...], 'etag': '...'}, served from the
+    cache. Writes delete the entry in their own process (or everywhere with
+    a shared cache); other processes rebuild it once CATEGORIES_CACHE_TIMEOUT
+    has passed.
+    """
+    entry = cache.get(CATEGORIES_CACHE_KEY)
+    if entry is None:
+        entry = _load()
+        cache.set(CATEGORIES_CACHE_KEY, entry, timeout=getattr(settings, 'CATEGORIES_CACHE_TIMEOUT', 60))
+    return entry
+
+
+async def aget_cached_categories():
+    entry = await cache.aget(CATEGORIES_CACHE_KEY)
+    if entry is None:
+        entry = await sync_to_async(get_cached_categories)()
+    return entry
+
+
+def invalidate_categories():
+    cache.delete(CATEGORIES_CACHE_KEY)
+
+
+def adjust_category_count(category, field, delta):
+    """
+    Adds `delta` to `field` ('wish_count' or 'speech_count') of the registry
+    entry for `category`, registering the category on first use.
+    """
+    key = category_key(category)
+    if not key or not delta:
+        return
+
+    Category.objects.bulk_create([Category(name=category.strip()[:255], key=key, slug=category_slug(category))], ignore_conflicts=True)
+    Category.objects.filter(key=key).update(**{field: F(field) + delta})
+    # After commit: a read before it would cache the old counts again.
+    transaction.on_commit(invalidate_categories)
+
+
+def recount_categories():
+    """
+    Rebuilds every registry count from Wishes/Speeches, for bulk loads that
+    bypass the save signals. Returns the number of categories in use.
+    """
+    names, counts = {}, {}
+    for model, field in ((Wishes, 'wish_count'), (Speeches, 'speech_count')):
+        rows = (
+            model.objects.exclude(category_key=None).values('category_key')
+            .annotate(name=Min('category'), count=Count('pk')).values_list('category_key', 'name', 'count')
+        )
+        for key, name, count in rows:
+            names.setdefault(key, name.strip()[:255])
+            counts.setdefault(key, {'wish_count': 0, 'speech_count': 0})[field] = count
+
+    with transaction.atomic():
+        Category.objects.bulk_create(
+            [Category(name=name, key=key, slug=category_slug(name)) for key, name in names.items()], ignore_conflicts=True,
+        )
+        Category.objects.exclude(key__in=counts).update(wish_count=0, speech_count=0)
+        for key, values in counts.items():
+            Category.objects.filter(key=key).update(**values)
+    transaction.on_commit(invalidate_categories)
+    return len(counts)
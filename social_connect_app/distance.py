@@ -0,0 +1,138 @@
+# social_connect_app/distance.py
+
+import heapq
+from itertools import chain
+from math import pi
+
+import numpy as np
+from django.db.models import Q
+
+from .geo import EARTH_RADIUS_KM, haversine, bounding_box, covering_cells
+
+
+# Largest possible great-circle distance; a search this wide covers everything.
+MAX_DISTANCE_KM = pi * EARTH_RADIUS_KM
+
+# Distances this close to the radius are re-checked with the scalar haversine()
+# so vectorized rounding can never flip a boundary row in or out.
+BOUNDARY_TOLERANCE = 1e-9
+
+
+def haversine_batch(latitude, longitude, latitudes, longitudes):
+    """Distances in km from one point to every (latitudes[i], longitudes[i])."""
+    lat1 = np.radians(latitude)
+    lat2 = np.radians(np.asarray(latitudes, dtype=np.float64))
+    dlat = lat2 - lat1
+    dlon = np.radians(np.asarray(longitudes, dtype=np.float64) - longitude)
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    np.clip(a, 0.0, 1.0, out=a)
+    return EARTH_RADIUS_KM * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def radius_mask(latitude, longitude, latitudes, longitudes, radius):
+    """
+    Returns (distances, mask) where mask[i] is True when point i lies within
+    `radius` km, agreeing exactly with haversine() <= radius.
+    """
+    latitudes = np.asarray(latitudes, dtype=np.float64)
+    longitudes = np.asarray(longitudes, dtype=np.float64)
+    distances = haversine_batch(latitude, longitude, latitudes, longitudes)
+    mask = distances <= radius
+
+    boundary = np.flatnonzero(np.abs(distances - radius) <= BOUNDARY_TOLERANCE * max(radius, 1.0))
+    for index in boundary:
+        try:
+            mask[index] = haversine(latitude, longitude, latitudes[index], longitudes[index]) <= radius
+        except ValueError:  # math domain error for near-antipodal points
+            pass
+
+    return distances, mask
+
+
+def prefilter(queryset, latitude, longitude, radius):
+    """
+    Narrows `queryset` in SQL to the rows that can be within `radius` km of the
+    given point: a latitude/longitude bounding box (served by the composite
+    lat/lon index) plus the covering geohash cells. Rows whose coordinates
+    lie outside the normal ranges, or that have no geohash yet (e.g. not
+    backfilled), are always kept so the exact check downstream sees every row
+    a full scan would accept.
+    """
+    queryset = queryset.filter(latitude__isnull=False, longitude__isnull=False)
+
+    cells = covering_cells(latitude, longitude, radius)
+    if cells is None:
+        return queryset
+
+    min_lat, max_lat, lon_ranges = bounding_box(latitude, longitude, radius)
+    in_box = Q(latitude__range=(min_lat, max_lat))
+    in_lon_range = Q(longitude__lt=-180) | Q(longitude__gt=180)
+    for min_lon, max_lon in lon_ranges:
+        in_lon_range |= Q(longitude__range=(min_lon, max_lon))
+    in_box &= in_lon_range
+
+    in_cells = Q(geohash__isnull=True)
+    for cell in cells:
+        in_cells |= Q(geohash__startswith=cell)
+
+    out_of_range = Q(latitude__lt=-90) | Q(latitude__gt=90)
+    return queryset.filter((in_box & in_cells) | out_of_range)
+
+
+def ids_within_radius(queryset, latitude, longitude, radius):
+    """
+    Primary keys of the rows of `queryset` within `radius` km of the given
+    point, in primary key order. Only (pk, latitude, longitude) tuples of the
+    prefiltered candidates are read.
+    """
+    if not radius >= 0:
+        return []
+
+    rows = prefilter(queryset, latitude, longitude, radius).order_by('pk').values_list('pk', 'latitude', 'longitude')
+    pks, latitudes, longitudes = rows_to_arrays(rows)
+    if not len(pks):
+        return []
+
+    _, mask = radius_mask(latitude, longitude, latitudes, longitudes, radius)
+    return pks[mask].tolist()
+
+
+def nearest_ids(queryset, latitude, longitude, k, initial_radius=1.0):
+    """
+    [(pk, distance_km), ...] for the `k` rows of `queryset` closest to the
+    given point, nearest first. The search radius starts at `initial_radius`
+    and doubles until it holds k rows, so the rows read depend on k and local
+    density rather than on the table size. A round that reads every located
+    row is the last one, and with k rows or fewer the first round reads them
+    all, so an empty table or a sparse region costs no repeated full reads.
+    """
+    total = queryset.filter(latitude__isnull=False, longitude__isnull=False).count()
+    if not total or k < 1:
+        return []
+
+    radius = initial_radius if k < total else MAX_DISTANCE_KM
+    while True:
+        rows = prefilter(queryset, latitude, longitude, radius).values_list('pk', 'latitude', 'longitude')
+        pks, latitudes, longitudes = rows_to_arrays(rows)
+        distances, mask = radius_mask(latitude, longitude, latitudes, longitudes, radius)
+
+        if len(pks) >= total:
+            # Every row has been read: the k nearest are among them, whatever the radius.
+            mask[:] = True
+            break
+        if mask.sum() >= k or radius >= MAX_DISTANCE_KM:
+            break
+        radius *= 2
+
+    # Everything within `radius` has been seen, so the k nearest are among the
+    # matches; keep them with a bounded heap.
+    nearest = heapq.nsmallest(k, zip(distances[mask].tolist(), pks[mask].tolist()))
+    return [(pk, distance) for distance, pk in nearest]
+
+
+def rows_to_arrays(rows):
+    """Splits (pk, latitude, longitude) tuples into three NumPy columns."""
+    rows = list(rows)
+    flat = np.fromiter(chain.from_iterable(rows), dtype=np.float64, count=3 * len(rows)).reshape(-1, 3)
+    return flat[:, 0].astype(np.int64), flat[:, 1], flat[:, 2]
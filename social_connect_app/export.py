@@ -0,0 +1,118 @@
+# social_connect_app/export.py
+#
+# Full dumps of wishes, speeches and fulfillments (social media posts) for
+# the export/ view, as NDJSON or CSV: every concrete column of every row, in
+# (created_date, pk) order, optionally from a `since` date on.
+#
+# Rows come from queryset.iterator() and are encoded CHUNK_SIZE at a time,
+# so memory does not grow with the table. One query reads the whole table;
+# on PostgreSQL it runs as a server-side cursor.
+
+import csv
+import datetime
+import io
+import json
+
+from asgiref.sync import sync_to_async
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .models import Wishes, Speeches, SocialMedia
+from .rendering import encode_json
+
+
+CHUNK_SIZE = 2000
+
+SOURCES = {
+    'wishes': Wishes,
+    'speeches': Speeches,
+    'fulfillments': SocialMedia,
+}
+
+_json_encoder = DjangoJSONEncoder()
+
+
+def columns(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def parse_since(value):
+    """Aware datetime for an ISO 8601 date or datetime; None when invalid."""
+    try:
+        since = parse_datetime(value)
+        if since is None:
+            date = parse_date(value)
+            since = datetime.datetime.combine(date, datetime.time()) if date else None
+    except ValueError:
+        return None
+    if since is not None and timezone.is_naive(since):
+        since = timezone.make_aware(since)
+    return since
+
+
+def rows(model, since=None):
+    queryset = model.objects.order_by('created_date', model._meta.pk.name)
+    if since is not None:
+        queryset = queryset.filter(created_date__gte=since)
+    return queryset.values_list(*columns(model))
+
+
+# Encoders: encoder(names) returns (header bytes, encode(rows) -> bytes).
+
+def ndjson_encoder(names):
+    def encode(chunk):
+        lines = (encode_json(dict(zip(names, row))) for row in chunk)
+        return b''.join((line if isinstance(line, bytes) else line.encode()) + b'\n' for line in lines)
+
+    return b'', encode
+
+
+def _csv_value(value):
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, cls=DjangoJSONEncoder)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return _json_encoder.default(value)
+    return value
+
+
+def csv_encoder(names):
+    def encode(chunk):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows([_csv_value(value) for value in row] for row in chunk)
+        return buffer.getvalue().encode()
+
+    return encode([names]), encode
+
+
+FORMATS = {
+    'ndjson': ('application/x-ndjson', ndjson_encoder),
+    'csv': ('text/csv', csv_encoder),
+}
+
+
+def stream(source, output, since=None, chunk_size=CHUNK_SIZE):
+    model = SOURCES[source]
+    header, encode = FORMATS[output][1](columns(model))
+    if header:
+        yield header
+    chunk = []
+    for row in rows(model, since).iterator(chunk_size=chunk_size):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield encode(chunk)
+            chunk = []
+    if chunk:
+        yield encode(chunk)
+
+
+async def astream(source, output, since=None, chunk_size=CHUNK_SIZE):
+    """
+    stream() for ASGI, which would otherwise read a synchronous iterator
+    whole before sending it. Chunks are pulled one at a time on the thread
+    that holds the database connection.
+    """
+    chunks = stream(source, output, since, chunk_size)
+    next_chunk = sync_to_async(next)
+    while (chunk := await next_chunk(chunks, None)) is not None:
+        yield chunk
@@ -0,0 +1,143 @@
+# social_connect_app/geo.py
+
+from math import radians, degrees, sin, cos, sqrt, atan2, asin, floor, isfinite
+
+
+EARTH_RADIUS_KM = 6371
+
+# Precision stored on Wishes/Speeches.geohash (~4.8m x 4.8m cells).
+GEOHASH_PRECISION = 9
+
+# Upper bound on the number of cells a radius query is expanded into.
+MAX_COVER_CELLS = 32
+
+# Degrees added around every bounding box so float rounding can never drop a
+# row that haversine() would have accepted.
+BBOX_MARGIN = 1e-6
+
+_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    R = EARTH_RADIUS_KM  # Radius of the Earth in km
+    dlat = radians(lat2 - lat1)
+    dlon = radians(lon2 - lon1)
+    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+    c = 2 * atan2(sqrt(a), sqrt(1 - a))
+    distance = R * c
+    return distance
+
+
+def normalize_longitude(lon):
+    return ((lon + 180) % 360) - 180
+
+
+def _bits(precision):
+    total = 5 * precision
+    return (total + 1) // 2, total // 2  # (longitude bits, latitude bits)
+
+
+def _cell_index(value, low, high, bits):
+    cells = 1 << bits
+    index = int(floor((value - low) / (high - low) * cells))
+    return min(max(index, 0), cells - 1)
+
+
+def _cell_to_geohash(lat_index, lon_index, lon_bits, lat_bits, precision):
+    code = 0
+    lon_left, lat_left = lon_bits, lat_bits
+    for position in range(5 * precision):
+        if position % 2 == 0:
+            lon_left -= 1
+            code = (code << 1) | ((lon_index >> lon_left) & 1)
+        else:
+            lat_left -= 1
+            code = (code << 1) | ((lat_index >> lat_left) & 1)
+
+    chars = []
+    for shift in range(5 * (precision - 1), -1, -5):
+        chars.append(_BASE32[(code >> shift) & 31])
+    return ''.join(chars)
+
+
+def encode_geohash(latitude, longitude, precision=GEOHASH_PRECISION):
+    lon_bits, lat_bits = _bits(precision)
+    lat_index = _cell_index(latitude, -90, 90, lat_bits)
+    lon_index = _cell_index(normalize_longitude(longitude), -180, 180, lon_bits)
+    return _cell_to_geohash(lat_index, lon_index, lon_bits, lat_bits, precision)
+
+
+def geohash_for(latitude, longitude):
+    """Geohash stored for a row, or None when the coordinates can't be indexed."""
+    try:
+        latitude, longitude = float(latitude), float(longitude)
+    except (TypeError, ValueError):
+        return None
+
+    if not (isfinite(latitude) and isfinite(longitude)) or not -90 <= latitude <= 90:
+        return None
+
+    return encode_geohash(latitude, longitude)
+
+
+def bounding_box(latitude, longitude, radius):
+    """
+    Returns (min_lat, max_lat, [(min_lon, max_lon), ...]) enclosing every point
+    within `radius` km of the given point. The longitude span is split in two
+    when it crosses the antimeridian and widened to the full circle when the
+    box reaches a pole.
+    """
+    delta = radius / EARTH_RADIUS_KM
+    min_lat = latitude - degrees(delta) - BBOX_MARGIN
+    max_lat = latitude + degrees(delta) + BBOX_MARGIN
+
+    if min_lat <= -90 or max_lat >= 90:
+        return max(min_lat, -90), min(max_lat, 90), [(-180, 180)]
+
+    delta_lon = degrees(asin(sin(delta) / cos(radians(latitude)))) + BBOX_MARGIN
+    if delta_lon >= 180:
+        return min_lat, max_lat, [(-180, 180)]
+
+    longitude = normalize_longitude(longitude)
+    min_lon, max_lon = longitude - delta_lon, longitude + delta_lon
+    if min_lon < -180:
+        return min_lat, max_lat, [(min_lon + 360, 180), (-180, max_lon)]
+    if max_lon > 180:
+        return min_lat, max_lat, [(min_lon, 180), (-180, max_lon - 360)]
+    return min_lat, max_lat, [(min_lon, max_lon)]
+
+
+def covering_cells(latitude, longitude, radius, max_cells=MAX_COVER_CELLS):
+    """
+    Geohash prefixes whose cells together contain the bounding box of the
+    radius query, using the finest precision that needs at most `max_cells`.
+    Returns None when the query can't be narrowed (invalid centre, or the
+    cover would be the whole planet).
+    """
+    if not (isfinite(latitude) and isfinite(longitude)) or not -90 <= latitude <= 90:
+        return None
+
+    min_lat, max_lat, lon_ranges = bounding_box(latitude, longitude, radius)
+
+    for precision in range(GEOHASH_PRECISION, 0, -1):
+        lon_bits, lat_bits = _bits(precision)
+        lat_span = range(_cell_index(min_lat, -90, 90, lat_bits), _cell_index(max_lat, -90, 90, lat_bits) + 1)
+        lon_spans = [
+            range(_cell_index(low, -180, 180, lon_bits), _cell_index(high, -180, 180, lon_bits) + 1)
+            for low, high in lon_ranges
+        ]
+        count = len(lat_span) * sum(len(span) for span in lon_spans)
+        if count > max_cells:
+            continue
+        if count == (1 << lat_bits) * (1 << lon_bits):
+            return None
+
+        return [
+            _cell_to_geohash(lat_index, lon_index, lon_bits, lat_bits, precision)
+            for lat_index in lat_span
+            for span in lon_spans
+            for lon_index in span
+        ]
+
+    return None
+
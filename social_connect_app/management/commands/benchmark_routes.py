@@ -0,0 +1,239 @@
+# social_connect_app/management/commands/benchmark_routes.py
+
+import contextlib
+import io
+import json
+import logging
+import subprocess
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import get_resolver, reverse
+
+from social_connect_app.models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, SocialMedia
+
+
+BENCH_PASSWORD = 'benchmark-password'
+
+
+def routes(ctx):
+    """
+    How to call every named route: name -> func(i) returning
+    (method, url, payload). Write routes get a different target on every
+    iteration so repeated calls keep exercising the same code path.
+    """
+    wish, speech, user = ctx['wish'], ctx['speech'], ctx['user']
+    location = {'latitude': wish.latitude, 'longitude': wish.longitude}
+
+    def nth(values, i):
+        return values[i % len(values)]
+
+    return {
+        'create_user': lambda i: ('post', reverse('create_user'), {'email': f'bench-user-{i}@example.com', 'first_name': 'Bench'}),
+        'create_wish': lambda i: ('post', reverse('create_wish'), {'wish_title': 'Bench', 'wish_description': 'Bench', 'user_id': user.pk, 'category': 'Education', **location}),
+        'create_speech': lambda i: ('post', reverse('create_speech'), {'speech_title': 'Bench', 'speech_description': 'Bench', 'user_id': user.pk, 'category': 'Education', **location}),
+        'bulk_create_wish': lambda i: ('post', reverse('bulk_create_wish'), [{'wish_title': 'Bench', 'wish_description': 'Bench', 'user_id': user.pk, **location}] * 50),
+        'bulk_create_speech': lambda i: ('post', reverse('bulk_create_speech'), [{'speech_title': 'Bench', 'speech_description': 'Bench', 'user_id': user.pk, **location}] * 50),
+        'pick_wish': lambda i: ('post', reverse('pick_wish'), {'wish_id': nth(ctx['open_wishes'], i), 'user_id': nth(ctx['pickers'], i)}),
+        'pick_speech': lambda i: ('post', reverse('pick_speech'), {'speech_id': nth(ctx['open_speeches'], i), 'user_id': nth(ctx['pickers'], i)}),
+        'bulk_pick': lambda i: ('post', reverse('bulk_pick'), {'user_id': nth(ctx['pickers'], i), 'wish_ids': ctx['open_wishes'][:20], 'speech_ids': ctx['open_speeches'][:20]}),
+        'list_wishes': lambda i: ('get', reverse('list_wishes'), {'page': i % 5 + 1}),
+        'list_speeches': lambda i: ('get', reverse('list_speeches'), {'page': i % 5 + 1}),
+        'wish_by_category': lambda i: ('get', reverse('wish_by_category', args=[wish.category or 'Education']), None),
+        'user_wishes': lambda i: ('get', reverse('user_wishes', args=[wish.created_by_id]), None),
+        'wishes_by_location': lambda i: ('get', reverse('wishes_by_location'), {**location, 'radius': 25}),
+        'check_user_exists': lambda i: ('get', reverse('check_user_exists'), {'email': user.email}),
+        'change_status': lambda i: ('post', reverse('change_status'), {'social_id': ctx['post'].pk, 'wish_id': ctx['post'].wish_id}),
+        'categories': lambda i: ('get', reverse('categories'), None),
+        'wish-details': lambda i: ('get', reverse('wish-details', args=[nth(ctx['wishes'], i)]), None),
+        'user-speeches': lambda i: ('get', reverse('user-speeches', args=[speech.created_by_id]), None),
+        'speech-details': lambda i: ('get', reverse('speech-details', args=[nth(ctx['speeches'], i)]), None),
+        'fulfill': lambda i: ('post', reverse('fulfill'), {'wish_id': wish.pk, 'user_id': user.pk, 'url': ['https://example.com'], 'platform': 'Bench'}),
+        'event': lambda i: ('get', reverse('event'), {'page': i % 3 + 1}),
+        'event_by_id': lambda i: ('get', reverse('event_by_id', args=['wish', ctx['post'].wish_id]), None),
+        'user_details': lambda i: ('get', reverse('user_details', args=[user.pk]), None),
+        'speeches_by_category': lambda i: ('get', reverse('speeches_by_category', args=[speech.category or 'Education']), None),
+        'speeches_by_location': lambda i: ('get', reverse('speeches_by_location'), {**location, 'radius': 25}),
+        'nearest': lambda i: ('get', reverse('nearest'), {**location, 'k': 20}),
+        'search': lambda i: ('get', reverse('search'), {'q': nth(wish.wish_title.split(), i)}),
+        'suggest': lambda i: ('get', reverse('suggest'), {'q': wish.wish_title[:i % 4 + 1]}),
+        'export': lambda i: ('get', reverse('export'), {'type': nth(['wishes', 'speeches', 'fulfillments'], i), 'format': nth(['ndjson', 'csv'], i)}),
+        'update_user': lambda i: ('post', reverse('update_user', args=[user.pk]), {'about': f'Benchmark {i}'}),
+        'get_fulfill_details': lambda i: ('post', reverse('get_fulfill_details'), {'wish_id': ctx['post'].wish_id}),
+        'get_social_media': lambda i: ('get', reverse('get_social_media', args=[ctx['post'].pk]), None),
+        'get-user-summary': lambda i: ('get', reverse('get-user-summary', args=[nth(ctx['pickers'], i)]), None),
+        'user_stats': lambda i: ('get', reverse('user_stats', args=[nth(ctx['pickers'], i)]), None),
+        'metrics': lambda i: ('get', reverse('metrics'), None),
+        'sign_up_user': lambda i: ('post', reverse('sign_up_user'), {'email': f'bench-signup-{i}@example.com', 'password': BENCH_PASSWORD, 'first_name': 'Bench', 'phone_no': '+919999999999'}),
+        'sign_in_user': lambda i: ('post', reverse('sign_in_user'), {'email': user.email, 'password': BENCH_PASSWORD}),
+        'sign_out': lambda i: ('post', reverse('sign_out'), None),
+    }
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+class Command(BaseCommand):
+    help = (
+        'Drives every named route of social_connect_app.urls against the configured database (or a running '
+        'server with --base-url) and reports p50/p95/p99 latency and queries per request. Write routes run '
+        'inside a transaction that is rolled back. Load data first with seed_data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=20, help='timed requests per route')
+        parser.add_argument('--warmup', type=int, default=2, help='untimed requests per route')
+        parser.add_argument('--routes', nargs='*', help='only these route names')
+        parser.add_argument('--base-url', help='time a running server over HTTP instead (read routes only, no query counts)')
+        parser.add_argument('--output', help='write the results as JSON to this file')
+        parser.add_argument('--baseline', help='results JSON of an earlier run to compare p95 against')
+
+    def handle(self, *args, **options):
+        # The per-request log lines would drown the report.
+        logging.getLogger('social_connect.requests').setLevel(logging.ERROR)
+
+        ctx = self.context()
+        specs = routes(ctx)
+        names = [pattern.name for pattern in get_resolver('social_connect_app.urls').url_patterns if pattern.name]
+        missing = [name for name in names if name not in specs]
+        if missing:
+            raise CommandError(f'No benchmark request defined for: {", ".join(missing)}')
+        if options['routes']:
+            names = [name for name in names if name in options['routes']]
+
+        results = {}
+        with transaction.atomic():
+            User.objects.create_user(username=ctx['user'].email, email=ctx['user'].email, password=BENCH_PASSWORD)
+            for name in names:
+                if options['base_url'] and specs[name](0)[0] != 'get':
+                    continue
+                results[name] = self.run_route(specs[name], options)
+                self.report(name, results[name])
+            transaction.set_rollback(True)
+
+        output = {
+            'commit': self.commit(),
+            'created': datetime.now(timezone.utc).isoformat(),
+            'database': connection.vendor if not options['base_url'] else options['base_url'],
+            'dataset': {
+                'users': SeekersInstitutes.objects.count(),
+                'wishes': Wishes.objects.count(),
+                'speeches': Speeches.objects.count(),
+                'social_media': SocialMedia.objects.count(),
+            },
+            'requests_per_route': options['requests'],
+            'routes': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as file:
+                json.dump(output, file, indent=2)
+            self.stdout.write(f'Wrote {options["output"]}')
+        if options['baseline']:
+            self.compare(options['baseline'], results)
+
+    def context(self):
+        wishes = list(Wishes.objects.order_by('pk').values_list('pk', flat=True)[:200])
+        speeches = list(Speeches.objects.order_by('pk').values_list('pk', flat=True)[:200])
+        post = SocialMedia.objects.filter(wish__isnull=False).order_by('pk').first()
+        if not wishes or not speeches or post is None:
+            raise CommandError('The database has no wishes, speeches or social media posts; run seed_data first.')
+
+        return {
+            'wish': Wishes.objects.get(pk=wishes[0]),
+            'speech': Speeches.objects.get(pk=speeches[0]),
+            'user': SeekersInstitutes.objects.order_by('pk').first(),
+            'post': post,
+            'wishes': wishes,
+            'speeches': speeches,
+            'open_wishes': list(WishStatus.objects.filter(status='Created').values_list('wish_id', flat=True)[:200]),
+            'open_speeches': list(SpeechStatus.objects.filter(status='Created').values_list('speech_id', flat=True)[:200]),
+            'pickers': list(SeekersInstitutes.objects.order_by('-pk').values_list('pk', flat=True)[:50]),
+        }
+
+    def run_route(self, spec, options):
+        client = Client(HTTP_HOST='localhost')
+        durations, queries, statuses = [], [], {}
+        for i in range(options['warmup'] + options['requests']):
+            method, url, payload = spec(i)
+            if options['base_url']:
+                duration, count, status = self.http_request(options['base_url'], url, payload)
+            else:
+                duration, count, status = self.client_request(client, method, url, payload)
+            if i < options['warmup']:
+                continue
+            durations.append(duration)
+            queries.append(count)
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+
+        durations.sort()
+        return {
+            'method': spec(0)[0].upper(),
+            'path': spec(0)[1],
+            'statuses': statuses,
+            'p50_ms': round(percentile(durations, 0.50) * 1000, 3),
+            'p95_ms': round(percentile(durations, 0.95) * 1000, 3),
+            'p99_ms': round(percentile(durations, 0.99) * 1000, 3),
+            'mean_ms': round(sum(durations) / len(durations) * 1000, 3),
+            'queries_per_request': None if options['base_url'] else round(sum(queries) / len(queries), 2),
+        }
+
+    def client_request(self, client, method, url, payload):
+        # Each request gets a savepoint, so a failing write can't poison the
+        # surrounding transaction; views print to stdout, which is discarded.
+        with transaction.atomic(), CaptureQueriesContext(connection) as context, contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            if method == 'get':
+                response = client.get(url, payload)
+            else:
+                response = client.post(url, json.dumps(payload), content_type='application/json')
+            if response.streaming:
+                b''.join(response.streaming_content)
+            duration = time.perf_counter() - start
+        return duration, len(context.captured_queries), response.status_code
+
+    def http_request(self, base_url, url, params):
+        if params:
+            url = f'{url}?{urllib.parse.urlencode(params)}'
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(base_url.rstrip('/') + url) as response:
+                response.read()
+                status = response.status
+        except urllib.error.HTTPError as e:
+            status = e.code
+        return time.perf_counter() - start, None, status
+
+    def report(self, name, result):
+        queries = '' if result['queries_per_request'] is None else f'{result["queries_per_request"]:7.1f} q'
+        self.stdout.write(
+            f'{name:24} {result["p50_ms"]:9.2f} {result["p95_ms"]:9.2f} {result["p99_ms"]:9.2f} ms  {queries}'
+            f'  {result["statuses"]}'
+        )
+
+    def commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR, capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def compare(self, path, results):
+        with open(path) as file:
+            baseline = json.load(file)
+        self.stdout.write(f'p95 vs {path} ({baseline.get("commit")}):')
+        for name, result in results.items():
+            before = baseline['routes'].get(name)
+            if before:
+                change = (result['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100 if before['p95_ms'] else 0
+                self.stdout.write(f'  {name:24} {before["p95_ms"]:9.2f} -> {result["p95_ms"]:9.2f} ms  ({change:+.0f}%)')
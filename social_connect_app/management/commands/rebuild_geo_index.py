@@ -0,0 +1,37 @@
+# social_connect_app/management/commands/rebuild_geo_index.py
+
+from django.core.management.base import BaseCommand
+from social_connect_app.geo import geohash_for
+from social_connect_app.models import Wishes, Speeches
+
+
+class Command(BaseCommand):
+    help = 'Recomputes the geohash column of every wish and speech from its latitude/longitude.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        for model in (Wishes, Speeches):
+            changed = []
+            updated = 0
+            rows = model.objects.only('pk', 'latitude', 'longitude', 'geohash').order_by('pk')
+
+            for row in rows.iterator(chunk_size=batch_size):
+                geohash = geohash_for(row.latitude, row.longitude)
+                if geohash != row.geohash:
+                    row.geohash = geohash
+                    changed.append(row)
+
+                if len(changed) >= batch_size:
+                    model.objects.bulk_update(changed, ['geohash'])
+                    updated += len(changed)
+                    changed = []
+
+            if changed:
+                model.objects.bulk_update(changed, ['geohash'])
+                updated += len(changed)
+
+            self.stdout.write(f'{model.__name__}: {updated} rows updated')
@@ -0,0 +1,12 @@
+# social_connect_app/management/commands/recompute_user_stats.py
+
+from django.core.management.base import BaseCommand
+from social_connect_app.stats import recompute_all
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the per-user wish/speech counters from scratch, repairing any drift.'
+
+    def handle(self, *args, **options):
+        count = recompute_all()
+        self.stdout.write(f'Recomputed stats for {count} users')
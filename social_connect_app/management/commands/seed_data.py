@@ -0,0 +1,162 @@
+# social_connect_app/management/commands/seed_data.py
+
+import random
+from datetime import datetime, timedelta, timezone
+from math import cos, radians
+
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from faker import Faker
+
+from social_connect_app.categories import DEFAULT_CATEGORIES, recount_categories
+from social_connect_app.models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, SocialMedia
+from social_connect_app.stats import recompute_all
+
+
+# Cluster centres for the generated coordinates (name, latitude, longitude).
+CITIES = [
+    ('Pune', 18.5204, 73.8567),
+    ('Mumbai', 19.0760, 72.8777),
+    ('Delhi', 28.7041, 77.1025),
+    ('Bengaluru', 12.9716, 77.5946),
+    ('Hyderabad', 17.3850, 78.4867),
+    ('Chennai', 13.0827, 80.2707),
+    ('Kolkata', 22.5726, 88.3639),
+    ('Jaipur', 26.9124, 75.7873),
+]
+
+PLATFORMS = ['Instagram', 'YouTube', 'LinkedIn', 'X', 'Facebook']
+
+# Share of items in each status; picked items get 1-3 pickers.
+STATUS_WEIGHTS = {'Created': 0.5, 'In-Progress': 0.3, 'Completed': 0.2}
+
+# Every generated row is dated within this window, so datasets are identical across runs.
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+SPAN_DAYS = 365
+
+BATCH_SIZE = 1000
+
+
+class Command(BaseCommand):
+    help = (
+        'Generates a deterministic synthetic dataset (users, wishes, speeches, picks and social media posts '
+        'with clustered coordinates) for load testing. The same --seed always produces the same data.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--wishes', type=int, default=2000)
+        parser.add_argument('--speeches', type=int, default=1000)
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--spread-km', type=float, default=15, help='standard deviation of a cluster')
+        parser.add_argument('--flush', action='store_true', help='delete existing users and items first')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        fake = Faker('en_IN')
+        fake.seed_instance(options['seed'])
+        self.rng, self.fake, self.spread = rng, fake, options['spread_km']
+
+        with transaction.atomic():
+            if options['flush']:
+                SeekersInstitutes.objects.all().delete()
+            users = self.create_users(options['users'])
+            wishes = self.create_items(Wishes, WishStatus, 'wish', options['wishes'], users)
+            speeches = self.create_items(Speeches, SpeechStatus, 'speech', options['speeches'], users)
+
+        recompute_all()
+        recount_categories()
+        cache.clear()
+        self.stdout.write(f'Created {len(users)} users, {wishes} wishes and {speeches} speeches (seed {options["seed"]})')
+
+    def point(self):
+        name, latitude, longitude = self.rng.choice(CITIES)
+        latitude += self.rng.gauss(0, self.spread) / 111.32
+        longitude += self.rng.gauss(0, self.spread) / (111.32 * cos(radians(latitude)))
+        return name, round(latitude, 6), round(longitude, 6)
+
+    def date(self):
+        return EPOCH + timedelta(seconds=self.rng.randrange(SPAN_DAYS * 86400))
+
+    def create_users(self, count):
+        # Continue numbering after earlier runs so emails stay unique without --flush.
+        offset = SeekersInstitutes.objects.count()
+        users, dates = [], []
+        for index in range(offset, offset + count):
+            is_institute = self.rng.random() < 0.1
+            location, latitude, longitude = self.point()
+            users.append(SeekersInstitutes(
+                email=f'user{index}@{self.fake.free_email_domain()}',
+                first_name=self.fake.company() if is_institute else self.fake.first_name(),
+                family_name=None if is_institute else self.fake.last_name(),
+                phone_no=f'+91{self.rng.randrange(7000000000, 9999999999)}',
+                is_institute=is_institute,
+                institute_reg_number=f'REG-{index:06d}' if is_institute else None,
+                institute_details=self.fake.catch_phrase() if is_institute else None,
+                about=self.fake.sentence(),
+                location=location,
+                latitude=latitude,
+                longitude=longitude,
+                picture=f'https://picsum.photos/seed/{index}/200',
+            ))
+            dates.append(self.date())
+
+        users = SeekersInstitutes.objects.bulk_create(users, batch_size=BATCH_SIZE)
+        # auto_now_add ignores explicit values on insert; dates are applied afterwards.
+        for user, created_date in zip(users, dates):
+            user.created_date = created_date
+        SeekersInstitutes.objects.bulk_update(users, ['created_date'], batch_size=BATCH_SIZE)
+        return users
+
+    def create_items(self, model, status_model, item_type, count, users):
+        items, dates = [], []
+        categories = DEFAULT_CATEGORIES + [None]
+        for _ in range(count):
+            location, latitude, longitude = self.point()
+            item = model(**{
+                f'{item_type}_title': self.fake.sentence(nb_words=6)[:255],
+                f'{item_type}_description': self.fake.paragraph(nb_sentences=4),
+            }, created_by=self.rng.choice(users), category=self.rng.choice(categories),
+                location=location, latitude=latitude, longitude=longitude)
+            if item_type == 'speech':
+                item.platform_url = f'https://example.com/{self.fake.slug()}'
+            item.set_derived_fields()
+            items.append(item)
+            dates.append(self.date())
+
+        items = model.objects.bulk_create(items, batch_size=BATCH_SIZE)
+        for item, created_date in zip(items, dates):
+            item.created_date = created_date
+
+        statuses = [
+            status_model(**{item_type: item}, status=self.rng.choices(list(STATUS_WEIGHTS), list(STATUS_WEIGHTS.values()))[0])
+            for item in items
+        ]
+        statuses = status_model.objects.bulk_create(statuses, batch_size=BATCH_SIZE)
+
+        picks, posts = [], []
+        through = status_model.picked_by.through
+        for status in statuses:
+            item = getattr(status, item_type)
+            item.status = status.status
+            if status.status == 'Created':
+                continue
+            candidates = [user for user in self.rng.sample(users, min(4, len(users))) if user.pk != item.created_by_id]
+            pickers = candidates[:self.rng.randint(1, 3)]
+            picks += [through(**{f'{status_model._meta.model_name}_id': status.pk}, seekersinstitutes_id=user.pk) for user in pickers]
+            item.pick_count, item.is_picked = len(pickers), bool(pickers)
+            if status.status == 'Completed' and pickers:
+                posts.append(SocialMedia(**{item_type: item}, user=pickers[0], url=[self.fake.url()],
+                                         description=self.fake.sentence(), platform=self.rng.choice(PLATFORMS)))
+        through.objects.bulk_create(picks, batch_size=BATCH_SIZE)
+        model.objects.bulk_update(items, ['created_date', 'status', 'pick_count', 'is_picked'], batch_size=BATCH_SIZE)
+
+        posts = SocialMedia.objects.bulk_create(posts, batch_size=BATCH_SIZE)
+        fulfilled = []
+        for post in posts:
+            item = getattr(post, item_type)
+            item.selected_fulfillment = post
+            fulfilled.append(item)
+        model.objects.bulk_update(fulfilled, ['selected_fulfillment'], batch_size=BATCH_SIZE)
+        return len(items)
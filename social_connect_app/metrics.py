@@ -0,0 +1,193 @@
+# social_connect_app/metrics.py
+#
+# Request count, latency and DB query histograms per (URL name, status),
+# and the object cache's hits and misses, rendered in the Prometheus text
+# format by the metrics/ view.
+#
+# Recording is lock-free: every thread adds to its own shard and only the
+# thread that owns a shard writes to it. With settings.METRICS_DIR set, each
+# process periodically writes its totals to METRICS_DIR/metrics-<pid>.json
+# (atomically) and a scrape sums every file, so any gunicorn worker can
+# answer for all of them. Empty the directory when deploying.
+
+import glob
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+
+from django.conf import settings
+
+from . import object_cache
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+# Series layout: [count, latency_sum, queries_sum, *latency_buckets, *query_buckets]
+# with one extra (+Inf) bucket per histogram; buckets are not cumulative here.
+_LATENCY = 3
+_QUERIES = _LATENCY + len(LATENCY_BUCKETS) + 1
+_SIZE = _QUERIES + len(QUERY_BUCKETS) + 1
+
+_local = threading.local()
+_shards = []  # (thread, shard)
+_retired = {}  # totals of shards whose threads have exited
+_registry_lock = threading.Lock()
+_flush_lock = threading.Lock()
+_last_flush = 0.0
+
+
+def _shard():
+    shard = getattr(_local, 'shard', None)
+    if shard is None:
+        shard = _local.shard = {}
+        with _registry_lock:
+            _shards.append((threading.current_thread(), shard))
+    return shard
+
+
+def observe(view, status, duration, queries):
+    key = (view or 'unmatched', str(status))
+    shard = _shard()
+    series = shard.get(key)
+    if series is None:
+        series = shard[key] = [0] * _SIZE
+    series[0] += 1
+    series[1] += duration
+    series[2] += queries
+    series[_LATENCY + bisect_left(LATENCY_BUCKETS, duration)] += 1
+    series[_QUERIES + bisect_left(QUERY_BUCKETS, queries)] += 1
+
+    if _directory() and time.monotonic() - _last_flush > getattr(settings, 'METRICS_FLUSH_INTERVAL', 5):
+        flush()
+
+
+def _add(totals, key, series):
+    current = totals.get(key)
+    if current is None:
+        totals[key] = list(series)
+    else:
+        for index, value in enumerate(series):
+            current[index] += value
+
+
+def collect():
+    """{(view, status): series} for this process."""
+    with _registry_lock:
+        for thread, shard in [entry for entry in _shards if not entry[0].is_alive()]:
+            _shards.remove((thread, shard))
+            for key, series in shard.items():
+                _add(_retired, key, series)
+        totals = {key: list(series) for key, series in _retired.items()}
+        shards = [shard for _, shard in _shards]
+
+    for shard in shards:
+        for key, series in list(shard.items()):
+            _add(totals, key, series)
+    return totals
+
+
+def _directory():
+    return getattr(settings, 'METRICS_DIR', None)
+
+
+def flush():
+    """Writes this process's totals to its file in METRICS_DIR."""
+    global _last_flush
+    directory = _directory()
+    if not directory or not _flush_lock.acquire(blocking=False):
+        return
+    try:
+        _last_flush = time.monotonic()
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f'metrics-{os.getpid()}.json')
+        entry = {
+            'requests': [[view, status, series] for (view, status), series in collect().items()],
+            'object_cache': object_cache.counters(),
+        }
+        with open(f'{path}.tmp', 'w') as file:
+            json.dump(entry, file)
+        os.replace(f'{path}.tmp', path)
+    finally:
+        _flush_lock.release()
+
+
+def collect_all():
+    """
+    (request totals, object cache counters) of every process sharing
+    METRICS_DIR, or of this process alone.
+    """
+    directory = _directory()
+    if not directory:
+        return collect(), object_cache.counters()
+
+    flush()
+    totals, cache_counters = {}, {'hits': 0, 'misses': 0}
+    for path in glob.glob(os.path.join(directory, 'metrics-*.json')):
+        try:
+            with open(path) as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            continue
+        for view, status, series in entry.get('requests', []):
+            if len(series) == _SIZE:
+                _add(totals, (view, status), series)
+        for name, count in entry.get('object_cache', {}).items():
+            if name in cache_counters:
+                cache_counters[name] += count
+    return totals, cache_counters
+
+
+def _escape(value):
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _histogram(lines, name, description, totals, offset, bounds, sum_index):
+    lines += [f'# HELP {name} {description}', f'# TYPE {name} histogram']
+    for (view, status), series in sorted(totals.items()):
+        labels = f'view="{_escape(view)}",status="{status}"'
+        cumulative = 0
+        for index, bound in enumerate((*bounds, '+Inf')):
+            cumulative += series[offset + index]
+            lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_sum{{{labels}}} {_number(series[sum_index])}')
+        lines.append(f'{name}_count{{{labels}}} {series[0]}')
+
+
+def render():
+    totals, cache_counters = collect_all()
+    lines = [
+        '# HELP social_connect_requests_total Requests served, by URL name and status code.',
+        '# TYPE social_connect_requests_total counter',
+    ]
+    for (view, status), series in sorted(totals.items()):
+        lines.append(f'social_connect_requests_total{{view="{_escape(view)}",status="{status}"}} {series[0]}')
+
+    _histogram(lines, 'social_connect_request_duration_seconds', 'Request wall time in seconds.',
+               totals, _LATENCY, LATENCY_BUCKETS, 1)
+    _histogram(lines, 'social_connect_request_db_queries', 'Database queries per request.',
+               totals, _QUERIES, QUERY_BUCKETS, 2)
+
+    lines += [
+        '# HELP social_connect_object_cache_enabled Whether the per-object response cache is on.',
+        '# TYPE social_connect_object_cache_enabled gauge',
+        f'social_connect_object_cache_enabled {int(object_cache.enabled())}',
+        '# HELP social_connect_object_cache_lookups_total Per-object response cache lookups, by result.',
+        '# TYPE social_connect_object_cache_lookups_total counter',
+        f'social_connect_object_cache_lookups_total{{result="hit"}} {cache_counters["hits"]}',
+        f'social_connect_object_cache_lookups_total{{result="miss"}} {cache_counters["misses"]}',
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def reset():
+    with _registry_lock:
+        _retired.clear()
+        for _, shard in _shards:
+            shard.clear()
@@ -0,0 +1,188 @@
+# social_connect_app/middleware.py
+
+import json
+import logging
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from .metrics import observe
+
+
+logger = logging.getLogger('social_connect.requests')
+
+# Metrics of the request being served in this context. A ContextVar rather
+# than a thread-local: async views run their queries in sync_to_async threads,
+# which inherit the request's context.
+_current = ContextVar('request_metrics', default=None)
+
+# Recent samples kept per view for the rolling aggregates.
+WINDOW = 500
+
+_lock = threading.Lock()
+_windows = {}
+_totals = {}
+
+_IN_LIST = re.compile(r'\((?:%s, )+%s\)')
+_LITERAL = re.compile(r"\b\d+\b|'(?:[^']|'')*'")
+
+
+def sql_shape(sql):
+    """SQL with literals and IN-list lengths erased, so repeats of one query group together."""
+    return _LITERAL.sub('?', _IN_LIST.sub('(...)', sql))
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.db_time += time.perf_counter() - start
+            self.shapes[sql_shape(sql)] += 1
+
+    def repeated(self, threshold):
+        return [{'sql': shape, 'count': count} for shape, count in self.shapes.most_common() if count > threshold]
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def install_query_recorder(connection):
+    """Called for every new connection (see signals.py)."""
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+def _aggregate(view, duration, metrics, flagged):
+    with _lock:
+        window = _windows.get(view)
+        if window is None:
+            window = _windows[view] = deque(maxlen=WINDOW)
+            _totals[view] = {'requests': 0, 'n_plus_one': 0}
+        window.append((duration, metrics.queries, metrics.db_time))
+        _totals[view]['requests'] += 1
+        _totals[view]['n_plus_one'] += flagged
+
+
+def _percentile(values, fraction):
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def snapshot():
+    """
+    Per-view aggregates since process start ('requests', 'n_plus_one') and
+    over the last WINDOW requests (latency percentiles, mean queries and DB
+    time), all times in milliseconds.
+    """
+    with _lock:
+        windows = {view: list(window) for view, window in _windows.items()}
+        totals = {view: dict(total) for view, total in _totals.items()}
+
+    result = {}
+    for view, samples in windows.items():
+        durations = sorted(sample[0] for sample in samples)
+        result[view] = {
+            **totals[view],
+            'window': len(samples),
+            'p50_ms': round(_percentile(durations, 0.5) * 1000, 3),
+            'p95_ms': round(_percentile(durations, 0.95) * 1000, 3),
+            'max_ms': round(durations[-1] * 1000, 3),
+            'mean_queries': round(sum(sample[1] for sample in samples) / len(samples), 2),
+            'mean_db_ms': round(sum(sample[2] for sample in samples) / len(samples) * 1000, 3),
+        }
+    return result
+
+
+def reset():
+    with _lock:
+        _windows.clear()
+        _totals.clear()
+
+
+class RequestMetricsMiddleware:
+    """
+    Records per request the view name, wall time, DB query count and time,
+    and response size, and logs them as one JSON line on the
+    'social_connect.requests' logger. A query shape repeated more than
+    settings.QUERY_REPEAT_THRESHOLD times is reported as a likely N+1 and the
+    line is logged as a warning. Works for sync and async views. The same
+    measurements feed the Prometheus histograms of metrics.py.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', True):
+            return self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, time.perf_counter() - start, metrics)
+        return response
+
+    async def __acall__(self, request):
+        if not getattr(settings, 'REQUEST_METRICS_ENABLED', True):
+            return await self.get_response(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.finish(request, response, time.perf_counter() - start, metrics)
+        return response
+
+    def finish(self, request, response, duration, metrics):
+        match = getattr(request, 'resolver_match', None)
+        view = (match.view_name or match._func_path) if match else None
+        repeated = metrics.repeated(getattr(settings, 'QUERY_REPEAT_THRESHOLD', 5))
+
+        _aggregate(view, duration, metrics, bool(repeated))
+        observe(match.url_name if match else None, response.status_code, duration, metrics.queries)
+
+        record = {
+            'view': view,
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round(duration * 1000, 3),
+            'db_queries': metrics.queries,
+            'db_time_ms': round(metrics.db_time * 1000, 3),
+            'response_bytes': None if response.streaming else len(response.content),
+        }
+        if repeated:
+            record['repeated_queries'] = repeated
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
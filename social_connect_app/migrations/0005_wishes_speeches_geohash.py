@@ -0,0 +1,26 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social_connect_app", "0004_speeches_selected_fulfillment_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="speeches",
+            name="geohash",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=12, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="wishes",
+            name="geohash",
+            field=models.CharField(
+                blank=True, db_index=True, editable=False, max_length=12, null=True
+            ),
+        ),
+    ]
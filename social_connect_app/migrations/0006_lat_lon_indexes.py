@@ -0,0 +1,24 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social_connect_app", "0005_wishes_speeches_geohash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="speeches",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="speeches_lat_lon_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wishes",
+            index=models.Index(
+                fields=["latitude", "longitude"], name="wishes_lat_lon_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:06
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_user_stats(apps, schema_editor):
+    SeekersInstitutes = apps.get_model("social_connect_app", "SeekersInstitutes")
+    UserStats = apps.get_model("social_connect_app", "UserStats")
+    stats = {
+        user_id: UserStats(user_id=user_id)
+        for user_id in SeekersInstitutes.objects.values_list("pk", flat=True)
+    }
+
+    for kind, model_name, status_model_name in (
+        ("wishes", "Wishes", "WishStatus"),
+        ("speeches", "Speeches", "SpeechStatus"),
+    ):
+        model = apps.get_model("social_connect_app", model_name)
+        status_model = apps.get_model("social_connect_app", status_model_name)
+        counters = [
+            (f"{kind}_created", model.objects.values("created_by").annotate(count=Count("pk"))
+             .values_list("created_by", "count")),
+        ]
+        for status, counter in (("In-Progress", "pending"), ("Completed", "fulfilled")):
+            counters.append((
+                f"{kind}_{counter}",
+                status_model.objects.filter(status=status, picked_by__isnull=False)
+                .values("picked_by").annotate(count=Count("pk")).values_list("picked_by", "count"),
+            ))
+        for field, rows in counters:
+            for user_id, count in rows:
+                setattr(stats[user_id], field, count)
+
+    UserStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social_connect_app", "0006_lat_lon_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserStats",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="stats",
+                        serialize=False,
+                        to="social_connect_app.seekersinstitutes",
+                    ),
+                ),
+                ("wishes_created", models.IntegerField(default=0)),
+                ("wishes_pending", models.IntegerField(default=0)),
+                ("wishes_fulfilled", models.IntegerField(default=0)),
+                ("speeches_created", models.IntegerField(default=0)),
+                ("speeches_pending", models.IntegerField(default=0)),
+                ("speeches_fulfilled", models.IntegerField(default=0)),
+                ("updated_date", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_user_stats, migrations.RunPython.noop),
+    ]
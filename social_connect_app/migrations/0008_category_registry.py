@@ -0,0 +1,74 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:08
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def category_key(category):
+    if not category or not category.strip():
+        return None
+    return " ".join(category.casefold().split())[:255]
+
+
+def category_slug(category):
+    if not category or not category.strip():
+        return None
+    return slugify(category, allow_unicode=True) or category_key(category)
+
+
+def backfill_categories(apps, schema_editor):
+    Category = apps.get_model("social_connect_app", "Category")
+    registry = {}
+
+    for model_name, count_field in (("Wishes", "wish_count"), ("Speeches", "speech_count")):
+        model = apps.get_model("social_connect_app", model_name)
+        changed = []
+        for item in model.objects.only("pk", "category", "category_key").order_by("pk").iterator(chunk_size=1000):
+            item.category_key = category_key(item.category)
+            if item.category_key is None:
+                continue
+            changed.append(item)
+            entry = registry.setdefault(
+                item.category_key,
+                Category(name=item.category.strip()[:255], key=item.category_key, slug=category_slug(item.category)),
+            )
+            setattr(entry, count_field, getattr(entry, count_field) + 1)
+        model.objects.bulk_update(changed, ["category_key"], batch_size=1000)
+
+    Category.objects.bulk_create(registry.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social_connect_app", "0007_userstats"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Category",
+            fields=[
+                ("category_id", models.AutoField(primary_key=True, serialize=False)),
+                ("name", models.CharField(max_length=255)),
+                ("key", models.CharField(max_length=255, unique=True)),
+                ("slug", models.SlugField(allow_unicode=True, max_length=255)),
+                ("wish_count", models.IntegerField(default=0)),
+                ("speech_count", models.IntegerField(default=0)),
+                ("created_date", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="speeches",
+            name="category_key",
+            field=models.CharField(
+                blank=True, editable=False, max_length=255, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="wishes",
+            name="category_key",
+            field=models.CharField(
+                blank=True, editable=False, max_length=255, null=True
+            ),
+        ),
+        migrations.RunPython(backfill_categories, migrations.RunPython.noop),
+    ]
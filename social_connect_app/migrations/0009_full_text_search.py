@@ -0,0 +1,94 @@
+# Full-text search index over wish and speech titles and descriptions; see
+# social_connect_app/search.py. Only PostgreSQL and SQLite are supported.
+
+from django.db import migrations
+
+
+TABLES = (
+    ("social_connect_app_wishes", "wish_id", "wish_title", "wish_description", 0),
+    ("social_connect_app_speeches", "speech_id", "speech_title", "speech_description", 1),
+)
+
+FTS_TABLE = "social_connect_app_search"
+
+
+def postgres_forward():
+    statements = []
+    for table, _, title, description, _ in TABLES:
+        statements += [
+            f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('english', coalesce({title}, '')), 'A') || "
+            f"setweight(to_tsvector('english', coalesce({description}, '')), 'B')) STORED",
+            f"CREATE INDEX {table}_search_idx ON {table} USING gin (search_vector)",
+        ]
+    return statements
+
+
+def postgres_backward():
+    return [f"ALTER TABLE {table} DROP COLUMN search_vector" for table, *_ in TABLES]
+
+
+def sqlite_triggers():
+    # SQLite drops a table's triggers whenever Django rebuilds the table to
+    # alter it; search.create_sqlite_triggers() re-creates them after migrate.
+    statements = []
+    for table, pk, title, description, tag in TABLES:
+        rowid = f"2 * {{row}}.{pk} + {tag}"
+        insert = (
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description) "
+            f"VALUES ({rowid.format(row='NEW')}, NEW.{title}, NEW.{description});"
+        )
+        delete = f"DELETE FROM {FTS_TABLE} WHERE rowid = {rowid.format(row='OLD')};"
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE OF {title}, {description} ON {table} "
+            f"BEGIN {delete} {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN {delete} END",
+        ]
+    return statements
+
+
+def sqlite_forward():
+    statements = [
+        f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(title, description, tokenize='porter unicode61')",
+    ]
+    for table, pk, title, description, tag in TABLES:
+        statements.append(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description) "
+            f"SELECT 2 * {pk} + {tag}, {title}, {description} FROM {table}"
+        )
+    return statements + sqlite_triggers()
+
+
+def sqlite_backward():
+    statements = [f"DROP TABLE {FTS_TABLE}"]
+    for table, *_ in TABLES:
+        statements += [f"DROP TRIGGER IF EXISTS {table}_search_{event}" for event in ("insert", "update", "delete")]
+    return statements
+
+
+STATEMENTS = {
+    "postgresql": (postgres_forward, postgres_backward),
+    "sqlite": (sqlite_forward, sqlite_backward),
+}
+
+
+def run(direction):
+    def apply(apps, schema_editor):
+        vendor = schema_editor.connection.vendor
+        if vendor not in STATEMENTS:
+            return
+        for statement in STATEMENTS[vendor][direction]():
+            schema_editor.execute(statement, params=None)
+
+    return apply
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("social_connect_app", "0008_category_registry"),
+    ]
+
+    operations = [
+        migrations.RunPython(run(0), run(1)),
+    ]
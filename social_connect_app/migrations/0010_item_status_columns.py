@@ -0,0 +1,85 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:38
+
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_item_status(apps, schema_editor):
+    # Items without a status row keep no status, as the API showed before.
+    for model_name, status_model_name, item_field in (
+        ("Wishes", "WishStatus", "wish"),
+        ("Speeches", "SpeechStatus", "speech"),
+    ):
+        model = apps.get_model("social_connect_app", model_name)
+        status_model = apps.get_model("social_connect_app", status_model_name)
+        through = status_model.picked_by.through
+        status_column = status_model.picked_by.field.m2m_field_name()
+
+        statuses = status_model.objects.filter(**{item_field: OuterRef("pk")})
+        pickers = (
+            through.objects.filter(**{f"{status_column}__{item_field}": OuterRef("pk")})
+            .values(f"{status_column}__{item_field}")
+            .annotate(count=Count("*"))
+            .values("count")
+        )
+        model.objects.update(
+            status=Subquery(statuses.values("status")[:1]),
+            pick_count=Coalesce(Subquery(pickers, output_field=IntegerField()), Value(0)),
+        )
+        model.objects.update(is_picked=models.Q(pick_count__gt=0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social_connect_app", "0009_full_text_search"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="speeches",
+            name="pick_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="speeches",
+            name="status",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="Created",
+                editable=False,
+                max_length=50,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="wishes",
+            name="pick_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="wishes",
+            name="status",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="Created",
+                editable=False,
+                max_length=50,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="speeches",
+            name="is_picked",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="wishes",
+            name="is_picked",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(backfill_item_status, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.0.1 on 2026-10-18 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("social_connect_app", "0010_item_status_columns"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="socialmedia",
+            index=models.Index(
+                fields=["created_date", "social_media_id"],
+                name="socialmedia_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speeches",
+            index=models.Index(
+                fields=["created_date", "speech_id"], name="speeches_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speeches",
+            index=models.Index(
+                fields=["category_key", "created_date", "speech_id"],
+                name="speeches_category_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="speeches",
+            index=models.Index(
+                fields=["created_by", "created_date", "speech_id"],
+                name="speeches_creator_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wishes",
+            index=models.Index(
+                fields=["created_date", "wish_id"], name="wishes_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wishes",
+            index=models.Index(
+                fields=["category_key", "created_date", "wish_id"],
+                name="wishes_category_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="wishes",
+            index=models.Index(
+                fields=["created_by", "created_date", "wish_id"],
+                name="wishes_creator_created_idx",
+            ),
+        ),
+    ]
@@ -3,6 +3,49 @@
 from django.db import models
 from django.core.validators import RegexValidator
 from django.db.models import JSONField
+from django.utils.text import slugify
+from .geo import geohash_for
+
+
+def category_key(category):
+    """
+    Canonical key of a free-text category: casefolded, with runs of
+    whitespace collapsed, so 'C++', 'C#' and 'C' stay apart. None for an
+    empty category.
+    """
+    if not category or not category.strip():
+        return None
+    return ' '.join(category.casefold().split())[:255]
+
+
+def category_slug(category):
+    """URL-friendly display form of a category; not unique, use category_key() to match."""
+    if not category or not category.strip():
+        return None
+    return slugify(category, allow_unicode=True) or category_key(category)
+
+
+# Copies of the status row and the picker count, written only with update()
+# by picks.py and the status signals, inside the transaction that changes
+# the row they copy.
+ITEM_STATUS_COLUMNS = ('status', 'pick_count', 'is_picked')
+
+
+def item_update_fields(item, update_fields):
+    """
+    update_fields for saving a wish or speech: the derived columns always,
+    and a full save of a loaded row leaves the status columns alone, so an
+    instance read before a concurrent pick cannot write its old count back.
+    """
+    if update_fields is not None:
+        return {*update_fields, 'geohash', 'category_key'}
+    if item._state.adding:
+        return None
+    deferred = item.get_deferred_fields()
+    return [
+        field.name for field in item._meta.concrete_fields
+        if not field.primary_key and field.name not in ITEM_STATUS_COLUMNS and field.attname not in deferred
+    ]
 
 class SeekersInstitutes(models.Model):
     user_id = models.AutoField(primary_key=True)
@@ -47,7 +90,7 @@ class Wishes(models.Model):
     wish_title = models.CharField(max_length=255)
     wish_description = models.TextField()
     created_by = models.ForeignKey(SeekersInstitutes, related_name='wishes_created', on_delete=models.CASCADE)
-    is_picked = models.BooleanField(default=False)
+    is_picked = models.BooleanField(default=False, editable=False)
     is_verified = models.BooleanField(default=False)
     category = models.CharField(max_length=255, blank=True, null=True)
     location = models.CharField(max_length=255, blank=True, null=True)
@@ -55,7 +98,29 @@ class Wishes(models.Model):
     longitude = models.FloatField(null=True, blank=True)
     created_date = models.DateTimeField(auto_now_add=True)
     selected_fulfillment = models.ForeignKey('SocialMedia', null=True, blank=True, on_delete=models.SET_NULL, related_name='fulfilled_wish')
+    status = models.CharField(max_length=50, blank=True, null=True, default='Created', db_index=True, editable=False)
+    pick_count = models.PositiveIntegerField(default=0, editable=False)
+    geohash = models.CharField(max_length=12, blank=True, null=True, db_index=True, editable=False)
+    category_key = models.CharField(max_length=255, blank=True, null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['latitude', 'longitude'], name='wishes_lat_lon_idx'),
+            # Listings: all items, by category, by creator; oldest or newest first.
+            models.Index(fields=['created_date', 'wish_id'], name='wishes_created_idx'),
+            models.Index(fields=['category_key', 'created_date', 'wish_id'], name='wishes_category_created_idx'),
+            models.Index(fields=['created_by', 'created_date', 'wish_id'], name='wishes_creator_created_idx'),
+        ]
+
+    def set_derived_fields(self):
+        """Fills the editable=False columns; bulk_create() callers must call this themselves."""
+        self.geohash = geohash_for(self.latitude, self.longitude)
+        self.category_key = category_key(self.category)
 
+    def save(self, *args, **kwargs):
+        self.set_derived_fields()
+        kwargs['update_fields'] = item_update_fields(self, kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.wish_title
@@ -65,7 +130,7 @@ class Speeches(models.Model):
     speech_title = models.CharField(max_length=255)
     speech_description = models.TextField()
     created_by = models.ForeignKey(SeekersInstitutes, related_name='speeches_created', on_delete=models.CASCADE)
-    is_picked = models.BooleanField(default=False)
+    is_picked = models.BooleanField(default=False, editable=False)
     is_verified = models.BooleanField(default=False)
     category = models.CharField(max_length=255, blank=True, null=True)
     location = models.CharField(max_length=255, blank=True, null=True)
@@ -74,7 +139,29 @@ class Speeches(models.Model):
     created_date = models.DateTimeField(auto_now_add=True)
     platform_url = models.URLField(blank=True, null=True)
     selected_fulfillment = models.ForeignKey('SocialMedia', null=True, blank=True, on_delete=models.SET_NULL, related_name='fulfilled_speech')
+    status = models.CharField(max_length=50, blank=True, null=True, default='Created', db_index=True, editable=False)
+    pick_count = models.PositiveIntegerField(default=0, editable=False)
+    geohash = models.CharField(max_length=12, blank=True, null=True, db_index=True, editable=False)
+    category_key = models.CharField(max_length=255, blank=True, null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['latitude', 'longitude'], name='speeches_lat_lon_idx'),
+            # Listings: all items, by category, by creator; oldest or newest first.
+            models.Index(fields=['created_date', 'speech_id'], name='speeches_created_idx'),
+            models.Index(fields=['category_key', 'created_date', 'speech_id'], name='speeches_category_created_idx'),
+            models.Index(fields=['created_by', 'created_date', 'speech_id'], name='speeches_creator_created_idx'),
+        ]
+
+    def set_derived_fields(self):
+        """Fills the editable=False columns; bulk_create() callers must call this themselves."""
+        self.geohash = geohash_for(self.latitude, self.longitude)
+        self.category_key = category_key(self.category)
 
+    def save(self, *args, **kwargs):
+        self.set_derived_fields()
+        kwargs['update_fields'] = item_update_fields(self, kwargs.get('update_fields'))
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return self.speech_title
@@ -84,6 +171,19 @@ class Speeches(models.Model):
 
 
 
+class Category(models.Model):
+    category_id = models.AutoField(primary_key=True)
+    name = models.CharField(max_length=255)
+    key = models.CharField(max_length=255, unique=True)
+    slug = models.SlugField(max_length=255, allow_unicode=True)
+    wish_count = models.IntegerField(default=0)
+    speech_count = models.IntegerField(default=0)
+    created_date = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.name
+
+
 class WishStatus(models.Model):
     wish = models.OneToOneField(Wishes, on_delete=models.CASCADE, related_name='wish_status')
     status = models.CharField(max_length=50, default='Created')
@@ -112,5 +212,24 @@ class SocialMedia(models.Model):
     description = models.TextField(null=True, blank=True)
     platform = models.TextField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_date', 'social_media_id'], name='socialmedia_created_idx'),
+        ]
+
+    def __str__(self):
+        return f"SocialMedia-{self.social_media_id}"
+
+
+class UserStats(models.Model):
+    user = models.OneToOneField(SeekersInstitutes, on_delete=models.CASCADE, primary_key=True, related_name='stats')
+    wishes_created = models.IntegerField(default=0)
+    wishes_pending = models.IntegerField(default=0)
+    wishes_fulfilled = models.IntegerField(default=0)
+    speeches_created = models.IntegerField(default=0)
+    speeches_pending = models.IntegerField(default=0)
+    speeches_fulfilled = models.IntegerField(default=0)
+    updated_date = models.DateTimeField(auto_now=True)
+
     def __str__(self):
-        return f"SocialMedia-{self.social_media_id}"
\ No newline at end of file
+        return f"Stats for user {self.user_id}"
@@ -0,0 +1,166 @@
+# social_connect_app/object_cache.py
+
+import threading
+import uuid
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+
+_lock = threading.Lock()
+_counters = {'hits': 0, 'misses': 0}
+
+
+def _cache():
+    return caches[getattr(settings, 'OBJECT_CACHE_ALIAS', 'default')]
+
+
+def _timeout():
+    return getattr(settings, 'OBJECT_CACHE_TIMEOUT', 3600)
+
+
+def enabled():
+    """
+    Off on a LocMemCache unless OBJECT_CACHE_ALLOW_LOCMEM: each process has
+    its own, so a write would leave the other workers serving stale payloads.
+    """
+    if not getattr(settings, 'OBJECT_CACHE_ENABLED', True):
+        return False
+    return getattr(settings, 'OBJECT_CACHE_ALLOW_LOCMEM', False) or not isinstance(_cache(), LocMemCache)
+
+
+def _version_key(kind, pk):
+    return f'objcache:{kind}:{pk}:version'
+
+
+def _data_key(kind, pk, version):
+    return f'objcache:{kind}:{pk}:{version}'
+
+
+def _count(hits, misses):
+    with _lock:
+        _counters['hits'] += hits
+        _counters['misses'] += misses
+
+
+def counters():
+    """Hit/miss totals of this process since start (or the last reset)."""
+    with _lock:
+        return dict(_counters)
+
+
+def reset_counters():
+    with _lock:
+        _counters.update(hits=0, misses=0)
+
+
+def _resolve_versions(version_keys, found):
+    versions, new_versions = {}, {}
+    for pk, key in version_keys.items():
+        if key in found:
+            versions[pk] = found[key]
+        else:
+            versions[pk] = new_versions[key] = uuid.uuid4().hex
+    return versions, new_versions
+
+
+def _split_hits(pks, data_keys, found):
+    payloads = {pk: found[key] for pk, key in data_keys.items() if key in found}
+    missing = [pk for pk in pks if pk not in payloads]
+    _count(len(payloads), len(missing))
+    return payloads, missing
+
+
+def _ordered(pks, payloads):
+    return [payloads[pk] for pk in pks if pk in payloads]
+
+
+def get_payloads(kind, pks, loader):
+    """
+    Serialized payloads for `pks` (in the same order, skipping pks the loader
+    doesn't return). Cached payloads are fetched with two get_many() calls;
+    only the misses are passed to loader(missing_pks) -> {pk: payload} and
+    then cached under the object's current version.
+
+    Versions are random tokens rather than counters, so a version key that
+    was evicted can never make an older payload current again.
+    """
+    pks = list(pks)
+    if not pks:
+        return []
+    if not enabled():
+        return _ordered(pks, loader(pks))
+
+    cache = _cache()
+    version_keys = {pk: _version_key(kind, pk) for pk in pks}
+    versions, new_versions = _resolve_versions(version_keys, cache.get_many(version_keys.values()))
+    if new_versions:
+        cache.set_many(new_versions, timeout=None)
+
+    data_keys = {pk: _data_key(kind, pk, versions[pk]) for pk in pks}
+    payloads, missing = _split_hits(pks, data_keys, cache.get_many(data_keys.values()))
+    if missing:
+        loaded = loader(missing)
+        cache.set_many({data_keys[pk]: payload for pk, payload in loaded.items() if pk in data_keys}, timeout=_timeout())
+        payloads.update(loaded)
+
+    return _ordered(pks, payloads)
+
+
+def get_payload(kind, pk, loader):
+    payloads = get_payloads(kind, [pk], loader)
+    return payloads[0] if payloads else None
+
+
+async def aget_payloads(kind, pks, loader):
+    """get_payloads() for async views; `loader` is a coroutine function."""
+    pks = list(pks)
+    if not pks:
+        return []
+    if not enabled():
+        return _ordered(pks, await loader(pks))
+
+    cache = _cache()
+    version_keys = {pk: _version_key(kind, pk) for pk in pks}
+    versions, new_versions = _resolve_versions(version_keys, await cache.aget_many(version_keys.values()))
+    if new_versions:
+        await cache.aset_many(new_versions, timeout=None)
+
+    data_keys = {pk: _data_key(kind, pk, versions[pk]) for pk in pks}
+    payloads, missing = _split_hits(pks, data_keys, await cache.aget_many(data_keys.values()))
+    if missing:
+        loaded = await loader(missing)
+        await cache.aset_many({data_keys[pk]: payload for pk, payload in loaded.items() if pk in data_keys}, timeout=_timeout())
+        payloads.update(loaded)
+
+    return _ordered(pks, payloads)
+
+
+async def aget_payload(kind, pk, loader):
+    payloads = await aget_payloads(kind, [pk], loader)
+    return payloads[0] if payloads else None
+
+
+def invalidate(kind, pks):
+    """Bumps the version of each object so its cached payload is never read again."""
+    if not enabled():
+        return
+    pks = [pk for pk in pks if pk is not None]
+    if pks:
+        _cache().set_many({_version_key(kind, pk): uuid.uuid4().hex for pk in pks}, timeout=None)
+
+
+def invalidate_on_commit(kind, pks):
+    """
+    invalidate() once the current transaction commits (at once outside of
+    one). Bumping earlier would let a reader cache the old row again under
+    the new version. `pks` is read now.
+    """
+    if not enabled():
+        return
+    pks = [pk for pk in pks if pk is not None]
+    if pks:
+        transaction.on_commit(partial(invalidate, kind, pks))
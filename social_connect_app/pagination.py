@@ -0,0 +1,76 @@
+# social_connect_app/pagination.py
+
+import base64
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_token(values):
+    """Opaque URL-safe token for a list of JSON values."""
+    payload = json.dumps(values, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_token(token):
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        raise InvalidCursor('Invalid cursor')
+
+
+def encode_cursor(created_date, pk):
+    return encode_token([created_date.isoformat(), pk])
+
+
+def decode_cursor(token):
+    try:
+        created_date, pk = decode_token(token)
+        return datetime.fromisoformat(created_date), int(pk)
+    except (ValueError, TypeError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def _cursor_queryset(queryset, cursor, descending):
+    if descending:
+        queryset = queryset.order_by('-created_date', '-pk')
+    else:
+        queryset = queryset.order_by('created_date', 'pk')
+
+    if cursor:
+        created_date, pk = decode_cursor(cursor)
+        if descending:
+            queryset = queryset.filter(Q(created_date__lt=created_date) | Q(created_date=created_date, pk__lt=pk))
+        else:
+            queryset = queryset.filter(Q(created_date__gt=created_date) | Q(created_date=created_date, pk__gt=pk))
+    return queryset
+
+
+def _cursor_result(items, page_size):
+    if len(items) <= page_size:
+        return items, None
+
+    items = items[:page_size]
+    return items, encode_cursor(items[-1].created_date, items[-1].pk)
+
+
+def cursor_page(queryset, cursor=None, page_size=10, descending=False):
+    """
+    One page of `queryset` ordered by (created_date, pk), starting after the
+    row encoded in `cursor` (an empty cursor starts from the beginning).
+    Returns (items, next_cursor); next_cursor is None on the last page.
+    """
+    queryset = _cursor_queryset(queryset, cursor, descending)
+    return _cursor_result(list(queryset[:page_size + 1]), page_size)
+
+
+async def acursor_page(queryset, cursor=None, page_size=10, descending=False):
+    """cursor_page() for async views."""
+    queryset = _cursor_queryset(queryset, cursor, descending)
+    return _cursor_result([item async for item in queryset[:page_size + 1]], page_size)
@@ -0,0 +1,174 @@
+# social_connect_app/picks.py
+#
+# Picking wishes and speeches. The status row is locked with SELECT ... FOR
+# UPDATE, so concurrent picks of one item take turns on the status change
+# and the picker counters. The picker itself is added with one
+# INSERT ... SELECT ... ON CONFLICT DO NOTHING: the through table's unique
+# (status, user) constraint rejects a second pick by the same user, and the
+# SELECT skips unknown users, so nothing is read back before the write.
+# The item's status and pick_count columns (models.ITEM_STATUS_COLUMNS) are
+# updated in the same transaction.
+
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import F
+
+from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus
+from .object_cache import invalidate_on_commit
+from .stats import record_pick, record_status_change, record_status_changes
+
+
+PICKED_STATUS = 'In-Progress'
+
+KINDS = {
+    WishStatus: (Wishes, 'wish', 'wishes'),
+    SpeechStatus: (Speeches, 'speech', 'speeches'),
+}
+
+
+def _insert_picker_sql(status_model):
+    field = status_model.picked_by.field
+    through = field.remote_field.through
+    quote = connection.ops.quote_name
+    user_pk = SeekersInstitutes._meta.pk.column
+    return (
+        f'INSERT INTO {quote(through._meta.db_table)} ({quote(field.m2m_column_name())}, {quote(field.m2m_reverse_name())}) '
+        f'SELECT %s, {quote(user_pk)} FROM {quote(SeekersInstitutes._meta.db_table)} WHERE {quote(user_pk)} = %s '
+        f'ON CONFLICT DO NOTHING'
+    )
+
+
+def _count_picks(item_model, item_ids):
+    """One more picker on each item; the caller has inserted the through rows."""
+    item_model.objects.filter(pk__in=item_ids).update(
+        status=PICKED_STATUS, pick_count=F('pick_count') + 1, is_picked=True,
+    )
+
+
+def lock_status(status_model, item_id):
+    """
+    The item's status row (pk, item and status loaded), locked with SELECT
+    ... FOR UPDATE until the surrounding transaction ends; created when
+    missing. Raises Wishes/Speeches.DoesNotExist.
+    """
+    item_model, item_field, _ = KINDS[status_model]
+    locked = status_model.objects.select_for_update().filter(**{f'{item_field}_id': item_id}).only('pk', item_field, 'status')
+    item_status = locked.first()
+    if item_status is None:
+        if not item_model.objects.filter(pk=item_id).exists():
+            raise item_model.DoesNotExist
+        status_model.objects.get_or_create(**{f'{item_field}_id': item_id})
+        # A concurrent first pick may have created the row and moved it on
+        # since; lock it and read it again like an existing one.
+        item_status = locked.first()
+    return item_status
+
+
+def pick(status_model, item_id, user_id):
+    """
+    Adds `user_id` to the pickers of the wish or speech `item_id` and moves
+    it to In-Progress. Returns False when the user had already picked it.
+    Raises Wishes/Speeches.DoesNotExist or SeekersInstitutes.DoesNotExist.
+    """
+    item_model, item_field, kind = KINDS[status_model]
+    user_id = int(user_id)
+
+    with transaction.atomic():
+        item_status = lock_status(status_model, item_id)
+        status_pk, old_status = item_status.pk, item_status.status
+
+        with connection.cursor() as cursor:
+            cursor.execute(_insert_picker_sql(status_model), [status_pk, user_id])
+            inserted = cursor.rowcount == 1
+        if not inserted:
+            if not SeekersInstitutes.objects.filter(pk=user_id).exists():
+                raise SeekersInstitutes.DoesNotExist
+            return False
+
+        _count_picks(item_model, [item_id])
+        if old_status != PICKED_STATUS:
+            status_model.objects.filter(pk=status_pk).update(status=PICKED_STATUS)
+            # Only then do the earlier pickers move to another counter.
+            other_pickers = status_model.picked_by.through.objects.filter(
+                **{status_model.picked_by.field.m2m_field_name(): status_pk}
+            ).exclude(**{status_model.picked_by.field.m2m_reverse_field_name(): user_id})
+            record_status_change(
+                kind, other_pickers.values_list(status_model.picked_by.field.m2m_reverse_name(), flat=True),
+                old_status, PICKED_STATUS,
+            )
+        record_pick(kind, user_id, PICKED_STATUS)
+
+    # The raw insert and the update()s send no signals.
+    invalidate_on_commit(item_field, [int(item_id)])
+    return True
+
+
+def pick_many(user_id, items):
+    """
+    Picks many items for one user: items is {status_model: [item_id, ...]}.
+    Returns {status_model: {item_id: outcome}} with outcomes 'picked',
+    'already_picked' and 'not_found'. The number of queries depends on the
+    item types, not on how many items there are.
+    Raises SeekersInstitutes.DoesNotExist.
+    """
+    user_id = int(user_id)
+    if not SeekersInstitutes.objects.filter(pk=user_id).exists():
+        raise SeekersInstitutes.DoesNotExist
+
+    outcomes = {}
+    with transaction.atomic():
+        for status_model, item_ids in items.items():
+            if item_ids:
+                outcomes[status_model] = _pick_items(status_model, user_id, list(dict.fromkeys(item_ids)))
+
+    for status_model, results in outcomes.items():
+        picked = [item_id for item_id, outcome in results.items() if outcome == 'picked']
+        invalidate_on_commit(KINDS[status_model][1], picked)
+    return outcomes
+
+
+def _pick_items(status_model, user_id, item_ids):
+    item_model, item_field, kind = KINDS[status_model]
+    field = status_model.picked_by.field
+    through = field.remote_field.through
+    status_column, user_column = field.m2m_column_name(), field.m2m_reverse_name()
+
+    def lock_statuses(ids):
+        # Always in pk order, so overlapping bulk picks cannot deadlock.
+        return {
+            item_id: (pk, status)
+            for item_id, pk, status in status_model.objects.select_for_update()
+            .filter(**{f'{item_field}_id__in': ids}).order_by('pk').values_list(f'{item_field}_id', 'pk', 'status')
+        }
+
+    statuses = lock_statuses(item_ids)
+    missing = [item_id for item_id in item_ids if item_id not in statuses]
+    if missing:
+        existing = item_model.objects.filter(pk__in=missing).values_list('pk', flat=True)
+        status_model.objects.bulk_create([status_model(**{f'{item_field}_id': item_id}) for item_id in existing], ignore_conflicts=True)
+        statuses.update(lock_statuses(missing))
+
+    status_pks = [pk for pk, _ in statuses.values()]
+    already = set(through.objects.filter(**{f'{status_column}__in': status_pks, user_column: user_id}).values_list(status_column, flat=True))
+    to_pick = {item_id: statuses[item_id] for item_id in item_ids if item_id in statuses and statuses[item_id][0] not in already}
+
+    if to_pick:
+        through.objects.bulk_create([through(**{status_column: pk, user_column: user_id}) for pk, _ in to_pick.values()])
+        _count_picks(item_model, list(to_pick))
+
+        changed = {pk: status for pk, status in to_pick.values() if status != PICKED_STATUS}
+        if changed:
+            status_model.objects.filter(pk__in=changed).update(status=PICKED_STATUS)
+            pickers = defaultdict(list)
+            for status_pk, picker_id in through.objects.filter(**{f'{status_column}__in': changed}).exclude(
+                **{user_column: user_id}
+            ).values_list(status_column, user_column):
+                pickers[status_pk].append(picker_id)
+            record_status_changes(kind, [(pickers[pk], status, PICKED_STATUS) for pk, status in changed.items()])
+        record_pick(kind, user_id, PICKED_STATUS, len(to_pick))
+
+    return {
+        item_id: 'picked' if item_id in to_pick else 'already_picked' if item_id in statuses else 'not_found'
+        for item_id in item_ids
+    }
@@ -0,0 +1,287 @@
+# social_connect_app/rendering.py
+
+from functools import partial
+from operator import attrgetter, itemgetter
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def format_date(value):
+    return value.strftime(DATE_FORMAT)
+
+
+# ---------------------------------------------------------------------------
+# Field plans
+# ---------------------------------------------------------------------------
+
+class Attr:
+    """Value at an attribute path ('created_by.picture'), optionally transformed."""
+
+    def __init__(self, path, transform=None):
+        self.path = path
+        self.transform = transform
+
+
+class Nested:
+    """Dict built by another plan from the related object at `path`."""
+
+    def __init__(self, path, plan):
+        self.path = path
+        self.plan = plan
+
+
+class Computed:
+    """Arbitrary func(instance); only available when rendering model instances."""
+
+    def __init__(self, func):
+        self.func = func
+
+
+class Const:
+    def __init__(self, value):
+        self.value = value
+
+
+class Plan:
+    """
+    A precomputed recipe for one response dict: an ordered list of
+    (key, spec) pairs, where spec is an attribute name or one of Attr, Nested,
+    Computed, Const. The specs are resolved once into (key, getter, converter)
+    triples, so rendering is one loop of plain calls with no per-field dispatch.
+
+    render(instance) works on model instances; render_row(row) works on the
+    dicts of queryset.values(*plan.columns()) without building instances.
+    """
+
+    def __init__(self, *fields):
+        self.fields = [(key, Attr(spec) if isinstance(spec, str) else spec) for key, spec in fields]
+        self.render = _renderer(self._steps(row=False))
+        self._render_row = None
+
+    def columns(self, prefix=''):
+        columns = []
+        for _, spec in self.fields:
+            if isinstance(spec, Attr):
+                columns.append(prefix + spec.path.replace('.', '__'))
+            elif isinstance(spec, Nested):
+                columns += spec.plan.columns(prefix + spec.path.replace('.', '__') + '__')
+            elif isinstance(spec, Computed):
+                raise ValueError('Plans with computed fields cannot render values() rows')
+        return columns
+
+    def render_row(self, row):
+        if self._render_row is None:
+            self._render_row = _renderer(self._steps(row=True))
+        return self._render_row(row)
+
+    def _steps(self, row, prefix=''):
+        steps = []
+        for key, spec in self.fields:
+            if isinstance(spec, Attr):
+                if row:
+                    getter = itemgetter(prefix + spec.path.replace('.', '__'))
+                else:
+                    getter = attrgetter(spec.path)
+                steps.append((key, getter, spec.transform))
+            elif isinstance(spec, Nested):
+                if row:
+                    # The nested dict reads its columns from the same row.
+                    nested = _renderer(spec.plan._steps(row, prefix + spec.path.replace('.', '__') + '__'))
+                    steps.append((key, nested, None))
+                elif '.' in spec.path:
+                    steps.append((key, attrgetter(spec.path), spec.plan.render))
+                else:
+                    # One descriptor lookup for the related object, not one per field.
+                    steps.append((key, partial(_related_to, spec.path), spec.plan.render))
+            elif isinstance(spec, Computed):
+                if row:
+                    raise ValueError('Plans with computed fields cannot render values() rows')
+                steps.append((key, spec.func, None))
+            else:
+                steps.append((key, partial(_const, spec.value), None))
+        return steps
+
+
+def _renderer(steps):
+    steps = tuple(steps)
+
+    def render(obj):
+        data = {}
+        for key, getter, converter in steps:
+            value = getter(obj)
+            data[key] = value if converter is None else converter(value)
+        return data
+
+    return render
+
+
+def _related_to(name, instance):
+    return related(instance, name)
+
+
+def _const(value, obj):
+    return value
+
+
+def related(instance, name):
+    """
+    Related object `name` of `instance` (None when a reverse one-to-one row is
+    missing), read from the select_related cache when it was loaded that way.
+    """
+    try:
+        return instance._state.fields_cache[name]
+    except KeyError:
+        return getattr(instance, name, None)
+
+
+def prefetched(instance, name):
+    """Related objects of `name`, straight from the prefetch cache when present."""
+    cache = getattr(instance, '_prefetched_objects_cache', None)
+    if cache and name in cache:
+        return cache[name]
+    return getattr(instance, name).all()
+
+
+# ---------------------------------------------------------------------------
+# Plans for the API's models
+# ---------------------------------------------------------------------------
+
+USER_PLAN = Plan(
+    ('user_id', 'user_id'),
+    ('email', 'email'),
+    ('picture', 'picture'),
+    ('first_name', 'first_name'),
+    ('last_name', 'family_name'),
+)
+
+USER_BACKEND_PLAN = Plan(
+    ('user_id', 'user_id'),
+    ('email', 'email'),
+    ('is_mail_verified', 'is_mail_verified'),
+    ('first_name', 'first_name'),
+    ('phone_no', 'phone_no'),
+    ('is_institute', 'is_institute'),
+    ('institute_reg_number', 'institute_reg_number'),
+    ('given_name', 'given_name'),
+    ('address', 'address'),
+    ('location', 'location'),
+    ('about', 'about'),
+    ('institute_details', 'institute_details'),
+    ('family_name', 'family_name'),
+    ('link', 'link'),
+    ('picture', 'picture'),
+    ('locale', 'locale'),
+    ('had', Const(None)),  # This field is not in the original model, adjust as needed
+    ('latitude', 'latitude'),
+    ('longitude', 'longitude'),
+)
+
+
+def _item_plan(item_type, *extra):
+    status_name = f'{item_type}_status'
+    render_user = USER_PLAN.render
+
+    def picked_by(item):
+        item_status = related(item, status_name)
+        if item_status is None:
+            return []
+        return [render_user(user) for user in prefetched(item_status, 'picked_by')]
+
+    return Plan(
+        (f'{item_type}_id', f'{item_type}_id'),
+        (f'{item_type}_title', f'{item_type}_title'),
+        (f'{item_type}_description', f'{item_type}_description'),
+        ('created_by', Nested('created_by', USER_PLAN)),
+        ('picked_by', Computed(picked_by)),
+        ('is_picked', 'is_picked'),
+        ('pick_count', 'pick_count'),
+        ('status', 'status'),
+        ('is_verified', 'is_verified'),
+        ('category', 'category'),
+        ('location', 'location'),
+        ('latitude', 'latitude'),
+        ('longitude', 'longitude'),
+        *extra,
+        ('created_date', Attr('created_date', format_date)),
+    )
+
+
+WISH_PLAN = _item_plan('wish')
+
+SPEECH_PLAN = _item_plan('speech', ('platform_url', 'platform_url'))
+
+
+def _summary_plan(item_type):
+    return Plan(
+        (f'{item_type}_id', f'{item_type}_id'),
+        (f'{item_type}_title', f'{item_type}_title'),
+        (f'{item_type}_description', f'{item_type}_description'),
+        ('created_by', Nested('created_by', Plan(('picture', 'picture'), ('first_name', 'first_name')))),
+        ('status', 'status'),
+        ('category', 'category'),
+        ('created_date', Attr('created_date', format_date)),
+    )
+
+
+# get_user_summary items; rendered from values() rows.
+WISH_SUMMARY_PLAN = _summary_plan('wish')
+
+SPEECH_SUMMARY_PLAN = _summary_plan('speech')
+
+
+SOCIAL_MEDIA_PLAN = Plan(
+    ('social_media_id', 'social_media_id'),
+    ('user_id', 'user_id'),
+    ('url', 'url'),
+    ('created_date', 'created_date'),
+    ('description', 'description'),
+    ('platform', 'platform'),
+    ('wish', Computed(lambda item: {'wish_title': item.wish.wish_title if item.wish else None})),
+    ('speech', Computed(lambda item: {'speech_title': item.speech.speech_title if item.speech else None})),
+)
+
+
+# ---------------------------------------------------------------------------
+# Encoding
+# ---------------------------------------------------------------------------
+
+_stdlib_encoder = DjangoJSONEncoder()
+
+
+def _orjson_default(value):
+    return _stdlib_encoder.default(value)
+
+
+def encode_json(data):
+    """
+    Serializes `data` exactly like JsonResponse does (same bytes). With
+    settings.JSON_RENDERER = 'orjson' and orjson installed, the faster
+    compact encoder is used instead; values are identical but the output has
+    no whitespace and non-ASCII text is not escaped.
+    """
+    if orjson is not None and getattr(settings, 'JSON_RENDERER', 'json') == 'orjson':
+        return orjson.dumps(data, default=_orjson_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return _stdlib_encoder.encode(data)
+
+
+class FastJsonResponse(HttpResponse):
+    """Drop-in replacement for JsonResponse that encodes through encode_json()."""
+
+    def __init__(self, data, safe=True, **kwargs):
+        if safe and not isinstance(data, dict):
+            raise TypeError(
+                'In order to allow non-dict objects to be serialized set the '
+                'safe parameter to False.'
+            )
+        kwargs.setdefault('content_type', 'application/json')
+        super().__init__(content=encode_json(data), **kwargs)
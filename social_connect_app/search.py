@@ -0,0 +1,151 @@
+# social_connect_app/search.py
+#
+# Ranked full-text search over wish and speech titles and descriptions.
+#
+# The index is kept by the database itself (migration 0009), so rows written
+# by save(), bulk_create() and update() are all searchable at once:
+#   - PostgreSQL: a generated, weighted tsvector column `search_vector` on
+#     both tables with a GIN index, ranked with ts_rank.
+#   - SQLite: one FTS5 table fed by triggers, ranked with bm25. Its rowid
+#     packs the item: 2 * wish_id for wishes, 2 * speech_id + 1 for speeches.
+#     Altering a column rebuilds the table, which drops its triggers, so
+#     create_sqlite_triggers() runs again after every migrate.
+# Titles weigh more than descriptions on both. Scores are only comparable
+# within one backend.
+
+import re
+
+from django.db import DEFAULT_DB_ALIAS, connection, connections
+
+from .models import category_key
+from .pagination import InvalidCursor, decode_token, encode_token
+
+
+FTS_TABLE = 'social_connect_app_search'
+
+# Title and description weights of the SQLite bm25 ranking.
+BM25_WEIGHTS = (4.0, 1.0)
+
+KINDS = {
+    'wish': ('social_connect_app_wishes', 'wish_id', 0),
+    'speech': ('social_connect_app_speeches', 'speech_id', 1),
+}
+
+# Columns the SQLite triggers copy into the FTS5 table.
+INDEXED_COLUMNS = {
+    'wish': ('wish_title', 'wish_description'),
+    'speech': ('speech_title', 'speech_description'),
+}
+
+_WORD = re.compile(r'\w+')
+
+
+def sqlite_triggers():
+    statements = []
+    for kind, (table, pk, tag) in KINDS.items():
+        title, description = INDEXED_COLUMNS[kind]
+        rowid = f"2 * {{row}}.{pk} + {tag}"
+        insert = (
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description) "
+            f"VALUES ({rowid.format(row='NEW')}, NEW.{title}, NEW.{description});"
+        )
+        delete = f"DELETE FROM {FTS_TABLE} WHERE rowid = {rowid.format(row='OLD')};"
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_insert AFTER INSERT ON {table} BEGIN {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_update AFTER UPDATE OF {title}, {description} ON {table} "
+            f"BEGIN {delete} {insert} END",
+            f"CREATE TRIGGER IF NOT EXISTS {table}_search_delete AFTER DELETE ON {table} BEGIN {delete} END",
+        ]
+    return statements
+
+
+def create_sqlite_triggers(using=DEFAULT_DB_ALIAS):
+    """Creates the FTS5 triggers that are missing; a no-op off SQLite or before migration 0009."""
+    db = connections[using]
+    if db.vendor != 'sqlite' or FTS_TABLE not in db.introspection.table_names():
+        return
+    with db.cursor() as cursor:
+        for statement in sqlite_triggers():
+            cursor.execute(statement)
+
+
+def terms(query):
+    return _WORD.findall(query.lower())
+
+
+def _postgres_select(kind, filters):
+    table, pk, _ = KINDS[kind]
+    return (
+        f"SELECT '{kind}' AS kind, t.{pk} AS id, ts_rank(t.search_vector, q.query)::float8 AS score "
+        f"FROM {table} t CROSS JOIN (SELECT to_tsquery('english', %s) AS query) q "
+        f"WHERE t.search_vector @@ q.query{filters}"
+    )
+
+
+def _postgres_match(words):
+    # Every word has to match; the last one also as a prefix (search-as-you-type).
+    return ' & '.join([f"'{word}'" for word in words[:-1]] + [f"'{words[-1]}':*"])
+
+
+def _sqlite_select(kind, filters):
+    table, pk, tag = KINDS[kind]
+    return (
+        f"SELECT '{kind}' AS kind, t.{pk} AS id, -bm25({FTS_TABLE}, {BM25_WEIGHTS[0]}, {BM25_WEIGHTS[1]}) AS score "
+        f"FROM {FTS_TABLE} JOIN {table} t ON t.{pk} = {FTS_TABLE}.rowid / 2 "
+        f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid %% 2 = {tag}{filters}"
+    )
+
+
+def _sqlite_match(words):
+    return ' '.join([f'"{word}"' for word in words[:-1]] + [f'"{words[-1]}"*'])
+
+
+def search(query, kinds=('wish', 'speech'), category=None, status=None, cursor=None, page_size=10):
+    """
+    One page of [(kind, pk, score), ...] for the items matching every word
+    of `query`, best match first, ties broken by (kind, pk). Returns
+    (results, next_cursor); next_cursor is None on the last page.
+    """
+    words = terms(query)
+    if not words:
+        return [], None
+
+    if connection.vendor == 'postgresql':
+        select, match = _postgres_select, _postgres_match(words)
+    else:
+        select, match = _sqlite_select, _sqlite_match(words)
+
+    filters, filter_params = '', []
+    if category:
+        filters += ' AND t.category_key = %s'
+        filter_params.append(category_key(category))
+    if status:
+        filters += ' AND t.status = %s'
+        filter_params.append(status)
+
+    parts, params = [], []
+    for kind in kinds:
+        parts.append(select(kind, filters))
+        params += [match, *filter_params]
+    sql = f"SELECT kind, id, score FROM ({' UNION ALL '.join(parts)}) AS results"
+
+    if cursor:
+        try:
+            kind, pk, score = decode_token(cursor)
+            kind, pk, score = str(kind), int(pk), float(score)
+        except (ValueError, TypeError):
+            raise InvalidCursor('Invalid cursor')
+        sql += ' WHERE score < %s OR (score = %s AND (kind > %s OR (kind = %s AND id > %s)))'
+        params += [score, score, kind, kind, pk]
+
+    sql += ' ORDER BY score DESC, kind, id LIMIT %s'
+    params.append(page_size + 1)
+
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(sql, params)
+        rows = db_cursor.fetchall()
+
+    if len(rows) <= page_size:
+        return rows, None
+    rows = rows[:page_size]
+    return rows, encode_token(list(rows[-1]))
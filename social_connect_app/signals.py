@@ -0,0 +1,218 @@
+# social_connect_app/signals.py
+
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+from django.db.models.lookups import GreaterThan
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed, post_migrate
+from django.dispatch import receiver
+
+from .categories import adjust_category_count
+from .middleware import install_query_recorder
+from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, category_key
+from .object_cache import enabled as object_cache_enabled, invalidate_on_commit
+from . import search, suggest
+
+
+COUNT_FIELDS = {
+    Wishes: 'wish_count',
+    Speeches: 'speech_count',
+}
+
+
+# Columns whose previous values the category counts and the suggestion
+# index need, by suggestion field.
+TRACKED_COLUMNS = {
+    Wishes: {'title': 'wish_title', 'category': 'category', 'location': 'location'},
+    Speeches: {'title': 'speech_title', 'category': 'category', 'location': 'location'},
+    SeekersInstitutes: {'location': 'location'},
+}
+
+
+@receiver(pre_save, sender=Wishes)
+@receiver(pre_save, sender=Speeches)
+@receiver(pre_save, sender=SeekersInstitutes)
+def remember_previous_values(sender, instance, **kwargs):
+    instance._previous_values = {}
+    if not instance._state.adding:
+        columns = TRACKED_COLUMNS[sender].values()
+        instance._previous_values = sender.objects.filter(pk=instance.pk).values(*columns).first() or {}
+
+
+@receiver(post_save, sender=Wishes)
+@receiver(post_save, sender=Speeches)
+def count_category_on_save(sender, instance, created, **kwargs):
+    field = COUNT_FIELDS[sender]
+    previous_category = instance._previous_values.get('category')
+    if created:
+        adjust_category_count(instance.category, field, 1)
+    elif instance.category_key != category_key(previous_category):
+        adjust_category_count(previous_category, field, -1)
+        adjust_category_count(instance.category, field, 1)
+
+
+@receiver(post_delete, sender=Wishes)
+@receiver(post_delete, sender=Speeches)
+def count_category_on_delete(sender, instance, **kwargs):
+    adjust_category_count(instance.category, COUNT_FIELDS[sender], -1)
+
+
+# Prefix suggestion index (suggest.py), updated once the write commits.
+
+def suggestion_changes(sender, before, after):
+    changes = []
+    for field, column in TRACKED_COLUMNS[sender].items():
+        old, new = before.get(column), after.get(column)
+        if suggest.normalize(old) != suggest.normalize(new):
+            changes += [(field, old, -1), (field, new, 1)]
+    return changes
+
+
+def current_values(sender, instance):
+    return {column: getattr(instance, column) for column in TRACKED_COLUMNS[sender].values()}
+
+
+@receiver(post_save, sender=Wishes)
+@receiver(post_save, sender=Speeches)
+@receiver(post_save, sender=SeekersInstitutes)
+def update_suggestions_on_save(sender, instance, created, **kwargs):
+    before = {} if created else getattr(instance, '_previous_values', {})
+    changes = suggestion_changes(sender, before, current_values(sender, instance))
+    if changes:
+        transaction.on_commit(lambda: suggest.update(changes))
+
+
+@receiver(post_delete, sender=Wishes)
+@receiver(post_delete, sender=Speeches)
+@receiver(post_delete, sender=SeekersInstitutes)
+def update_suggestions_on_delete(sender, instance, **kwargs):
+    changes = suggestion_changes(sender, current_values(sender, instance), {})
+    if changes:
+        transaction.on_commit(lambda: suggest.update(changes))
+
+
+# Status columns on wishes and speeches (models.ITEM_STATUS_COLUMNS): the
+# status row and picker writes that do send signals update them in the same
+# transaction. picks.py writes them itself.
+
+ITEM_MODELS = {
+    WishStatus: (Wishes, 'wish_id'),
+    SpeechStatus: (Speeches, 'speech_id'),
+}
+
+
+@receiver(post_save, sender=WishStatus)
+@receiver(post_save, sender=SpeechStatus)
+def copy_status_on_save(sender, instance, **kwargs):
+    item_model, item_field = ITEM_MODELS[sender]
+    item_model.objects.filter(pk=getattr(instance, item_field)).update(status=instance.status)
+
+
+@receiver(post_delete, sender=WishStatus)
+@receiver(post_delete, sender=SpeechStatus)
+def clear_status_on_delete(sender, instance, **kwargs):
+    item_model, item_field = ITEM_MODELS[sender]
+    item_model.objects.filter(pk=getattr(instance, item_field)).update(status=None, pick_count=0, is_picked=False)
+
+
+def adjust_pick_counts(status_model, item_ids, delta):
+    ITEM_MODELS[status_model][0].objects.filter(pk__in=item_ids).update(
+        pick_count=Greatest(F('pick_count') + delta, 0),
+        is_picked=GreaterThan(F('pick_count') + delta, 0),
+    )
+
+
+@receiver(m2m_changed, sender=WishStatus.picked_by.through)
+@receiver(m2m_changed, sender=SpeechStatus.picked_by.through)
+def count_pickers(sender, instance, action, reverse, model, pk_set, **kwargs):
+    status_model = WishStatus if sender is WishStatus.picked_by.through else SpeechStatus
+    item_model, item_field = ITEM_MODELS[status_model]
+    if action in ('post_add', 'post_remove') and pk_set:
+        sign = 1 if action == 'post_add' else -1
+        if not reverse:
+            adjust_pick_counts(status_model, [getattr(instance, item_field)], sign * len(pk_set))
+        else:
+            adjust_pick_counts(status_model, status_model.objects.filter(pk__in=pk_set).values_list(item_field, flat=True), sign)
+    elif action == 'post_clear' and not reverse:
+        item_model.objects.filter(pk=getattr(instance, item_field)).update(pick_count=0, is_picked=False)
+    elif action == 'pre_clear' and reverse:
+        adjust_pick_counts(status_model, status_model.objects.filter(picked_by=instance).values_list(item_field, flat=True), -1)
+
+
+@receiver(pre_delete, sender=SeekersInstitutes)
+def uncount_deleted_picker(sender, instance, **kwargs):
+    # The cascade deletes the user's through rows without m2m_changed.
+    for status_model, (_, item_field) in ITEM_MODELS.items():
+        item_ids = list(status_model.objects.filter(picked_by=instance).values_list(item_field, flat=True))
+        if item_ids:
+            adjust_pick_counts(status_model, item_ids, -1)
+
+
+# Per-object response cache: every write that changes a serialized wish or
+# speech bumps that object's version once it commits.
+
+CACHE_KINDS = {
+    Wishes: 'wish',
+    Speeches: 'speech',
+    WishStatus: ('wish', 'wish_id'),
+    SpeechStatus: ('speech', 'speech_id'),
+}
+
+
+@receiver(post_save, sender=Wishes)
+@receiver(post_save, sender=Speeches)
+@receiver(post_delete, sender=Wishes)
+@receiver(post_delete, sender=Speeches)
+def invalidate_item(sender, instance, **kwargs):
+    invalidate_on_commit(CACHE_KINDS[sender], [instance.pk])
+
+
+@receiver(post_save, sender=WishStatus)
+@receiver(post_save, sender=SpeechStatus)
+@receiver(post_delete, sender=WishStatus)
+@receiver(post_delete, sender=SpeechStatus)
+def invalidate_item_status(sender, instance, **kwargs):
+    kind, item_field = CACHE_KINDS[sender]
+    invalidate_on_commit(kind, [getattr(instance, item_field)])
+
+
+@receiver(m2m_changed, sender=WishStatus.picked_by.through)
+@receiver(m2m_changed, sender=SpeechStatus.picked_by.through)
+def invalidate_item_pickers(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'pre_clear') or not object_cache_enabled():
+        return
+    status_model = WishStatus if sender is WishStatus.picked_by.through else SpeechStatus
+    kind, item_field = CACHE_KINDS[status_model]
+    if not reverse:
+        invalidate_on_commit(kind, [getattr(instance, item_field)])
+    elif pk_set is not None:
+        invalidate_on_commit(kind, status_model.objects.filter(pk__in=pk_set).values_list(item_field, flat=True))
+    else:
+        invalidate_on_commit(kind, status_model.objects.filter(picked_by=instance).values_list(item_field, flat=True))
+
+
+@receiver(post_save, sender=SeekersInstitutes)
+@receiver(post_delete, sender=SeekersInstitutes)
+def invalidate_user_items(sender, instance, created=False, **kwargs):
+    # Users appear in the created_by and picked_by fields of items.
+    if created or not object_cache_enabled():
+        return
+    invalidate_on_commit('wish', Wishes.objects.filter(
+        Q(created_by=instance) | Q(wish_status__picked_by=instance)
+    ).values_list('pk', flat=True).distinct())
+    invalidate_on_commit('speech', Speeches.objects.filter(
+        Q(created_by=instance) | Q(speech_status__picked_by=instance)
+    ).values_list('pk', flat=True).distinct())
+
+
+@receiver(connection_created)
+def record_request_queries(sender, connection, **kwargs):
+    install_query_recorder(connection)
+
+
+@receiver(post_migrate)
+def restore_search_triggers(sender, using, **kwargs):
+    # Any migration that alters Wishes or Speeches drops them on SQLite.
+    if sender.name == 'social_connect_app':
+        search.create_sqlite_triggers(using)
@@ -0,0 +1,97 @@
+# social_connect_app/stats.py
+
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.db.models.functions import Now
+
+from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, UserStats
+
+
+# Which per-user counter a picker contributes to for each item status.
+STATUS_COUNTERS = {
+    'In-Progress': 'pending',
+    'Completed': 'fulfilled',
+}
+
+
+def _bump(user_ids, field, delta):
+    user_ids = list(user_ids)
+    if not user_ids or not delta:
+        return
+
+    UserStats.objects.bulk_create([UserStats(user_id=user_id) for user_id in user_ids], ignore_conflicts=True)
+    UserStats.objects.filter(user_id__in=user_ids).update(**{field: F(field) + delta}, updated_date=Now())
+
+
+def record_created(kind, user_id, count=1):
+    """kind is 'wishes' or 'speeches'."""
+    _bump([user_id], f'{kind}_created', count)
+
+
+def record_status_change(kind, picker_ids, old_status, new_status):
+    """Moves every picker of an item from the counter of old_status to that of new_status."""
+    old_counter, new_counter = STATUS_COUNTERS.get(old_status), STATUS_COUNTERS.get(new_status)
+    if old_counter == new_counter:
+        return
+
+    if old_counter:
+        _bump(picker_ids, f'{kind}_{old_counter}', -1)
+    if new_counter:
+        _bump(picker_ids, f'{kind}_{new_counter}', 1)
+
+
+def record_status_changes(kind, changes):
+    """
+    record_status_change() for many items: changes are (picker_ids,
+    old_status, new_status). Users with the same net change share one update.
+    """
+    deltas = Counter()
+    for picker_ids, old_status, new_status in changes:
+        old_counter, new_counter = STATUS_COUNTERS.get(old_status), STATUS_COUNTERS.get(new_status)
+        if old_counter == new_counter:
+            continue
+        for user_id in picker_ids:
+            if old_counter:
+                deltas[user_id, f'{kind}_{old_counter}'] -= 1
+            if new_counter:
+                deltas[user_id, f'{kind}_{new_counter}'] += 1
+
+    groups = defaultdict(list)
+    for (user_id, field), delta in deltas.items():
+        groups[field, delta].append(user_id)
+    for (field, delta), user_ids in groups.items():
+        _bump(user_ids, field, delta)
+
+
+def record_pick(kind, user_id, status, count=1):
+    """A user joined the pickers of `count` items that now have `status`."""
+    counter = STATUS_COUNTERS.get(status)
+    if counter:
+        _bump([user_id], f'{kind}_{counter}', count)
+
+
+def recompute_all():
+    """Rebuilds every UserStats row from Wishes/Speeches and their status rows."""
+    stats = {user_id: UserStats(user_id=user_id) for user_id in SeekersInstitutes.objects.values_list('pk', flat=True)}
+
+    def apply(rows, field):
+        for user_id, count in rows:
+            if user_id in stats:
+                setattr(stats[user_id], field, count)
+
+    for kind, model, status_model in (('wishes', Wishes, WishStatus), ('speeches', Speeches, SpeechStatus)):
+        apply(model.objects.values('created_by').annotate(count=Count('pk')).values_list('created_by', 'count'), f'{kind}_created')
+        for status, counter in STATUS_COUNTERS.items():
+            rows = (
+                status_model.objects.filter(status=status, picked_by__isnull=False)
+                .values('picked_by').annotate(count=Count('pk')).values_list('picked_by', 'count')
+            )
+            apply(rows, f'{kind}_{counter}')
+
+    with transaction.atomic():
+        UserStats.objects.all().delete()
+        UserStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+    return len(stats)
@@ -0,0 +1,205 @@
+# social_connect_app/suggest.py
+#
+# In-process prefix index for search-as-you-type suggestions over wish and
+# speech titles, category names and location strings (the suggest/ view).
+#
+# Entries sit in one array sorted by normalized text, with parallel arrays
+# of popularity counts and display strings: the entries under a prefix are
+# a contiguous slice found with two bisects, and the top K of that slice is a
+# heapq.nlargest. Popularity is the number of rows carrying the string.
+#
+# Every process holds its own index, built by warm() at server start (or on
+# first use) and updated by signals once a write commits. Writes made by
+# other processes arrive with the next rebuild, at most SUGGEST_MAX_AGE
+# seconds later. Updates made while a rebuild scans the database are kept
+# and replayed onto the new index before it replaces the old one; a row the
+# scan already saw is then counted twice until the next rebuild. At most
+# SUGGEST_MAX_ENTRIES entries are kept, the most popular ones; new strings
+# are not added to a full index until a rebuild.
+
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+
+from django.conf import settings
+from django.db import connections
+
+from .models import SeekersInstitutes, Wishes, Speeches
+
+
+FIELDS = ('title', 'category', 'location')
+
+# Keys are '<normalized text>\x00<field index>': the separator sorts before
+# every other character, so a prefix never splits a text from its field.
+_SEPARATOR = '\x00'
+_MAX_CHAR = '\U0010ffff'
+
+
+def normalize(text):
+    return ' '.join(text.casefold().split()) if text else ''
+
+
+class PrefixIndex:
+    def __init__(self, rows=(), max_entries=None):
+        """rows: iterable of (field, text) pairs, one per row carrying the text."""
+        counts, texts = Counter(), {}
+        for field, text in rows:
+            key = self.key(field, text)
+            if key:
+                counts[key] += 1
+                texts.setdefault(key, text.strip())
+        if max_entries and len(counts) > max_entries:
+            counts = dict(heapq.nlargest(max_entries, counts.items(), key=lambda item: item[1]))
+
+        self.max_entries = max_entries
+        self.keys = sorted(counts)
+        self.counts = [counts[key] for key in self.keys]
+        # The display text is only stored when it differs from the key.
+        self.texts = [texts[key] if texts[key] != key[:-2] else None for key in self.keys]
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(field, text):
+        text = normalize(text)
+        return f'{text}{_SEPARATOR}{FIELDS.index(field)}' if text else None
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, field, text, delta=1):
+        key = self.key(field, text)
+        if not key:
+            return
+        with self.lock:
+            index = bisect_left(self.keys, key)
+            if index < len(self.keys) and self.keys[index] == key:
+                self.counts[index] += delta
+                if self.counts[index] <= 0:
+                    del self.keys[index], self.counts[index], self.texts[index]
+            elif delta > 0 and (not self.max_entries or len(self.keys) < self.max_entries):
+                self.keys.insert(index, key)
+                self.counts.insert(index, delta)
+                self.texts.insert(index, text.strip() if text.strip() != key[:-2] else None)
+
+    def suggest(self, prefix, limit=10, fields=None):
+        """The `limit` most popular entries starting with `prefix`, most popular first."""
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        codes = {str(FIELDS.index(field)) for field in fields} if fields else None
+
+        with self.lock:
+            start = bisect_left(self.keys, prefix)
+            end = bisect_left(self.keys, prefix + _MAX_CHAR, start)
+            candidates = range(start, end)
+            if codes:
+                candidates = [index for index in candidates if self.keys[index][-1] in codes]
+            top = heapq.nlargest(limit, candidates, key=self.counts.__getitem__)
+            return [
+                {
+                    'text': self.texts[index] or self.keys[index][:-2],
+                    'field': FIELDS[int(self.keys[index][-1])],
+                    'count': self.counts[index],
+                }
+                for index in top
+            ]
+
+
+def database_rows():
+    """(field, text) for every title, category and location in the database."""
+    for model, title_field in ((Wishes, 'wish_title'), (Speeches, 'speech_title')):
+        for title, category, location in model.objects.values_list(title_field, 'category', 'location').iterator(chunk_size=2000):
+            yield 'title', title
+            if category:
+                yield 'category', category
+            if location:
+                yield 'location', location
+    for location in SeekersInstitutes.objects.exclude(location=None).values_list('location', flat=True).iterator(chunk_size=2000):
+        yield 'location', location
+
+
+_index = None
+_built_at = 0.0
+_build_lock = threading.Lock()
+# update() changes made during a rebuild, or None when none is running.
+_pending = None
+_pending_lock = threading.Lock()
+
+
+def _apply(index, changes):
+    for field, text, delta in changes:
+        index.add(field, text, delta)
+
+
+def rebuild(rows=None):
+    """Builds a new index from `rows` ((field, text) pairs; the database by default) and swaps it in."""
+    global _index, _built_at, _pending
+    with _pending_lock:
+        _pending = []
+    try:
+        index = PrefixIndex(database_rows() if rows is None else rows, getattr(settings, 'SUGGEST_MAX_ENTRIES', 100_000))
+        with _pending_lock:
+            _apply(index, _pending)
+            _index, _built_at = index, time.monotonic()
+    finally:
+        with _pending_lock:
+            _pending = None
+    return index
+
+
+def _build_in_background(build):
+    def run():
+        try:
+            build()
+        finally:
+            # This thread's own database connections.
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def _rebuild_once():
+    if _build_lock.acquire(blocking=False):
+        try:
+            rebuild()
+        finally:
+            _build_lock.release()
+
+
+def get_index():
+    """The process's index: built on first use, rebuilt in the background once stale."""
+    global _built_at
+    if _index is None:
+        with _build_lock:
+            if _index is None:
+                rebuild()
+    elif time.monotonic() - _built_at > getattr(settings, 'SUGGEST_MAX_AGE', 600):
+        _built_at = time.monotonic()
+        _build_in_background(_rebuild_once)
+    return _index
+
+
+def warm():
+    """Builds the index in the background; called when a server process starts."""
+    _build_in_background(get_index)
+
+
+def suggest(prefix, limit=10, fields=None):
+    return get_index().suggest(prefix, limit, fields)
+
+
+def update(changes):
+    """Applies [(field, text, delta), ...], also to the index being built if any."""
+    with _pending_lock:
+        if _pending is not None:
+            _pending.extend(changes)
+        index = _index
+    if index is not None:
+        _apply(index, changes)
+
+
+def reset():
+    global _index
+    _index = None
@@ -1,3 +1,1432 @@
-from django.test import TestCase
+import contextlib
+import csv
+import io
+import json
+import os
+import random
+import tempfile
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, RequestFactory, AsyncRequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.http import JsonResponse
+from django.urls import get_resolver, reverse
+
+from . import views, async_views, export
+from .categories import CATEGORIES_CACHE_KEY
+from .distance import nearest_ids, prefilter
+from .management.commands import benchmark_routes
+from . import metrics
+from .middleware import RequestMetricsMiddleware, snapshot, sql_shape
+from .geo import haversine, geohash_for, bounding_box
+from .object_cache import counters, reset_counters
+from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, SocialMedia, Category, UserStats
+from .rendering import FastJsonResponse, WISH_SUMMARY_PLAN
+from .search import search
+from . import suggest
+from .stats import recompute_all
+from .views import MAX_BULK_ITEMS
+
+
+class LocationViewTests(TestCase):
+    # Query points chosen to exercise the antimeridian and both poles.
+    QUERY_POINTS = [
+        (18.52, 73.85, 10),
+        (18.52, 73.85, 250),
+        (0.0, 179.99, 50),
+        (-12.0, -179.95, 300),
+        (89.9, 10.0, 40),
+        (-89.95, -120.0, 80),
+        (45.0, 0.0, 0),
+        (10.0, 10.0, 25000),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        rng = random.Random(42)
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+
+        points = []
+        for lat, lon, radius in cls.QUERY_POINTS:
+            spread = max(radius / 50, 0.05)
+            for _ in range(15):
+                points.append((
+                    max(-90, min(90, lat + rng.uniform(-spread, spread))),
+                    ((lon + rng.uniform(-spread * 3, spread * 3) + 180) % 360) - 180,
+                ))
+        points.append((None, None))
+
+        for index, (lat, lon) in enumerate(points):
+            wish = Wishes.objects.create(
+                wish_title=f'Wish {index}', wish_description='Description', created_by=cls.user,
+                latitude=lat, longitude=lon,
+            )
+            WishStatus.objects.create(wish=wish)
+            speech = Speeches.objects.create(
+                speech_title=f'Speech {index}', speech_description='Description', created_by=cls.user,
+                latitude=lat, longitude=lon,
+            )
+            SpeechStatus.objects.create(speech=speech)
+
+    def full_scan(self, model, lat, lon, radius):
+        return [
+            item.pk for item in model.objects.order_by('pk')
+            if item.latitude is not None and item.longitude is not None
+            and haversine(lat, lon, item.latitude, item.longitude) <= radius
+        ]
+
+    def fetch_ids(self, url_name, id_field, lat, lon, radius):
+        ids, page = [], 1
+        while True:
+            response = self.client.get(reverse(url_name), {'latitude': lat, 'longitude': lon, 'radius': radius, 'page': page})
+            self.assertEqual(response.status_code, 200)
+            data = response.json()['data']
+            ids += [item[id_field] for item in data['items']]
+            if not data['has_next']:
+                return ids
+            page += 1
+
+    def test_wishes_by_location_matches_full_scan(self):
+        for lat, lon, radius in self.QUERY_POINTS:
+            with self.subTest(lat=lat, lon=lon, radius=radius):
+                self.assertEqual(
+                    self.fetch_ids('wishes_by_location', 'wish_id', lat, lon, radius),
+                    self.full_scan(Wishes, lat, lon, radius),
+                )
+
+    def test_speeches_by_location_matches_full_scan(self):
+        for lat, lon, radius in self.QUERY_POINTS:
+            with self.subTest(lat=lat, lon=lon, radius=radius):
+                self.assertEqual(
+                    self.fetch_ids('speeches_by_location', 'speech_id', lat, lon, radius),
+                    self.full_scan(Speeches, lat, lon, radius),
+                )
+
+    def test_rows_without_geohash_are_still_found(self):
+        Wishes.objects.update(geohash=None)
+        lat, lon, radius = self.QUERY_POINTS[1]
+        self.assertEqual(
+            self.fetch_ids('wishes_by_location', 'wish_id', lat, lon, radius),
+            self.full_scan(Wishes, lat, lon, radius),
+        )
+
+    def test_geohash_is_maintained_on_save(self):
+        wish = Wishes.objects.exclude(latitude=None).first()
+        wish.latitude, wish.longitude = 57.64911, 10.40744
+        wish.save()
+        wish.refresh_from_db()
+        self.assertEqual(wish.geohash, 'u4pruydqq')
+        self.assertIsNone(geohash_for(None, 10.0))
+
+    def test_prefilter_narrows_candidates(self):
+        lat, lon, radius = self.QUERY_POINTS[0]
+        candidates = set(prefilter(Wishes.objects.all(), lat, lon, radius).values_list('pk', flat=True))
+        self.assertTrue(set(self.full_scan(Wishes, lat, lon, radius)) <= candidates)
+        self.assertLess(len(candidates), Wishes.objects.exclude(latitude=None).count())
+
+    def test_bounding_box_handles_antimeridian_and_poles(self):
+        _, _, lon_ranges = bounding_box(0.0, 179.99, 50)
+        self.assertEqual(len(lon_ranges), 2)
+        self.assertEqual(lon_ranges[1][0], -180)
+
+        min_lat, max_lat, lon_ranges = bounding_box(89.9, 10.0, 40)
+        self.assertEqual((max_lat, lon_ranges), (90, [(-180, 180)]))
+
+    def test_unnormalized_longitude_matches_full_scan(self):
+        wish = Wishes.objects.create(
+            wish_title='Wrapped', wish_description='Description', created_by=self.user,
+            latitude=0.0, longitude=180.01,
+        )
+        lat, lon, radius = self.QUERY_POINTS[2]
+        ids = self.fetch_ids('wishes_by_location', 'wish_id', lat, lon, radius)
+        self.assertIn(wish.pk, ids)
+        self.assertEqual(ids, self.full_scan(Wishes, lat, lon, radius))
+
+    def test_nearest_returns_k_closest_sorted(self):
+        lat, lon = 18.6, 73.9
+        expected = sorted(
+            (haversine(lat, lon, wish.latitude, wish.longitude), wish.pk)
+            for wish in Wishes.objects.exclude(latitude=None)
+        )[:5]
+
+        response = self.client.get(reverse('nearest'), {'type': 'wish', 'latitude': lat, 'longitude': lon, 'k': 5})
+        self.assertEqual(response.status_code, 200)
+        items = response.json()['data']['items']
+        self.assertEqual([item['wish_id'] for item in items], [pk for _, pk in expected])
+        self.assertAlmostEqual(items[0]['distance'], expected[0][0])
+
+    def test_nearest_expands_to_sparse_regions(self):
+        response = self.client.get(reverse('nearest'), {'type': 'speech', 'latitude': 0, 'longitude': 0, 'k': 100})
+        distances = [item['distance'] for item in response.json()['data']['items']]
+        self.assertEqual(len(distances), 100)
+        self.assertEqual(distances, sorted(distances))
+        self.assertEqual(self.client.get(reverse('nearest'), {'latitude': 0, 'longitude': 0, 'k': 0}).status_code, 400)
+
+    def test_nearest_reads_a_small_table_once(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(nearest_ids(Wishes.objects.filter(category='Nowhere'), 0, 0, 5), [])
+
+        # k beyond the table: the count and one read of every row.
+        total = Speeches.objects.exclude(latitude=None).count()
+        with self.assertNumQueries(2):
+            nearest = nearest_ids(Speeches.objects.all(), -89.0, 0, total + 1)
+        self.assertEqual(len(nearest), total)
+
+
+class CursorPaginationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        for index in range(25):
+            wish = Wishes.objects.create(
+                wish_title=f'Wish {index}', wish_description='Description', created_by=cls.user, category='Education',
+            )
+            WishStatus.objects.create(wish=wish)
+        # Ties on created_date must be broken by the primary key.
+        first = Wishes.objects.order_by('wish_id').first()
+        Wishes.objects.filter(wish_id__lte=first.wish_id + 12).update(created_date=first.created_date)
+
+    def walk(self, url):
+        ids, cursor = [], ''
+        while True:
+            data = self.client.get(url, {'cursor': cursor}).json()['data']
+            self.assertNotIn('total_pages', data)
+            ids += [item['wish_id'] for item in data['items']]
+            if not data['has_next']:
+                self.assertIsNone(data['next_cursor'])
+                return ids
+            cursor = data['next_cursor']
+
+    def legacy(self, url):
+        ids, page = [], 1
+        while True:
+            data = self.client.get(url, {'page': page}).json()['data']
+            ids += [item['wish_id'] for item in data['items']]
+            if not data['has_next']:
+                return ids
+            page += 1
+
+    def test_cursor_mode_matches_page_mode(self):
+        for url in (reverse('list_wishes'), reverse('wish_by_category', args=['education']), reverse('user_wishes', args=[self.user.pk])):
+            with self.subTest(url=url):
+                ids = self.walk(url)
+                self.assertEqual(len(ids), 25)
+                self.assertEqual(ids, self.legacy(url))
+
+    def test_user_wishes_cursor_is_newest_first(self):
+        ids = self.walk(reverse('user_wishes', args=[self.user.pk]))
+        self.assertEqual(ids, list(Wishes.objects.order_by('-created_date', '-wish_id').values_list('wish_id', flat=True)))
+
+    def test_invalid_cursor(self):
+        response = self.client.get(reverse('list_wishes'), {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.json()['success'])
+
+
+# Query counts of the database path; ObjectCacheTests covers cached pages.
+@override_settings(OBJECT_CACHE_ENABLED=False)
+class PickedByPrefetchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.pickers = [
+            SeekersInstitutes.objects.create(email=f'picker{index}@example.com', first_name=f'Picker {index}')
+            for index in range(3)
+        ]
+
+    def add_items(self, count):
+        for index in range(count):
+            wish = Wishes.objects.create(
+                wish_title='Wish', wish_description='Description', created_by=self.user,
+                category='Education', latitude=18.5, longitude=73.8,
+            )
+            WishStatus.objects.create(wish=wish, status='In-Progress').picked_by.add(*self.pickers)
+            speech = Speeches.objects.create(
+                speech_title='Speech', speech_description='Description', created_by=self.user,
+                category='Education', latitude=18.5, longitude=73.8,
+            )
+            SpeechStatus.objects.create(speech=speech, status='In-Progress').picked_by.add(*self.pickers)
+            SocialMedia.objects.create(wish=wish, user=self.pickers[0], url=['https://example.com'])
+            SocialMedia.objects.create(speech=speech, user=self.pickers[0], url=['https://example.com'])
+        return wish, speech
+
+    def count_queries(self, url, params=None, method='get'):
+        with CaptureQueriesContext(connection) as context:
+            if method == 'get':
+                response = self.client.get(url, params)
+            else:
+                response = self.client.post(url, params, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return len(context.captured_queries)
+
+    def endpoints(self, wish, speech):
+        location = {'latitude': 18.5, 'longitude': 73.8}
+        return [
+            (reverse('list_wishes'), None, 'get', 4),
+            (reverse('list_speeches'), None, 'get', 4),
+            (reverse('wish_by_category', args=['Education']), None, 'get', 4),
+            (reverse('speeches_by_category', args=['Education']), None, 'get', 4),
+            (reverse('user_wishes', args=[self.user.pk]), None, 'get', 4),
+            (reverse('user-speeches', args=[self.user.pk]), None, 'get', 4),
+            (reverse('wishes_by_location'), location, 'get', 3),
+            (reverse('speeches_by_location'), location, 'get', 3),
+            (reverse('wish-details', args=[wish.pk]), None, 'get', 2),
+            (reverse('speech-details', args=[speech.pk]), None, 'get', 2),
+            (reverse('event'), None, 'get', 2),
+            (reverse('event_by_id', args=['wish', wish.pk]), None, 'get', 4),
+            (reverse('get_social_media', args=[wish.social_media_posts.get().pk]), None, 'get', 3),
+            (reverse('get_fulfill_details'), {'wish_id': wish.pk}, 'post', 1),
+        ]
+
+    def test_query_count_does_not_depend_on_page_size(self):
+        wish, speech = self.add_items(1)
+        small = [self.count_queries(url, params, method) for url, params, method, _ in self.endpoints(wish, speech)]
+
+        wish, speech = self.add_items(9)
+        for (url, params, method, expected), before in zip(self.endpoints(wish, speech), small):
+            with self.subTest(url=url):
+                self.assertEqual(self.count_queries(url, params, method), expected)
+                self.assertEqual(before, expected)
+
+    def test_rendering_is_byte_compatible_with_json_response(self):
+        wish, _ = self.add_items(1)
+        Wishes.objects.create(wish_title='Sans statut é', wish_description='Description', created_by=self.user)
+        payload = self.client.get(reverse('list_wishes')).json()
+        self.assertEqual(FastJsonResponse(payload).content, JsonResponse(payload).content)
+
+        row = Wishes.objects.filter(pk=wish.pk).values(*WISH_SUMMARY_PLAN.columns()).get()
+        self.assertEqual(WISH_SUMMARY_PLAN.render_row(row), {
+            'wish_id': wish.wish_id, 'wish_title': wish.wish_title, 'wish_description': wish.wish_description,
+            'created_by': {'picture': None, 'first_name': 'Seeker'}, 'status': 'In-Progress',
+            'category': 'Education', 'created_date': wish.created_date.strftime('%Y-%m-%d %H:%M:%S'),
+        })
+
+    def test_prefetched_picked_by_is_serialized(self):
+        wish, _ = self.add_items(1)
+        item = self.client.get(reverse('wish-details', args=[wish.pk])).json()['data']
+        self.assertEqual([user['email'] for user in item['picked_by']], [user.email for user in self.pickers])
+        self.assertEqual(item['created_by']['email'], self.user.email)
+
+
+@override_settings(OBJECT_CACHE_ALLOW_LOCMEM=True)
+class ObjectCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.volunteer = SeekersInstitutes.objects.create(email='volunteer@example.com', first_name='Volunteer')
+        cls.wishes = []
+        for index in range(5):
+            wish = Wishes.objects.create(wish_title=f'Wish {index}', wish_description='Description', created_by=cls.user)
+            WishStatus.objects.create(wish=wish, status='Created')
+            cls.wishes.append(wish)
+
+    def setUp(self):
+        cache.clear()
+        reset_counters()
+
+    def details(self, wish):
+        return self.client.get(reverse('wish-details', args=[wish.pk])).json()['data']
+
+    def test_warm_pages_only_query_the_page_of_ids(self):
+        cold = self.client.get(reverse('list_wishes')).json()
+        self.assertEqual(counters(), {'hits': 0, 'misses': 5})
+
+        with CaptureQueriesContext(connection) as context:
+            warm = self.client.get(reverse('list_wishes')).json()
+        self.assertEqual(warm, cold)
+        self.assertEqual(len(context.captured_queries), 2)  # count + page of ids
+        self.assertEqual(counters(), {'hits': 5, 'misses': 5})
+
+        with self.assertNumQueries(0):
+            self.client.get(reverse('wish-details', args=[self.wishes[0].pk]))
+
+    def test_writes_bump_the_version(self):
+        wish = self.wishes[0]
+        self.details(wish)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            wish.wish_title = 'Renamed'
+            wish.save()
+        self.assertEqual(self.details(wish)['wish_title'], 'Renamed')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(reverse('pick_wish'), {'wish_id': wish.pk, 'user_id': self.volunteer.pk}, content_type='application/json')
+        item = self.details(wish)
+        self.assertEqual(item['status'], 'In-Progress')
+        self.assertEqual([user['email'] for user in item['picked_by']], [self.volunteer.email])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.volunteer.first_name = 'Helper'
+            self.volunteer.save()
+        self.assertEqual(self.details(wish)['picked_by'][0]['first_name'], 'Helper')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.volunteer.picked_wish_statuses.clear()
+        self.assertEqual(self.details(wish)['picked_by'], [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.first_name = 'Creator'
+            self.user.save()
+        self.assertEqual(self.details(wish)['created_by']['first_name'], 'Creator')
+
+    def test_version_is_bumped_after_commit(self):
+        wish = self.wishes[0]
+        self.details(wish)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            wish.wish_title = 'Renamed'
+            wish.save()
+            # Until the write commits, readers keep the cached payload.
+            self.assertEqual(self.details(wish)['wish_title'], 'Wish 0')
+        self.assertEqual(self.details(wish)['wish_title'], 'Renamed')
+
+    def test_missing_object_is_not_cached(self):
+        response = self.client.get(reverse('wish-details', args=[10 ** 6]))
+        self.assertFalse(response.json()['success'])
+        self.assertEqual(counters(), {'hits': 0, 'misses': 1})
+
+    @override_settings(OBJECT_CACHE_ENABLED=False)
+    def test_can_be_disabled(self):
+        self.details(self.wishes[0])
+        with self.assertNumQueries(2):
+            self.details(self.wishes[0])
+        self.assertEqual(counters(), {'hits': 0, 'misses': 0})
+
+    @override_settings(OBJECT_CACHE_ALLOW_LOCMEM=False)
+    def test_off_on_a_per_process_cache(self):
+        self.details(self.wishes[0])
+        with self.assertNumQueries(2):
+            self.details(self.wishes[0])
+        self.assertEqual(counters(), {'hits': 0, 'misses': 0})
+
+
+class BulkCreateTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='institute@example.com', first_name='Institute')
+
+    def setUp(self):
+        cache.clear()
+
+    def post(self, name, payload):
+        return self.client.post(reverse(name), json.dumps(payload), content_type='application/json')
+
+    def test_bulk_create_wishes(self):
+        items = [
+            {'wish_title': f'Wish {index}', 'wish_description': 'Description', 'user_id': self.user.pk,
+             'category': 'Education', 'latitude': 18.5, 'longitude': 73.8}
+            for index in range(20)
+        ]
+        items += [
+            {'wish_title': 'No description', 'user_id': self.user.pk},
+            {'wish_title': 'Unknown user', 'wish_description': 'Description', 'user_id': 10 ** 6},
+            {'wish_title': 'Bad latitude', 'wish_description': 'Description', 'user_id': self.user.pk, 'latitude': 'north'},
+            'not an object',
+        ]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.post('bulk_create_wish', items)
+        self.assertEqual(response.status_code, 201)
+        self.assertLess(len(context.captured_queries), 15)
+
+        data = response.json()['data']
+        self.assertEqual((data['created'], data['failed']), (20, 4))
+        self.assertEqual([result['success'] for result in data['results']], [True] * 20 + [False] * 4)
+
+        wishes = Wishes.objects.filter(pk__in=[result['wish_id'] for result in data['results'][:20]]).select_related('wish_status')
+        self.assertEqual(len(wishes), 20)
+        for wish in wishes:
+            self.assertEqual(wish.wish_status.status, 'Created')
+            self.assertEqual((wish.geohash, wish.category_key), (geohash_for(18.5, 73.8), 'education'))
+
+        self.assertEqual(UserStats.objects.get(user=self.user).wishes_created, 20)
+        self.assertEqual(Category.objects.get(slug='education').wish_count, 20)
+        self.assertEqual(self.client.get(reverse('wish-details', args=[wishes[0].pk])).json()['data']['status'], 'Created')
+
+    def test_malformed_user_ids_are_rejected(self):
+        items = [
+            {'wish_title': 'Wish', 'wish_description': 'Description', 'user_id': user_id}
+            for user_id in (True, '1.0', 1.0, -1, str(self.user.pk))
+        ]
+        data = self.post('bulk_create_wish', items).json()['data']
+        self.assertEqual([result.get('error') for result in data['results']], ['Invalid User ID'] * 4 + [None])
+        self.assertEqual(Wishes.objects.get().created_by, self.user)
+
+    def test_bulk_create_speeches(self):
+        items = [{'speech_title': 'Speech', 'speech_description': 'Description', 'user_id': str(self.user.pk), 'platform_url': 'https://example.com'}]
+        response = self.post('bulk_create_speech', items)
+        self.assertEqual(response.status_code, 201)
+        speech = Speeches.objects.get(pk=response.json()['data']['results'][0]['speech_id'])
+        self.assertEqual(speech.speech_status.status, 'Created')
+
+    def test_rejects_invalid_payloads(self):
+        self.assertEqual(self.post('bulk_create_wish', {'wish_title': 'Wish'}).status_code, 400)
+        self.assertEqual(self.post('bulk_create_wish', []).status_code, 400)
+        self.assertEqual(self.post('bulk_create_wish', [{}] * (MAX_BULK_ITEMS + 1)).status_code, 400)
+        self.assertEqual(self.post('bulk_create_wish', [{'wish_title': 'Wish'}]).status_code, 400)
+        self.assertFalse(Wishes.objects.exists())
+
+
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.volunteer = SeekersInstitutes.objects.create(email='volunteer@example.com', first_name='Volunteer')
+        for index in range(12):
+            wish = Wishes.objects.create(wish_title=f'Wish {index}', wish_description='Description', created_by=cls.user, category='Education')
+            WishStatus.objects.create(wish=wish, status='Completed').picked_by.add(cls.volunteer)
+            speech = Speeches.objects.create(speech_title=f'Speech {index}', speech_description='Description', created_by=cls.user)
+            SpeechStatus.objects.create(speech=speech, status='Created')
+            SocialMedia.objects.create(wish=wish, user=cls.volunteer, url=['https://example.com'])
+        cls.wish, cls.speech = wish, speech
+
+    def setUp(self):
+        cache.clear()
+
+    async def test_responses_match_the_sync_views(self):
+        cases = [
+            ('list_wishes', '/wishes/', {}, {}),
+            ('list_wishes', '/wishes/', {'page': 2}, {}),
+            ('list_wishes', '/wishes/', {'page': 'last'}, {}),
+            ('list_wishes', '/wishes/', {'cursor': ''}, {}),
+            ('list_wishes', '/wishes/', {'cursor': 'bad'}, {}),
+            ('list_speeches', '/speeches/', {'page': 5}, {}),
+            ('list_speeches', '/speeches/', {'cursor': ''}, {}),
+            ('get_categories', '/categories/', {}, {}),
+            ('get_wish_details', '/wishes/', {}, {'wishID': self.wish.pk}),
+            ('get_wish_details', '/wishes/', {}, {'wishID': 10 ** 6}),
+            ('get_speech_details', '/speeches/', {}, {'speechID': self.speech.pk}),
+            ('event', '/event/', {'isCompleted': 'true'}, {}),
+            ('event', '/event/', {'cursor': ''}, {}),
+        ]
+        for name, path, params, kwargs in cases:
+            with self.subTest(view=name, params=params, kwargs=kwargs):
+                expected = await sync_to_async(getattr(views, name))(RequestFactory().get(path, params), **kwargs)
+                response = await getattr(async_views, name)(AsyncRequestFactory().get(path, params), **kwargs)
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.content, expected.content)
+
+    async def test_categories_etag(self):
+        response = await async_views.get_categories(AsyncRequestFactory().get('/categories/'))
+        self.assertEqual(response['ETag'], views.get_categories(RequestFactory().get('/categories/'))['ETag'])
+        cached = await async_views.get_categories(AsyncRequestFactory().get('/categories/', headers={'If-None-Match': response['ETag']}))
+        self.assertEqual(cached.status_code, 304)
+
+
+class RequestMetricsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [SeekersInstitutes.objects.create(email=f'user{index}@example.com', first_name='User') for index in range(2)]
+        for index in range(3):
+            wish = Wishes.objects.create(wish_title=f'Wish {index}', wish_description='Description', created_by=cls.users[0])
+            WishStatus.objects.create(wish=wish, status='Created')
+
+    def setUp(self):
+        cache.clear()
+
+    def records(self, logs):
+        return [json.loads(record.getMessage()) for record in logs.records]
+
+    def test_logs_one_line_per_request(self):
+        with self.assertLogs('social_connect.requests', 'INFO') as logs, CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('list_wishes'))
+
+        [record] = self.records(logs)
+        self.assertEqual(logs.records[0].levelname, 'INFO')
+        self.assertEqual(record['view'], 'list_wishes')
+        self.assertEqual((record['method'], record['path'], record['status']), ('GET', '/wishes/', 200))
+        self.assertEqual(record['db_queries'], len(queries.captured_queries))
+        self.assertEqual(record['response_bytes'], len(response.content))
+        self.assertNotIn('repeated_queries', record)
+        self.assertGreaterEqual(snapshot()['list_wishes']['requests'], 1)
+
+    @override_settings(QUERY_REPEAT_THRESHOLD=1)
+    def test_flags_repeated_query_shapes(self):
+        items = [{'wish_title': 'Wish', 'wish_description': 'Description', 'user_id': user.pk} for user in self.users]
+        with self.assertLogs('social_connect.requests', 'INFO') as logs:
+            self.client.post(reverse('bulk_create_wish'), json.dumps(items), content_type='application/json')
+
+        [record] = self.records(logs)
+        self.assertEqual(logs.records[0].levelname, 'WARNING')
+        self.assertTrue(any('UPDATE "social_connect_app_userstats"' in query['sql'] and query['count'] == 2 for query in record['repeated_queries']))
+
+    def test_sql_shape(self):
+        self.assertEqual(
+            sql_shape('SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = \'x\' LIMIT 21'),
+            sql_shape('SELECT * FROM t WHERE id IN (%s, %s) AND name = \'y\' LIMIT 10'),
+        )
+
+    @override_settings(OBJECT_CACHE_ENABLED=False)
+    async def test_async_views_are_measured(self):
+        middleware = RequestMetricsMiddleware(async_views.list_wishes)
+        with self.assertLogs('social_connect.requests', 'INFO') as logs:
+            await middleware(AsyncRequestFactory().get('/wishes/'))
+
+        [record] = self.records(logs)
+        self.assertEqual(record['db_queries'], 4)  # count, page of ids, wishes, picked_by
+
+
+class MetricsEndpointTests(TestCase):
+    def setUp(self):
+        metrics.reset()
+        reset_counters()
+
+    def scrape(self):
+        response = self.client.get(reverse('metrics'))
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        samples = {}
+        for line in response.content.decode().splitlines():
+            if not line.startswith('#'):
+                name, value = line.rsplit(' ', 1)
+                samples[name] = float(value)
+        return samples
+
+    def test_histograms_by_url_name_and_status(self):
+        for _ in range(3):
+            self.client.get(reverse('list_wishes'))
+        self.client.get(reverse('wish-details', args=[10 ** 6]))
+        samples = self.scrape()
+
+        labels = 'view="list_wishes",status="200"'
+        self.assertEqual(samples[f'social_connect_requests_total{{{labels}}}'], 3)
+        self.assertEqual(samples[f'social_connect_request_duration_seconds_count{{{labels}}}'], 3)
+        self.assertEqual(samples[f'social_connect_request_db_queries_bucket{{{labels},le="+Inf"}}'], 3)
+        buckets = [samples[f'social_connect_request_duration_seconds_bucket{{{labels},le="{bound}"}}'] for bound in metrics.LATENCY_BUCKETS]
+        self.assertEqual(buckets, sorted(buckets))
+        self.assertEqual(samples['social_connect_requests_total{view="wish-details",status="500"}'], 1)
+
+    def test_workers_share_a_directory(self):
+        with tempfile.TemporaryDirectory() as directory, self.settings(METRICS_DIR=directory):
+            self.client.get(reverse('list_wishes'))
+
+            # Another worker's totals: two list_wishes requests of 0.02s with 3 queries each.
+            series = [0] * (3 + len(metrics.LATENCY_BUCKETS) + 1 + len(metrics.QUERY_BUCKETS) + 1)
+            series[:3] = [2, 0.04, 6]
+            series[3 + 3] = 2
+            series[3 + len(metrics.LATENCY_BUCKETS) + 1 + 3] = 2
+            with open(os.path.join(directory, 'metrics-1.json'), 'w') as file:
+                json.dump({'requests': [['list_wishes', '200', series]], 'object_cache': {'hits': 4, 'misses': 1}}, file)
+
+            samples = self.scrape()
+            self.assertIn(f'metrics-{os.getpid()}.json', os.listdir(directory))
+
+        self.assertEqual(samples['social_connect_requests_total{view="list_wishes",status="200"}'], 3)
+        # This process's request ran one query; the other worker's ran three.
+        self.assertEqual(samples['social_connect_request_db_queries_bucket{view="list_wishes",status="200",le="2"}'], 1)
+        self.assertEqual(samples['social_connect_request_db_queries_bucket{view="list_wishes",status="200",le="3"}'], 3)
+        self.assertEqual(samples['social_connect_object_cache_lookups_total{result="hit"}'], 4)
+
+    @override_settings(OBJECT_CACHE_ALLOW_LOCMEM=True)
+    def test_object_cache_lookups(self):
+        cache.clear()
+        user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=user)
+        for _ in range(3):
+            self.client.get(reverse('wish-details', args=[wish.pk]))
+
+        samples = self.scrape()
+        self.assertEqual(samples['social_connect_object_cache_enabled'], 1)
+        self.assertEqual(samples['social_connect_object_cache_lookups_total{result="hit"}'], 2)
+        self.assertEqual(samples['social_connect_object_cache_lookups_total{result="miss"}'], 1)
+
+
+class UserSummaryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.volunteer = SeekersInstitutes.objects.create(email='volunteer@example.com', first_name='Volunteer')
+
+    def add_items(self, count):
+        for index in range(count):
+            for status in ('Created', 'In-Progress', 'Completed'):
+                wish = Wishes.objects.create(wish_title=f'Wish {index}', wish_description='Description', created_by=self.user)
+                wish_status = WishStatus.objects.create(wish=wish, status=status)
+                speech = Speeches.objects.create(speech_title=f'Speech {index}', speech_description='Description', created_by=self.user)
+                speech_status = SpeechStatus.objects.create(speech=speech, status=status)
+                if status != 'Created':
+                    wish_status.picked_by.add(self.volunteer)
+                    speech_status.picked_by.add(self.volunteer)
+
+    def summary(self, user, params=None):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse('get-user-summary', args=[user.pk]), params)
+        return response, len(context.captured_queries)
+
+    def test_constant_number_of_queries(self):
+        self.add_items(1)
+        _, few = self.summary(self.volunteer)
+        self.add_items(5)
+        response, many = self.summary(self.volunteer)
+
+        self.assertEqual(few, many)
+        self.assertEqual(many, 7)
+        data = response.json()['data']
+        self.assertEqual(len(data['wishes_pending']), 6)
+        self.assertEqual(len(data['speeches_fulfilled']), 6)
+        self.assertEqual(data['wishes_pending'][0]['status'], 'In-Progress')
+        self.assertEqual(data['wishes_pending'][0]['created_by']['first_name'], 'Seeker')
+
+    def test_section_limits(self):
+        self.add_items(4)
+        data = self.summary(self.user, {'limit': 2, 'speeches_created_limit': 5})[0].json()['data']
+        self.assertEqual(len(data['wishes_created']), 2)
+        self.assertEqual(len(data['speeches_created']), 5)
+        self.assertEqual(data['wishes_created'][0]['wish_id'], Wishes.objects.latest('created_date', 'wish_id').wish_id)
+
+        self.assertEqual(self.summary(self.user, {'limit': 'x'})[0].status_code, 400)
+
+
+class UserStatsTests(TestCase):
+    COUNTERS = ('wishes_created', 'wishes_pending', 'wishes_fulfilled', 'speeches_created', 'speeches_pending', 'speeches_fulfilled')
+
+    def post(self, name, payload):
+        response = self.client.post(reverse(name), json.dumps(payload), content_type='application/json')
+        self.assertLess(response.status_code, 300, response.content)
+        return response.json()['data']
+
+    def stats(self, user):
+        return {name: value for name, value in self.client.get(reverse('user_stats', args=[user.pk])).json()['data'].items() if name in self.COUNTERS}
+
+    def test_counters_follow_the_item_lifecycle(self):
+        seeker = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        volunteers = [SeekersInstitutes.objects.create(email=f'v{index}@example.com', first_name='Volunteer') for index in range(2)]
+
+        wish_id = self.post('create_wish', {'wish_title': 'Wish', 'wish_description': 'Description', 'user_id': seeker.pk})['wish_id']
+        speech_id = self.post('create_speech', {'speech_title': 'Speech', 'speech_description': 'Description', 'user_id': seeker.pk})['speech_id']
+        for volunteer in volunteers:
+            self.post('pick_wish', {'wish_id': wish_id, 'user_id': volunteer.pk})
+            self.post('pick_speech', {'speech_id': speech_id, 'user_id': volunteer.pk})
+
+        self.assertEqual(self.stats(volunteers[0])['wishes_pending'], 1)
+        self.assertEqual(self.stats(seeker)['wishes_created'], 1)
+
+        social = SocialMedia.objects.create(wish_id=wish_id, user=volunteers[0])
+        self.post('change_status', {'social_id': social.pk, 'wish_id': wish_id})
+        # Repeating it reads the locked Completed row and moves nobody again.
+        self.post('change_status', {'social_id': social.pk, 'wish_id': wish_id})
+
+        expected = {name: 0 for name in self.COUNTERS}
+        self.assertEqual(self.stats(volunteers[1]), {**expected, 'wishes_fulfilled': 1, 'speeches_pending': 1})
+        self.assertEqual(self.stats(seeker), {**expected, 'wishes_created': 1, 'speeches_created': 1})
+
+        # The incremental counters agree with a full recompute.
+        before = {user.pk: self.stats(user) for user in [seeker, *volunteers]}
+        recompute_all()
+        self.assertEqual(before, {user.pk: self.stats(user) for user in [seeker, *volunteers]})
+
+    def test_unknown_user(self):
+        self.assertEqual(self.client.get(reverse('user_stats', args=[999])).status_code, 404)
+
+
+class CategoriesTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+
+    def test_categories_are_cached_and_revalidated(self):
+        Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.user, category='Robotics')
+        first = self.client.get(reverse('categories'))
+        self.assertIn('Robotics', first.json()['data']['categories'])
+        self.assertIn('Education', first.json()['data']['categories'])
+
+        with self.assertNumQueries(0):
+            second = self.client.get(reverse('categories'))
+        self.assertEqual(second.content, first.content)
+
+        not_modified = self.client.get(reverse('categories'), HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_writes_invalidate_cache(self):
+        etag = self.client.get(reverse('categories'))['ETag']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Speeches.objects.create(speech_title='Speech', speech_description='Description', created_by=self.user, category='Astronomy')
+            # Until the write commits, readers keep the cached list.
+            self.assertEqual(self.client.get(reverse('categories'), HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        response = self.client.get(reverse('categories'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('Astronomy', response.json()['data']['categories'])
+
+    @override_settings(CATEGORIES_CACHE_TIMEOUT=0)
+    def test_entry_expires(self):
+        # Writes in other processes only reach this one through the expiry.
+        self.client.get(reverse('categories'))
+        self.assertIsNone(cache.get(CATEGORIES_CACHE_KEY))
+
+    def test_registry_counts_and_key_lookup(self):
+        for category in ('Music', 'music', ' MUSIC '):
+            wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.user, category=category)
+            WishStatus.objects.create(wish=wish)
+        Speeches.objects.create(speech_title='Speech', speech_description='Description', created_by=self.user, category='Music')
+        wish.category = 'Travel'
+        wish.save()
+
+        counts = {row['key']: row for row in self.client.get(reverse('categories')).json()['data']['counts']}
+        self.assertEqual((counts['music']['wish_count'], counts['music']['speech_count']), (2, 1))
+        self.assertEqual(counts['travel']['wish_count'], 1)
+        self.assertEqual(counts['education']['wish_count'], 0)
+
+        data = self.client.get(reverse('wish_by_category', args=['MUSIC'])).json()['data']
+        self.assertEqual(data['count'], 2)
+
+        wish.delete()
+        self.assertEqual(Category.objects.get(key='travel').wish_count, 0)
+
+    def test_keys_keep_categories_apart(self):
+        for category in ('C++', 'C#', 'C', ' c '):
+            Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.user, category=category)
+
+        counts = {row['key']: row for row in self.client.get(reverse('categories')).json()['data']['counts']}
+        self.assertEqual({key: counts[key]['wish_count'] for key in ('c++', 'c#', 'c')}, {'c++': 1, 'c#': 1, 'c': 2})
+        self.assertEqual(counts['c++']['slug'], 'c')
+        self.assertEqual(self.client.get(reverse('wish_by_category', args=['c++'])).json()['data']['count'], 1)
+
+    def test_speeches_match_any_case_and_spacing(self):
+        for category in ('Music', 'Travel'):
+            Speeches.objects.create(speech_title='Speech', speech_description='Description', created_by=self.user, category=category)
+
+        for segment in ('Music', 'music', ' MUSIC '):
+            data = self.client.get(reverse('speeches_by_category', args=[segment])).json()['data']
+            self.assertEqual(data['count'], 1)
+
+    def test_blank_category_is_rejected(self):
+        Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.user)
+        Speeches.objects.create(speech_title='Speech', speech_description='Description', created_by=self.user)
+
+        for name in ('wish_by_category', 'speeches_by_category'):
+            response = self.client.get(reverse(name, args=[' ']))
+            self.assertEqual(response.status_code, 400)
+            self.assertFalse(response.json()['success'])
+
+    def test_unused_categories_are_not_listed(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.user, category='Astronomy')
+        self.assertIn('Astronomy', self.client.get(reverse('categories')).json()['data']['categories'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            wish.delete()
+        categories = self.client.get(reverse('categories')).json()['data']['categories']
+        self.assertNotIn('Astronomy', categories)
+        self.assertIn('Education', categories)
+
+
+class SeedDataTests(TestCase):
+    def seed(self):
+        call_command('seed_data', users=20, wishes=60, speeches=30, seed=7, flush=True, stdout=io.StringIO())
+        return list(Wishes.objects.order_by('wish_title').values_list('wish_title', 'latitude', 'longitude', 'created_date'))
+
+    def test_same_seed_same_data(self):
+        first = self.seed()
+        self.assertEqual(len(first), 60)
+        self.assertEqual(SeekersInstitutes.objects.count(), 20)
+        self.assertEqual(Speeches.objects.count(), 30)
+        self.assertTrue(WishStatus.objects.filter(picked_by__isnull=False).exists())
+        self.assertTrue(SocialMedia.objects.exists())
+        self.assertEqual(self.seed(), first)
+
+    def test_benchmark_covers_every_route(self):
+        self.seed()
+        output = os.path.join(tempfile.mkdtemp(), 'bench.json')
+        call_command('benchmark_routes', requests=1, warmup=0, output=output, stdout=io.StringIO())
+
+        with open(output) as file:
+            results = json.load(file)
+        self.assertEqual(results['dataset']['wishes'], 60)
+        self.assertEqual(results['routes']['list_wishes']['statuses'], {'200': 1})
+        self.assertGreater(results['routes']['list_wishes']['queries_per_request'], 0)
+        self.assertEqual(Wishes.objects.count(), 60)
+
+
+# Most SQL queries one request to each route may run, with a cold cache.
+# Requests are the ones benchmark_routes sends; every route needs an entry.
+QUERY_BUDGETS = {
+    'create_user': 1,
+    'create_wish': 10,
+    'create_speech': 10,
+    'bulk_create_wish': 7,
+    'bulk_create_speech': 7,
+    'pick_wish': 9,
+    'pick_speech': 9,
+    'bulk_pick': 19,
+    'list_wishes': 4,
+    'list_speeches': 4,
+    'wish_by_category': 4,
+    'user_wishes': 4,
+    'wishes_by_location': 3,
+    'check_user_exists': 1,
+    'change_status': 10,
+    'categories': 1,
+    'wish-details': 2,
+    'user-speeches': 4,
+    'speech-details': 2,
+    'fulfill': 3,
+    'event': 2,
+    'event_by_id': 4,
+    'user_details': 1,
+    'speeches_by_category': 4,
+    'speeches_by_location': 3,
+    'nearest': 4,
+    'search': 5,
+    'suggest': 3,
+    'export': 1,
+    'update_user': 5,
+    'get_fulfill_details': 1,
+    'get_social_media': 3,
+    'get-user-summary': 8,
+    'user_stats': 1,
+    'metrics': 0,
+    'sign_up_user': 3,
+    'sign_in_user': 10,
+    'sign_out': 2,
+}
+
+# Routes whose query count follows local density rather than table size:
+# nearest widens its search ring one query at a time.
+DENSITY_DEPENDENT = {'nearest'}
+
+
+class QueryBudgetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.context = cls.seed(1)
+
+    @staticmethod
+    def seed(scale):
+        call_command('seed_data', users=20 * scale, wishes=60 * scale, speeches=30 * scale, seed=7, flush=True, stdout=io.StringIO())
+        context = benchmark_routes.Command().context()
+        User.objects.filter(username=context['user'].email).delete()
+        User.objects.create_user(username=context['user'].email, email=context['user'].email,
+                                 password=benchmark_routes.BENCH_PASSWORD)
+        return context
+
+    def run_route(self, name):
+        method, url, payload = benchmark_routes.routes(self.context)[name](0)
+        cache.clear()
+        suggest.reset()
+        with CaptureQueriesContext(connection) as context, contextlib.redirect_stdout(io.StringIO()):
+            if method == 'get':
+                response = self.client.get(url, payload)
+            else:
+                response = self.client.post(url, json.dumps(payload), content_type='application/json')
+            content = b''.join(response.streaming_content) if response.streaming else response.content
+        self.assertLess(response.status_code, 400, f'{name}: {content[:200]}')
+        return context.captured_queries
+
+    def assert_within_budget(self, name, queries):
+        sql = '\n'.join(f'  {index}. {query["sql"]}' for index, query in enumerate(queries, 1))
+        self.assertLessEqual(len(queries), QUERY_BUDGETS[name],
+                             f'{name} ran {len(queries)} queries (budget {QUERY_BUDGETS[name]}):\n{sql}')
+
+    def test_every_route_has_a_budget(self):
+        names = {pattern.name for pattern in get_resolver('social_connect_app.urls').url_patterns if pattern.name}
+        self.assertEqual(names, set(QUERY_BUDGETS))
+
+    def test_routes_stay_within_budget(self):
+        for name in QUERY_BUDGETS:
+            with self.subTest(route=name):
+                self.assert_within_budget(name, self.run_route(name))
+
+    def test_read_queries_do_not_grow_with_data(self):
+        reads = [
+            name for name, spec in benchmark_routes.routes(self.context).items()
+            if spec(0)[0] == 'get' and name not in DENSITY_DEPENDENT
+        ]
+        small = {name: len(self.run_route(name)) for name in reads}
+
+        self.context = self.seed(3)
+        for name in reads:
+            with self.subTest(route=name):
+                queries = self.run_route(name)
+                self.assert_within_budget(name, queries)
+                self.assertEqual(len(queries), small[name])
+
+
+class SearchTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.guitar = Wishes.objects.create(wish_title='Guitar lessons', wish_description='Teach the children to play', created_by=cls.user, category='Music')
+        WishStatus.objects.create(wish=cls.guitar, status='In-Progress')
+        cls.books = Wishes.objects.create(wish_title='Library books', wish_description='Books about music and guitars', created_by=cls.user, category='Education')
+        WishStatus.objects.create(wish=cls.books)
+        cls.talk = Speeches.objects.create(speech_title='Guitar making', speech_description='A talk on building instruments', created_by=cls.user, category='Music')
+        SpeechStatus.objects.create(speech=cls.talk)
+
+    def test_triggers_are_restored_after_migrate(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite only')
+        with connection.cursor() as cursor:
+            cursor.execute('DROP TRIGGER social_connect_app_wishes_search_insert')
+        call_command('migrate', verbosity=0)
+
+        Wishes.objects.create(wish_title='Telescope', wish_description='For the astronomy club', created_by=self.user)
+        self.assertEqual([kind for kind, *_ in search('telescope')[0]], ['wish'])
+
+    def search(self, **params):
+        response = self.client.get(reverse('search'), params)
+        self.assertEqual(response.status_code, 200)
+        return response.json()['data']
+
+    def test_ranks_title_matches_first(self):
+        items = self.search(q='guitar')['items']
+        self.assertEqual([(item['type'], item.get('wish_id', item.get('speech_id'))) for item in items][-1], ('wish', self.books.pk))
+        self.assertEqual({item['type'] for item in items[:2]}, {'wish', 'speech'})
+        self.assertGreater(items[0]['score'], items[-1]['score'])
+        self.assertEqual(items[0]['created_by']['first_name'], 'Seeker')
+
+    def test_filters(self):
+        self.assertEqual([item['wish_id'] for item in self.search(q='guitar', type='wish', category='MUSIC')['items']], [self.guitar.pk])
+        self.assertEqual([item['wish_id'] for item in self.search(q='guitar', type='wish', status='Created')['items']], [self.books.pk])
+        self.assertEqual(self.search(q='guitar', category='Travel')['items'], [])
+
+    def test_index_follows_writes(self):
+        self.assertEqual(self.search(q='violin')['items'], [])
+        Wishes.objects.filter(pk=self.books.pk).update(wish_title='Violin strings')
+        self.assertEqual([item['wish_id'] for item in self.search(q='violin')['items']], [self.books.pk])
+
+        self.talk.delete()
+        self.assertEqual([item['type'] for item in self.search(q='instruments')['items']], [])
+        self.assertEqual([item['wish_id'] for item in self.search(q='guit')['items']], [self.guitar.pk, self.books.pk])
+
+    def test_cursor_pages_cover_all_results(self):
+        for index in range(12):
+            Speeches.objects.create(speech_title=f'Guitar {index}', speech_description='Guitar', created_by=self.user)
+
+        expected = [(kind, pk) for kind, pk, _ in search('guitar', page_size=100)[0]]
+        seen, cursor = [], None
+        while True:
+            params = {'q': 'guitar', **({'cursor': cursor} if cursor else {})}
+            data = self.search(**params)
+            seen += [(item['type'], item.get('wish_id', item.get('speech_id'))) for item in data['items']]
+            cursor = data['next_cursor']
+            if not cursor:
+                break
+        self.assertEqual(len(expected), 15)
+        self.assertEqual(seen, expected)
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(reverse('search')).status_code, 400)
+        self.assertEqual(self.client.get(reverse('search'), {'q': 'guitar', 'type': 'event'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('search'), {'q': 'guitar', 'cursor': 'nope'}).status_code, 400)
+        self.assertEqual(self.search(q='"*:()')['items'], [])
+
+
+class SuggestTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker', location='Pune')
+        for title, location in [('Guitar lessons', 'Pune'), ('guitar  LESSONS', 'Mumbai'), ('Gardening kit', 'Pune'), ('Gear for trekking', None)]:
+            Wishes.objects.create(wish_title=title, wish_description='Description', created_by=cls.user, category='Music', location=location)
+        Speeches.objects.create(speech_title='Public speaking', speech_description='Description', created_by=cls.user, category='Personal', location='Punjab')
+
+    def setUp(self):
+        suggest.reset()
+
+    def suggestions(self, **params):
+        response = self.client.get(reverse('suggest'), params)
+        self.assertEqual(response.status_code, 200)
+        return [(item['text'], item['field'], item['count']) for item in response.json()['data']['items']]
+
+    def test_most_popular_first(self):
+        self.assertEqual(self.suggestions(q='g'), [
+            ('Guitar lessons', 'title', 2), ('Gardening kit', 'title', 1), ('Gear for trekking', 'title', 1),
+        ])
+        self.assertEqual(self.suggestions(q='PU'), [
+            ('Pune', 'location', 3), ('Public speaking', 'title', 1), ('Punjab', 'location', 1),
+        ])
+        self.assertEqual(self.suggestions(q='pu', field='location', limit=1), [('Pune', 'location', 3)])
+        self.assertEqual(self.suggestions(q='mu', field=['category', 'location']), [('Music', 'category', 4), ('Mumbai', 'location', 1)])
+        self.assertEqual(self.suggestions(q=' '), [])
+
+    def test_writes_update_the_index(self):
+        self.suggestions(q='p')
+        with self.captureOnCommitCallbacks(execute=True):
+            wish = Wishes.objects.create(wish_title='Piano', wish_description='Description', created_by=self.user, location='Pune')
+        self.assertIn(('Piano', 'title', 1), self.suggestions(q='pi'))
+        self.assertIn(('Pune', 'location', 4), self.suggestions(q='pun'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            wish.wish_title = 'Violin'
+            wish.save()
+            self.user.location = 'Nagpur'
+            self.user.save()
+        self.assertEqual(self.suggestions(q='pi'), [])
+        self.assertIn(('Nagpur', 'location', 1), self.suggestions(q='nag'))
+        self.assertIn(('Pune', 'location', 3), self.suggestions(q='pun'))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Speeches.objects.all().delete()
+        self.assertEqual(self.suggestions(q='pub'), [])
+
+    def test_writes_during_a_rebuild_are_kept(self):
+        old = suggest.get_index()
+
+        def rows():
+            yield 'title', 'Guitar lessons'
+            # Committed while the rebuild scans: the old index gets it too,
+            # and is about to be replaced.
+            suggest.update([('title', 'Piano', 1), ('title', 'Guitar lessons', -1)])
+            yield 'title', 'Guitar lessons'
+
+        suggest.rebuild(rows())
+        self.assertIsNot(suggest.get_index(), old)
+        self.assertEqual(self.suggestions(q='pi'), [('Piano', 'title', 1)])
+        self.assertEqual(self.suggestions(q='gu'), [('Guitar lessons', 'title', 1)])
+
+        suggest.update([('title', 'Piano', 1)])
+        self.assertEqual(self.suggestions(q='pi'), [('Piano', 'title', 2)])
+
+    def test_bounded_size(self):
+        index = suggest.PrefixIndex([('title', 'a')] * 3 + [('title', 'b')] * 2 + [('title', 'c')], max_entries=2)
+        self.assertEqual(len(index), 2)
+        index.add('title', 'd')
+        self.assertEqual([item['text'] for item in index.suggest('d')], [])
+        index.add('title', 'b', -2)
+        index.add('title', 'd')
+        self.assertEqual([item['text'] for item in index.suggest('d')], ['d'])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(reverse('suggest'), {'q': 'g', 'field': 'email'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('suggest'), {'q': 'g', 'limit': 0}).status_code, 400)
+
+
+class PickTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seeker = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.volunteers = [SeekersInstitutes.objects.create(email=f'v{index}@example.com', first_name='Volunteer') for index in range(2)]
+        cls.wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=cls.seeker)
+
+    def pick(self, user_id, wish_id=None):
+        response = self.client.post(reverse('pick_wish'), json.dumps({'wish_id': wish_id or self.wish.pk, 'user_id': user_id}), content_type='application/json')
+        return response.status_code, response.json()
+
+    def test_pick_creates_missing_status_and_rejects_duplicates(self):
+        self.assertEqual(self.pick(self.volunteers[0].pk)[0], 200)
+        status, body = self.pick(self.volunteers[0].pk)
+        self.assertEqual((status, body['error']), (400, 'User has already picked this wish'))
+        self.assertEqual(self.pick(self.volunteers[1].pk)[0], 200)
+
+        wish_status = WishStatus.objects.get(wish=self.wish)
+        self.assertEqual(wish_status.status, 'In-Progress')
+        self.assertEqual(sorted(wish_status.picked_by.values_list('pk', flat=True)), [user.pk for user in self.volunteers])
+        self.assertEqual(UserStats.objects.get(user=self.volunteers[0]).wishes_pending, 1)
+
+    def test_created_status_is_locked_before_use(self):
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.pick(self.volunteers[0].pk)[0], 200)
+        statements = [query['sql'] for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]
+        created = next(index for index, sql in enumerate(statements) if sql.startswith('INSERT INTO "social_connect_app_wishstatus"'))
+        # Read again with the same SELECT ... FOR UPDATE as an existing row.
+        self.assertIn(statements[0], statements[created + 1:])
+
+    def test_unknown_user_and_wish(self):
+        status, body = self.pick(999)
+        self.assertEqual((status, body['error']), (400, 'Invalid User ID'))
+        self.assertFalse(WishStatus.objects.filter(wish=self.wish, picked_by__isnull=False).exists())
+        self.assertEqual(self.pick(self.volunteers[0].pk, wish_id=999)[0], 404)
+
+    def test_picking_a_completed_item_moves_earlier_pickers(self):
+        WishStatus.objects.create(wish=self.wish, status='Completed').picked_by.add(self.volunteers[0])
+        recompute_all()
+
+        self.assertEqual(self.pick(self.volunteers[1].pk)[0], 200)
+        first, second = (UserStats.objects.get(user=user) for user in self.volunteers)
+        self.assertEqual((first.wishes_pending, first.wishes_fulfilled), (1, 0))
+        self.assertEqual((second.wishes_pending, second.wishes_fulfilled), (1, 0))
+
+    def test_steady_state_round_trips(self):
+        self.pick(self.volunteers[0].pk)
+        # Lock the status, insert the picker, count it on the wish, bump the
+        # picker's counter (2).
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(self.pick(self.volunteers[1].pk)[0], 200)
+        statements = [query['sql'] for query in context.captured_queries if 'SAVEPOINT' not in query['sql']]
+        self.assertEqual(len(statements), 5, '\n'.join(statements))
+
+
+class BulkPickTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seeker = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.volunteers = [SeekersInstitutes.objects.create(email=f'v{index}@example.com', first_name='Volunteer') for index in range(2)]
+
+    def items(self, count, status='Created'):
+        wishes, speeches = [], []
+        for _ in range(count):
+            wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.seeker)
+            WishStatus.objects.create(wish=wish, status=status)
+            speech = Speeches.objects.create(speech_title='Speech', speech_description='Description', created_by=self.seeker)
+            SpeechStatus.objects.create(speech=speech, status=status)
+            wishes.append(wish.pk)
+            speeches.append(speech.pk)
+        return wishes, speeches
+
+    def bulk_pick(self, user, wish_ids=(), speech_ids=()):
+        payload = {'user_id': user.pk, 'wish_ids': list(wish_ids), 'speech_ids': list(speech_ids)}
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.post(reverse('bulk_pick'), json.dumps(payload), content_type='application/json')
+        return response, len(context.captured_queries)
+
+    def test_outcomes(self):
+        wishes, speeches = self.items(3)
+        self.client.post(reverse('pick_wish'), json.dumps({'wish_id': wishes[0], 'user_id': self.volunteers[0].pk}), content_type='application/json')
+        no_status = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.seeker)
+
+        response, _ = self.bulk_pick(self.volunteers[0], [*wishes, no_status.pk, 999, wishes[1]], speeches[:1])
+        self.assertEqual(response.status_code, 200)
+        data = response.json()['data']
+        self.assertEqual(data['picked'], 4)
+        self.assertEqual([(result['type'], result['id'], result['outcome']) for result in data['results']], [
+            ('wish', wishes[0], 'already_picked'), ('wish', wishes[1], 'picked'), ('wish', wishes[2], 'picked'),
+            ('wish', no_status.pk, 'picked'), ('wish', 999, 'not_found'), ('speech', speeches[0], 'picked'),
+        ])
+        self.assertEqual(WishStatus.objects.filter(picked_by=self.volunteers[0], status='In-Progress').count(), 4)
+
+    def test_query_count_does_not_depend_on_item_count(self):
+        few = self.items(2)
+        many = self.items(30)
+        _, few_queries = self.bulk_pick(self.volunteers[0], *few)
+        response, many_queries = self.bulk_pick(self.volunteers[0], *many)
+        self.assertEqual(response.json()['data']['picked'], 60)
+        self.assertEqual(few_queries, many_queries)
+
+    def test_status_rows_are_locked_in_pk_order(self):
+        wishes, _ = self.items(3)
+        with CaptureQueriesContext(connection) as context:
+            self.bulk_pick(self.volunteers[0], reversed(wishes))
+        lock = next(query['sql'] for query in context.captured_queries if query['sql'].startswith('SELECT "social_connect_app_wishstatus"."wish_id"'))
+        self.assertTrue(lock.endswith('ORDER BY "social_connect_app_wishstatus"."id" ASC'), lock)
+
+    def test_counters_match_recompute(self):
+        created = self.items(2)
+        completed = self.items(2, status='Completed')
+        for wish_id in completed[0]:
+            WishStatus.objects.get(wish_id=wish_id).picked_by.add(self.volunteers[1])
+        recompute_all()
+
+        self.bulk_pick(self.volunteers[0], created[0] + completed[0], created[1])
+        counters = list(UserStats.objects.order_by('user_id').values_list('wishes_pending', 'wishes_fulfilled', 'speeches_pending'))
+        recompute_all()
+        self.assertEqual(counters, list(UserStats.objects.order_by('user_id').values_list('wishes_pending', 'wishes_fulfilled', 'speeches_pending')))
+        self.assertEqual(UserStats.objects.get(user=self.volunteers[1]).wishes_pending, 2)
+
+    def test_invalid_requests(self):
+        wishes, _ = self.items(1)
+        self.assertEqual(self.bulk_pick(SeekersInstitutes(pk=999), wishes)[0].status_code, 400)
+        self.assertEqual(self.bulk_pick(self.volunteers[0])[0].status_code, 400)
+        self.assertEqual(self.bulk_pick(self.volunteers[0], ['x'])[0].status_code, 400)
+        self.assertEqual(self.bulk_pick(self.volunteers[0], range(MAX_BULK_ITEMS + 1))[0].status_code, 400)
+
+    def test_malformed_ids_are_rejected(self):
+        wishes, _ = self.items(1)
+        for payload in (
+            {'user_id': 'abc', 'wish_ids': wishes},
+            {'user_id': {}, 'wish_ids': wishes},
+            {'user_id': True, 'wish_ids': wishes},
+            {'user_id': self.volunteers[0].pk, 'wish_ids': [True]},
+            [self.volunteers[0].pk],
+        ):
+            with self.subTest(payload=payload):
+                response = self.client.post(reverse('bulk_pick'), json.dumps(payload), content_type='application/json')
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(WishStatus.objects.filter(picked_by__isnull=False).exists())
+
+
+class ItemStatusColumnTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.seeker = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.volunteers = [SeekersInstitutes.objects.create(email=f'v{index}@example.com', first_name='Volunteer') for index in range(3)]
+
+    def post(self, name, payload):
+        return self.client.post(reverse(name), json.dumps(payload), content_type='application/json')
+
+    def columns(self, item):
+        item.refresh_from_db()
+        return item.status, item.pick_count, item.is_picked
+
+    def assert_matches_status_rows(self):
+        for model, item_type in ((Wishes, 'wish'), (Speeches, 'speech')):
+            for item in model.objects.select_related(f'{item_type}_status'):
+                item_status = getattr(item, f'{item_type}_status', None)
+                pickers = item_status.picked_by.count() if item_status else 0
+                self.assertEqual((item.status, item.pick_count, item.is_picked),
+                                 (item_status.status if item_status else None, pickers, pickers > 0))
+
+    def test_views_keep_columns_in_step(self):
+        wish_id = self.post('create_wish', {'wish_title': 'Wish', 'wish_description': 'Description', 'user_id': self.seeker.pk}).json()['data']['wish_id']
+        speech_id = self.post('create_speech', {'speech_title': 'Speech', 'speech_description': 'Description', 'user_id': self.seeker.pk}).json()['data']['speech_id']
+        wish = Wishes.objects.get(pk=wish_id)
+        self.assertEqual(self.columns(wish), ('Created', 0, False))
+
+        self.post('pick_wish', {'wish_id': wish_id, 'user_id': self.volunteers[0].pk})
+        self.post('pick_wish', {'wish_id': wish_id, 'user_id': self.volunteers[0].pk})
+        self.post('bulk_pick', {'user_id': self.volunteers[1].pk, 'wish_ids': [wish_id], 'speech_ids': [speech_id]})
+        self.assertEqual(self.columns(wish), ('In-Progress', 2, True))
+
+        social = SocialMedia.objects.create(wish=wish, user=self.volunteers[0], url=['https://example.com/post'])
+        self.post('change_status', {'social_id': social.pk, 'wish_id': wish_id})
+        self.assertEqual(self.columns(wish), ('Completed', 2, True))
+        self.assert_matches_status_rows()
+
+        data = self.client.get(reverse('wish-details', args=[wish_id])).json()['data']
+        self.assertEqual((data['status'], data['pick_count'], data['is_picked']), ('Completed', 2, True))
+        events = self.client.get(reverse('event'), {'isCompleted': 'true'}).json()['data']['items']
+        self.assertEqual([item['social_media_id'] for item in events], [social.pk])
+
+    def test_picker_writes_through_the_orm(self):
+        wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.seeker)
+        wish_status = WishStatus.objects.create(wish=wish)
+        speech = Speeches.objects.create(speech_title='Speech', speech_description='Description', created_by=self.seeker)
+        SpeechStatus.objects.create(speech=speech, status='In-Progress').picked_by.add(*self.volunteers)
+        self.assertEqual(self.columns(speech), ('In-Progress', 3, True))
+
+        wish_status.picked_by.add(*self.volunteers[:2])
+        self.volunteers[2].picked_wish_statuses.add(wish_status)
+        self.assertEqual(self.columns(wish)[1:], (3, True))
+        wish_status.picked_by.remove(self.volunteers[0])
+        self.volunteers[1].picked_wish_statuses.clear()
+        self.volunteers[2].delete()
+        self.assertEqual(self.columns(wish)[1:], (0, False))
+        self.assertEqual(self.columns(speech)[1:], (2, True))
+        self.assert_matches_status_rows()
+
+        SpeechStatus.objects.get(speech=speech).picked_by.clear()
+        WishStatus.objects.filter(wish=wish).delete()
+        self.assertEqual(self.columns(speech)[1:], (0, False))
+        self.assertEqual(self.columns(wish), (None, 0, False))
+
+    def test_saving_a_stale_instance_keeps_the_columns(self):
+        wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=self.seeker)
+        WishStatus.objects.create(wish=wish)
+        stale = Wishes.objects.get(pk=wish.pk)
+        self.post('pick_wish', {'wish_id': wish.pk, 'user_id': self.volunteers[0].pk})
+
+        stale.wish_title = 'Renamed'
+        stale.save()
+        self.assertEqual(self.columns(wish), ('In-Progress', 1, True))
+        self.assertEqual(wish.wish_title, 'Renamed')
+
+
+class QueryPlanTests(TestCase):
+    """The hot listing and lookup queries of the views, read with EXPLAIN."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        for index in range(5):
+            wish = Wishes.objects.create(wish_title='Wish', wish_description='Description', created_by=cls.user, category='Education')
+            WishStatus.objects.create(wish=wish, status='Completed' if index % 2 else 'Created')
+            speech = Speeches.objects.create(speech_title='Speech', speech_description='Description', created_by=cls.user, category='Music')
+            SocialMedia.objects.create(wish=wish, speech=speech, user=cls.user)
+
+    def hot_queries(self):
+        return {
+            'list_wishes': (Wishes.objects.order_by('created_date', 'wish_id')[10:20], 'wishes_created_idx'),
+            'list_speeches': (Speeches.objects.order_by('created_date', 'speech_id')[10:20], 'speeches_created_idx'),
+            'wish_by_category': (Wishes.objects.filter(category_key='education').order_by('created_date', 'wish_id')[:10], 'wishes_category_created_idx'),
+            'speeches_by_category': (Speeches.objects.filter(category_key='music').order_by('created_date', 'speech_id')[:10], 'speeches_category_created_idx'),
+            'user_wishes': (Wishes.objects.filter(created_by=self.user).order_by('-created_date', '-wish_id')[:10], 'wishes_creator_created_idx'),
+            'summary_speeches': (Speeches.objects.filter(created_by=self.user).order_by('-created_date', '-pk')[:10], 'speeches_creator_created_idx'),
+            'event': (SocialMedia.objects.select_related('wish', 'speech').order_by('created_date', 'social_media_id')[:10], 'socialmedia_created_idx'),
+            # Indexes Django names itself: status, the foreign key, unique email.
+            'event_speech': (SocialMedia.objects.filter(speech__status='Completed'), None),
+            'get_fulfill_details': (SocialMedia.objects.filter(wish_id=1), None),
+            'check_user_exists': (SeekersInstitutes.objects.filter(email='seeker@example.com'), None),
+        }
+
+    def explain(self, queryset):
+        if connection.vendor != 'postgresql':
+            return queryset.explain()
+        # Tiny tables are cheaper to scan; ask which index the query can use.
+        with connection.cursor() as cursor:
+            cursor.execute('SET enable_seqscan = off')
+            try:
+                return queryset.explain()
+            finally:
+                cursor.execute('RESET enable_seqscan')
+
+    def test_hot_queries_use_an_index(self):
+        if connection.vendor not in ('sqlite', 'postgresql'):
+            self.skipTest('plans are only read on SQLite and PostgreSQL')
+        for name, (queryset, index) in self.hot_queries().items():
+            with self.subTest(route=name):
+                plan = self.explain(queryset)
+                self.assertIn(index or ('INDEX' if connection.vendor == 'sqlite' else 'Index'), plan)
+                self.assertNotIn('TEMP B-TREE', plan)
+                self.assertNotIn('Seq Scan', plan)
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = SeekersInstitutes.objects.create(email='seeker@example.com', first_name='Seeker')
+        cls.wishes = []
+        for index in range(5):
+            wish = Wishes.objects.create(wish_title=f'Wish {index}', wish_description='Line one\nline "two", three', created_by=cls.user, category='Education')
+            SocialMedia.objects.create(wish=wish, user=cls.user, url=['https://example.com/a', 'https://example.com/b'])
+            cls.wishes.append(wish)
+        Wishes.objects.filter(pk__in=[wish.pk for wish in cls.wishes[:2]]).update(created_date='2023-06-01T00:00:00Z')
+
+    def export(self, **params):
+        response = self.client.get(reverse('export'), params)
+        content = b''.join(response.streaming_content) if response.streaming else response.content
+        return response, content.decode()
+
+    def test_ndjson(self):
+        response, content = self.export()
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="wishes.ndjson"')
+        rows = [json.loads(line) for line in content.splitlines()]
+        self.assertEqual([row['wish_id'] for row in rows], [wish.pk for wish in self.wishes])
+        self.assertEqual(rows[0]['created_by_id'], self.user.pk)
+        self.assertEqual(rows[0]['wish_description'], 'Line one\nline "two", three')
+        self.assertEqual(rows[0]['created_date'], '2023-06-01T00:00:00Z')
+
+    def test_csv(self):
+        response, content = self.export(type='fulfillments', format='csv')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        header, *rows = csv.reader(io.StringIO(content))
+        self.assertEqual(header, [field.attname for field in SocialMedia._meta.concrete_fields])
+        self.assertEqual(len(rows), 5)
+        row = dict(zip(header, rows[0]))
+        self.assertEqual(json.loads(row['url']), ['https://example.com/a', 'https://example.com/b'])
+        self.assertEqual(row['speech_id'], '')
+
+        _, content = self.export(format='csv')
+        self.assertEqual(list(csv.reader(io.StringIO(content)))[1][2], 'Line one\nline "two", three')
+
+    def test_since(self):
+        for since in ('2024-01-01', '2024-01-01T00:00:00+05:30'):
+            rows = self.export(since=since)[1].splitlines()
+            self.assertEqual([json.loads(line)['wish_id'] for line in rows], [wish.pk for wish in self.wishes[2:]])
+
+    def test_invalid_requests(self):
+        for params in ({'type': 'users'}, {'format': 'xml'}, {'since': 'yesterday'}, {'since': '2024-13-45'}):
+            with self.subTest(params=params):
+                self.assertEqual(self.export(**params)[0].status_code, 400)
+
+    def test_streams_in_chunks_with_one_query(self):
+        with CaptureQueriesContext(connection) as context:
+            chunks = list(export.stream('speeches', 'csv')) + list(export.stream('wishes', 'ndjson', chunk_size=2))
+        self.assertEqual(len(context.captured_queries), 2)
+        self.assertEqual([chunk.count(b'\n') for chunk in chunks], [1, 2, 2, 1])
+
+    async def test_async_view_matches_the_sync_view(self):
+        for params in ({}, {'type': 'fulfillments', 'format': 'csv', 'since': '2024-01-01'}, {'format': 'xml'}):
+            with self.subTest(params=params):
+                expected = await sync_to_async(views.export_view)(RequestFactory().get('/export/', params))
+                response = await async_views.export_view(AsyncRequestFactory().get('/export/', params))
+                self.assertEqual(response.status_code, expected.status_code)
+                if response.streaming:
+                    content = b''.join([chunk async for chunk in response.streaming_content])
+                    self.assertEqual(content, await sync_to_async(b''.join)(expected.streaming_content))
+                else:
+                    self.assertEqual(response.content, expected.content)
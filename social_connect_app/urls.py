@@ -1,35 +1,51 @@
 # social_connect_app/urls.py
 
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# Read-heavy endpoints are served by their async twins under ASGI.
+if settings.ASYNC_VIEWS:
+    from . import async_views as read_views
+else:
+    read_views = views
+
 urlpatterns = [
     path('create-user/', views.create_user, name='create_user'),
     path('create-wish/', views.create_wish, name='create_wish'), 
     path('create-speech/', views.create_speech, name='create_speech'),
+    path('bulk-create-wish/', views.bulk_create_wish, name='bulk_create_wish'),
+    path('bulk-create-speech/', views.bulk_create_speech, name='bulk_create_speech'),
     path('pick-wish/', views.pick_wish, name='pick_wish'),
     path('pick-speech/', views.pick_speech, name='pick_speech'), 
-    path('wishes/', views.list_wishes, name='list_wishes'),
-    path('speeches/', views.list_speeches, name='list_speeches'),
+    path('bulk-pick/', views.bulk_pick, name='bulk_pick'),
+    path('wishes/', read_views.list_wishes, name='list_wishes'),
+    path('speeches/', read_views.list_speeches, name='list_speeches'),
     path('wish-by-category/<str:category>/', views.wish_by_category, name='wish_by_category'),
     path('user-wish/<int:user_id>/', views.user_wishes, name='user_wishes'),
     path('wishes-by-location/', views.wishes_by_location_view, name='wishes_by_location'),
     path('already-user/', views.check_user_exists, name='check_user_exists'),
     path('change-status/', views.change_status, name='change_status'),
-    path('categories/', views.get_categories, name='categories'),
-    path('wishes/<int:wishID>/', views.get_wish_details, name='wish-details'),
+    path('categories/', read_views.get_categories, name='categories'),
+    path('wishes/<int:wishID>/', read_views.get_wish_details, name='wish-details'),
     path('user-speech/<int:userID>/', views.get_user_speeches, name='user-speeches'),
-    path('speeches/<int:speechID>/', views.get_speech_details, name='speech-details'),
+    path('speeches/<int:speechID>/', read_views.get_speech_details, name='speech-details'),
     path('fulfill/', views.create_social_media_post, name='fulfill'),
-    path('event/', views.event, name='event'),
+    path('event/', read_views.event, name='event'),
     path('event/<str:event_type>/<int:event_id>/', views.event_by_id, name='event_by_id'),
     path('user/<int:userID>/', views.user_details, name='user_details'),
     path('speech-by-category/<category>/', views.speeches_by_category, name='speeches_by_category'),
     path('speech-by-location/', views.speeches_by_location_view, name='speeches_by_location'),
+    path('nearest/', views.nearest_view, name='nearest'),
+    path('search/', views.search_view, name='search'),
+    path('suggest/', views.suggest_view, name='suggest'),
+    path('export/', read_views.export_view, name='export'),
     path('update-user/<int:user_id>/', views.update_user, name='update_user'),
     path('get-fulfill-details/', views.get_fulfill_details, name='get_fulfill_details'),
     path('get-fulfill-details/<int:socialMediaID>/', views.get_social_media, name='get_social_media'),
     path('get-user-summary/<int:userId>/', views.get_user_summary, name='get-user-summary'),
+    path('user-stats/<int:user_id>/', views.user_stats, name='user_stats'),
+    path('metrics/', views.metrics_view, name='metrics'),
     path('sign-up-user/', views.sign_up_user_view, name='sign_up_user'),
     path('sign-in-user/', views.sign_in_view, name='sign_in_user'),
     path('sign-out/', views.sign_out_view, name='sign_out'),
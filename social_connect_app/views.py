@@ -1,112 +1,125 @@
 # social_connect_app/views.py
 
 from django.forms import model_to_dict
-from django.http import JsonResponse, Http404
+from django.http import Http404, HttpResponse, StreamingHttpResponse
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_POST
-from django.views.decorators.http import require_GET
-from math import radians, sin, cos, sqrt, atan2
+from django.views.decorators.http import require_GET, condition
 from django.shortcuts import get_object_or_404 
-from django.db.models import Q
-from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, SocialMedia 
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Q, Prefetch
+from .models import SeekersInstitutes, Wishes, Speeches, WishStatus, SpeechStatus, SocialMedia, UserStats, category_key 
+from .distance import ids_within_radius, nearest_ids
+from .pagination import cursor_page, InvalidCursor
+from .search import search
+from . import suggest
+from . import export
+from .stats import record_created, record_status_change
+from .picks import lock_status, pick, pick_many
+from .categories import get_cached_categories, adjust_category_count
+from .object_cache import get_payload, get_payloads
+from . import metrics
+from .rendering import (
+    FastJsonResponse, USER_PLAN, USER_BACKEND_PLAN, WISH_PLAN, SPEECH_PLAN, SOCIAL_MEDIA_PLAN,
+    WISH_SUMMARY_PLAN, SPEECH_SUMMARY_PLAN,
+)
 import json
+from collections import Counter
 from django.views.decorators.http import require_http_methods
 from django.contrib.auth.models import User
 from django.contrib.auth import authenticate, login
 
 
-def social_media_to_dict(social_media):
-    data = {
-        'social_media_id': social_media.social_media_id,
-        'user_id': social_media.user_id,
-        'url': social_media.url,
-        'created_date': social_media.created_date,
-        'description': social_media.description,
-        'platform': social_media.platform,
-        'wish': {
-            'wish_title': social_media.wish.wish_title if social_media.wish else None
-        },
-        'speech': {
-            'speech_title': social_media.speech.speech_title if social_media.speech else None
-        }
-    }
-    return data
+social_media_to_dict = SOCIAL_MEDIA_PLAN.render
 
+user_to_dict = USER_PLAN.render
 
+user_backend_to_dict = USER_BACKEND_PLAN.render
 
+wish_to_dict = WISH_PLAN.render
 
-def user_to_dict(user):
-    return {
-        'user_id': user.user_id,
-        'email': user.email,
-        'picture': user.picture,
-        'first_name': user.first_name,
-        'last_name': user.family_name
-    }
+speech_to_dict = SPEECH_PLAN.render
 
 
 
-def user_backend_to_dict(user):
-    return {
-        'user_id': user.user_id,
-        'email': user.email,
-        'is_mail_verified': user.is_mail_verified,
-        'first_name': user.first_name,
-        'phone_no': user.phone_no,
-        'is_institute': user.is_institute,
-        'institute_reg_number': user.institute_reg_number,
-        'given_name': user.given_name,
-        'address': user.address,
-        'location': user.location,
-        'about': user.about,
-        'institute_details': user.institute_details,
-        'family_name': user.family_name,
-        'link': user.link,
-        'picture': user.picture,
-        'locale': user.locale,
-        'had': None,  # This field is not in the original model, adjust as needed
-        'latitude': user.latitude,
-        'longitude': user.longitude,
-    }
+# Fields read by user_to_dict(); picked_by users are prefetched with only these.
+USER_SUMMARY_FIELDS = ('user_id', 'email', 'picture', 'first_name', 'family_name')
 
 
-def wish_to_dict(wish):
-    return {
-        'wish_id': wish.wish_id,
-        'wish_title': wish.wish_title,
-        'wish_description': wish.wish_description,
-        'created_by': user_to_dict(wish.created_by),
-        'picked_by': [user_to_dict(user) for user in wish.wish_status.picked_by.all()] if hasattr(wish, 'wish_status') else [],
-        'is_picked': wish.is_picked == 'true',
-        'status': wish.wish_status.status if hasattr(wish, 'wish_status') else None,
-        'is_verified': wish.is_verified,
-        'category': wish.category,
-        'location': wish.location,
-        'latitude': wish.latitude,
-        'longitude': wish.longitude,
-        'created_date': wish.created_date.strftime('%Y-%m-%d %H:%M:%S'),
-    }
+def picked_by_prefetch(lookup):
+    return Prefetch(lookup, queryset=SeekersInstitutes.objects.only(*USER_SUMMARY_FIELDS))
 
 
+def wish_queryset():
+    return Wishes.objects.select_related('wish_status', 'created_by').prefetch_related(
+        picked_by_prefetch('wish_status__picked_by')
+    )
 
-def speech_to_dict(speech):
-    return {
-        'speech_id': speech.speech_id,
-        'speech_title': speech.speech_title,
-        'speech_description': speech.speech_description,
-        'created_by': user_to_dict(speech.created_by),
-        'picked_by': [user_to_dict(user) for user in speech.speech_status.picked_by.all()] if hasattr(speech, 'speech_status') else [],
-        'is_picked': speech.is_picked == 'true',
-        'status': speech.speech_status.status if hasattr(speech, 'speech_status') else None,
-        'is_verified': speech.is_verified,
-        'category': speech.category,
-        'location': speech.location,
-        'latitude': speech.latitude,
-        'longitude': speech.longitude,
-        'platform_url': speech.platform_url,
-        'created_date': speech.created_date.strftime('%Y-%m-%d %H:%M:%S'),
-    }
+
+def speech_queryset():
+    return Speeches.objects.select_related('speech_status', 'created_by').prefetch_related(
+        picked_by_prefetch('speech_status__picked_by')
+    )
+
+
+def load_wishes(pks):
+    return {wish.pk: wish_to_dict(wish) for wish in wish_queryset().filter(pk__in=pks)}
+
+
+def load_speeches(pks):
+    return {speech.pk: speech_to_dict(speech) for speech in speech_queryset().filter(pk__in=pks)}
+
+
+# Serialized wishes/speeches for a page of pks, in order; only cache misses
+# are loaded from the database (see object_cache).
+def wish_payloads(pks):
+    return get_payloads('wish', pks, load_wishes)
+
+
+def speech_payloads(pks):
+    return get_payloads('speech', pks, load_speeches)
+
+
+def wish_page(items):
+    return wish_payloads([item.pk for item in items])
+
+
+def speech_page(items):
+    return speech_payloads([item.pk for item in items])
+
+
+def social_media_page(items):
+    return [social_media_to_dict(item) for item in items]
+
+
+def parse_id(value):
+    """
+    Positive integer id from a JSON int or a string of digits; None for
+    anything else, including booleans (True would otherwise be id 1).
+    """
+    if type(value) is int:
+        return value if value > 0 else None
+    if isinstance(value, str) and value.isascii() and value.isdigit():
+        return int(value) or None
+    return None
+
+
+def cursor_response(request, queryset, render_page, descending=False):
+    try:
+        items, next_cursor = cursor_page(queryset, request.GET.get('cursor'), 10, descending)
+    except InvalidCursor as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    return FastJsonResponse({
+        'success': True,
+        'data': {
+            'items': render_page(items),
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }
+    })
 
 
 
@@ -118,7 +131,7 @@ def create_user(request):
     try:
         data = json.loads(request.body)
     except json.JSONDecodeError as e:
-        return JsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
     
     # Extract data from JSON payload
     email = data.get('email')
@@ -141,7 +154,7 @@ def create_user(request):
 
     # Validate required fields
     if not email or not first_name:
-        return JsonResponse({'success': False, 'error': 'Email and First Name are required'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Email and First Name are required'}, status=400)
 
     # Validate and create the user
     try:
@@ -164,9 +177,9 @@ def create_user(request):
             longitude=longitude,
             extra_field=extra_field
         )
-        return JsonResponse({'success': True, 'data': {'message': 'User created successfully', 'user_id': user.user_id}}, status=201)
+        return FastJsonResponse({'success': True, 'data': {'message': 'User created successfully', 'user_id': user.user_id}}, status=201)
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
     
 
 @csrf_exempt
@@ -176,7 +189,7 @@ def create_wish(request):
     try:
         data = json.loads(request.body)
     except json.JSONDecodeError as e:
-        return JsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
 
     
     # Extract data from JSON payload
@@ -190,7 +203,7 @@ def create_wish(request):
 
     # Validate required fields
     if not wish_title or not wish_description or not user_id:
-        return JsonResponse({'success': False, 'error': 'Wish Title, Wish Description, and User ID are required'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Wish Title, Wish Description, and User ID are required'}, status=400)
 
 
     # Create the wish and its status
@@ -198,32 +211,34 @@ def create_wish(request):
         # Assuming you have a method to fetch the user object from user_id
         user = SeekersInstitutes.objects.get(pk=user_id)
         
-        # Create the wish
-        wish = Wishes.objects.create(
-            wish_title=wish_title,
-            wish_description=wish_description,
-            created_by=user,
-            category=category,
-            location=location,
-            latitude=latitude,
-            longitude=longitude
-        )
+        with transaction.atomic():
+            # Create the wish
+            wish = Wishes.objects.create(
+                wish_title=wish_title,
+                wish_description=wish_description,
+                created_by=user,
+                category=category,
+                location=location,
+                latitude=latitude,
+                longitude=longitude
+            )
         
-        # Create the wish status
-        WishStatus.objects.create(
-            wish=wish,
-            status='Created'  # Default status when wish is created
-        )
-
-        return JsonResponse({'success': True, 'data': {'message': 'Wish created successfully', 'wish_id': wish.wish_id}}, status=201)
+            # Create the wish status
+            WishStatus.objects.create(
+                wish=wish,
+                status='Created'  # Default status when wish is created
+            )
+            record_created('wishes', user.pk)
+
+        return FastJsonResponse({'success': True, 'data': {'message': 'Wish created successfully', 'wish_id': wish.wish_id}}, status=201)
     
 
     except SeekersInstitutes.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'User does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'User does not exist'}, status=404)
 
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
 
@@ -234,7 +249,7 @@ def create_speech(request):
     try:
         data = json.loads(request.body)
     except json.JSONDecodeError as e:
-        return JsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
     
     # Extract data from JSON payload
     speech_title = data.get('speech_title')
@@ -248,7 +263,7 @@ def create_speech(request):
 
     # Validate required fields
     if not speech_title or not speech_description or not user_id:
-        return JsonResponse({'success': False, 'error': 'Speech Title, Speech Description, and User ID are required'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Speech Title, Speech Description, and User ID are required'}, status=400)
 
 
     # Create the speech and its status
@@ -256,32 +271,146 @@ def create_speech(request):
         # Assuming you have a method to fetch the user object from user_id
         user = SeekersInstitutes.objects.get(pk=user_id)
         
-        # Create the speech
-        speech = Speeches.objects.create(
-            speech_title=speech_title,
-            speech_description=speech_description,
-            created_by=user,
-            category=category,
-            location=location,
-            latitude=latitude,
-            longitude=longitude,
-            platform_url=platform_url
-        )
+        with transaction.atomic():
+            # Create the speech
+            speech = Speeches.objects.create(
+                speech_title=speech_title,
+                speech_description=speech_description,
+                created_by=user,
+                category=category,
+                location=location,
+                latitude=latitude,
+                longitude=longitude,
+                platform_url=platform_url
+            )
         
-        # Create the speech status
-        SpeechStatus.objects.create(
-            speech=speech,
-            status='Created'  # Default status when speech is created
-        )
+            # Create the speech status
+            SpeechStatus.objects.create(
+                speech=speech,
+                status='Created'  # Default status when speech is created
+            )
+            record_created('speeches', user.pk)
 
-        return JsonResponse({'success': True, 'data': {'message': 'Speech created successfully', 'speech_id': speech.speech_id}}, status=201)
+        return FastJsonResponse({'success': True, 'data': {'message': 'Speech created successfully', 'speech_id': speech.speech_id}}, status=201)
 
     
     except SeekersInstitutes.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'User does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'User does not exist'}, status=404)
 
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+# Upper bound on the number of items accepted by one bulk-create request.
+MAX_BULK_ITEMS = 500
+
+
+def bulk_create_items(request, model, status_model, item_type, kind, fields):
+    """
+    Shared body of bulk-create-wish/ and bulk-create-speech/: validates every
+    item of the JSON array, resolves all creators with one query and inserts
+    the valid items and their status rows with bulk_create() in a single
+    transaction. Invalid items are reported and skipped.
+    """
+    label = item_type.capitalize()
+
+    try:
+        items = json.loads(request.body)
+    except json.JSONDecodeError as e:
+        return FastJsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
+
+    if not isinstance(items, list) or not items:
+        return FastJsonResponse({'success': False, 'error': 'Request body must be a non-empty array'}, status=400)
+    if len(items) > MAX_BULK_ITEMS:
+        return FastJsonResponse({'success': False, 'error': f'At most {MAX_BULK_ITEMS} items can be created at once'}, status=400)
+
+    users = SeekersInstitutes.objects.in_bulk({parse_id(item.get('user_id')) for item in items if isinstance(item, dict)} - {None})
+
+    results, objects = [], []
+    for index, item in enumerate(items):
+        if not isinstance(item, dict):
+            results.append({'index': index, 'success': False, 'error': 'Item must be an object'})
+            continue
+
+        if not item.get(f'{item_type}_title') or not item.get(f'{item_type}_description') or not item.get('user_id'):
+            results.append({'index': index, 'success': False, 'error': f'{label} Title, {label} Description, and User ID are required'})
+            continue
+
+        user_id = parse_id(item['user_id'])
+        if user_id is None:
+            results.append({'index': index, 'success': False, 'error': 'Invalid User ID'})
+            continue
+        user = users.get(user_id)
+        if user is None:
+            results.append({'index': index, 'success': False, 'error': 'User does not exist'})
+            continue
+
+        obj = model(created_by=user, **{field: item.get(field) for field in fields})
+        try:
+            obj.full_clean(exclude=['created_by'], validate_unique=False, validate_constraints=False)
+        except ValidationError as e:
+            error = '; '.join(f'{field}: {" ".join(messages)}' for field, messages in e.message_dict.items())
+            results.append({'index': index, 'success': False, 'error': error})
+            continue
+
+        obj.set_derived_fields()
+        objects.append(obj)
+        results.append({'index': index, 'success': True})
+
+    if not objects:
+        return FastJsonResponse({'success': False, 'error': f'No valid {kind} to create', 'data': {'created': 0, 'failed': len(results), 'results': results}}, status=400)
+
+    try:
+        with transaction.atomic():
+            created = model.objects.bulk_create(objects)
+            status_model.objects.bulk_create([status_model(**{item_type: obj}, status='Created') for obj in created])
+
+            # bulk_create() skips save() and the post_save signals, so the
+            # counters those would have maintained are updated here.
+            for user_id, count in Counter(obj.created_by_id for obj in created).items():
+                record_created(kind, user_id, count)
+            categories = {}
+            for obj in created:
+                if obj.category_key:
+                    name, count = categories.get(obj.category_key, (obj.category, 0))
+                    categories[obj.category_key] = (name, count + 1)
+            for name, count in categories.values():
+                adjust_category_count(name, f'{item_type}_count', count)
+            transaction.on_commit(lambda: suggest.update([
+                (field, value, 1)
+                for obj in created
+                for field, value in (('title', getattr(obj, f'{item_type}_title')), ('category', obj.category), ('location', obj.location))
+            ]))
+
+    except Exception as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+    created = iter(created)
+    for result in results:
+        if result['success']:
+            result[f'{item_type}_id'] = next(created).pk
+
+    return FastJsonResponse({'success': True, 'data': {
+        'created': len(objects),
+        'failed': len(results) - len(objects),
+        'results': results
+    }}, status=201)
+
+
+@csrf_exempt
+@require_POST
+def bulk_create_wish(request):
+    return bulk_create_items(request, Wishes, WishStatus, 'wish', 'wishes', [
+        'wish_title', 'wish_description', 'category', 'location', 'latitude', 'longitude'
+    ])
+
+
+@csrf_exempt
+@require_POST
+def bulk_create_speech(request):
+    return bulk_create_items(request, Speeches, SpeechStatus, 'speech', 'speeches', [
+        'speech_title', 'speech_description', 'category', 'location', 'latitude', 'longitude', 'platform_url'
+    ])
 
 
 @csrf_exempt
@@ -291,7 +420,7 @@ def pick_wish(request):
     try:
         data = json.loads(request.body)
     except json.JSONDecodeError as e:
-        return JsonResponse({'error': 'Invalid JSON format'}, status=400)
+        return FastJsonResponse({'error': 'Invalid JSON format'}, status=400)
     
     # Extract data from JSON payload
     wish_id = data.get('wish_id')
@@ -299,36 +428,22 @@ def pick_wish(request):
 
     # Validate required fields
     if not wish_id or not user_id:
-        return JsonResponse({'error': 'Wish ID and User ID are required'}, status=400)
+        return FastJsonResponse({'error': 'Wish ID and User ID are required'}, status=400)
 
     try:
-        # Fetch the wish object
-        wish = Wishes.objects.get(wish_id=wish_id)
-
-        # Check if the user has already picked this wish
-        wish_status, created = WishStatus.objects.get_or_create(wish=wish)
-        if SeekersInstitutes.objects.filter(pk=user_id).exists():
-            user = SeekersInstitutes.objects.get(pk=user_id)
-            if user in wish_status.picked_by.all():
-                return JsonResponse( {'success': False, 'error': 'User has already picked this wish'}, status=400)
-        else:
-            return JsonResponse( {'success': False, 'error': 'Invalid User ID'}, status=400)
+        if not pick(WishStatus, wish_id, user_id):
+            return FastJsonResponse( {'success': False, 'error': 'User has already picked this wish'}, status=400)
 
-        # Update WishStatus and pick the wish
-        wish_status.status = 'In-Progress'
-        wish.is_picked = 'true'
-        
-        # Add the user to picked_by field
-        wish_status.picked_by.add(user)
-        wish_status.save()
-
-        return JsonResponse( {'success': True, 'data': {'message': 'Wish picked successfully', 'wish_id': wish_id}}, status=200)
+        return FastJsonResponse( {'success': True, 'data': {'message': 'Wish picked successfully', 'wish_id': wish_id}}, status=200)
     
     except Wishes.DoesNotExist:
-        return JsonResponse( { 'success': False, 'error': 'Wish does not exist'}, status=404)
+        return FastJsonResponse( { 'success': False, 'error': 'Wish does not exist'}, status=404)
+
+    except SeekersInstitutes.DoesNotExist:
+        return FastJsonResponse( {'success': False, 'error': 'Invalid User ID'}, status=400)
     
     except Exception as e:
-        return JsonResponse ({ 'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({ 'success': False, 'error': str(e)}, status=500)
     
 
 @csrf_exempt
@@ -338,7 +453,7 @@ def pick_speech(request):
     try:
         data = json.loads(request.body)
     except json.JSONDecodeError as e:
-        return JsonResponse( {'success': False, 'error': 'Invalid JSON format'}, status=400)
+        return FastJsonResponse( {'success': False, 'error': 'Invalid JSON format'}, status=400)
     
     # Extract data from JSON payload
     speech_id = data.get('speech_id')
@@ -346,48 +461,88 @@ def pick_speech(request):
 
     # Validate required fields
     if not speech_id or not user_id:
-        return JsonResponse( {'success': False, 'error': 'Speech ID and User ID are required'}, status=400)
+        return FastJsonResponse( {'success': False, 'error': 'Speech ID and User ID are required'}, status=400)
 
     try:
-        # Fetch the speech object
-        speech = Speeches.objects.get(speech_id=speech_id)
+        if not pick(SpeechStatus, speech_id, user_id):
+            return FastJsonResponse( {'success': False, 'error': 'User has already picked this speech'}, status=400)
 
-        # Check if the user has already picked this speech
-        speech_status, created = SpeechStatus.objects.get_or_create(speech=speech)
-        if SeekersInstitutes.objects.filter(pk=user_id).exists():
-            user = SeekersInstitutes.objects.get(pk=user_id)
-            if user in speech_status.picked_by.all():
-                return JsonResponse( {'success': False, 'error': 'User has already picked this speech'}, status=400)
-        else:
-            return JsonResponse( {'success': False, 'error': 'Invalid User ID'}, status=400)
-
-        # Update SpeechStatus and pick the speech
-        speech_status.status = 'In-Progress'
-        speech.is_picked = 'true'
-        
-        # Add the user to picked_by field
-        speech_status.picked_by.add(user)
-        speech_status.save()
-
-        return JsonResponse( {'success': True, 'data': {'message': 'Speech picked successfully', 'speech_id': speech_id}}, status=200)
+        return FastJsonResponse( {'success': True, 'data': {'message': 'Speech picked successfully', 'speech_id': speech_id}}, status=200)
     
     except Speeches.DoesNotExist:
-        return JsonResponse( {'success': False, 'error': 'Speech does not exist'}, status=404)
+        return FastJsonResponse( {'success': False, 'error': 'Speech does not exist'}, status=404)
+
+    except SeekersInstitutes.DoesNotExist:
+        return FastJsonResponse( {'success': False, 'error': 'Invalid User ID'}, status=400)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
+@csrf_exempt
+@require_POST
+def bulk_pick(request):
+    """
+    Picks many wishes and speeches for one user:
+    {"user_id": 1, "wish_ids": [...], "speech_ids": [...]}. Each item gets an
+    outcome: picked, already_picked or not_found.
+    """
+    try:
+        data = json.loads(request.body)
+    except json.JSONDecodeError:
+        return FastJsonResponse({'success': False, 'error': 'Invalid JSON format'}, status=400)
+
+    if not isinstance(data, dict):
+        return FastJsonResponse({'success': False, 'error': 'Request body must be an object'}, status=400)
+
+    ids = {'wish': data.get('wish_ids') or [], 'speech': data.get('speech_ids') or []}
+    if not data.get('user_id') or not (ids['wish'] or ids['speech']):
+        return FastJsonResponse({'success': False, 'error': 'User ID and at least one wish or speech ID are required'}, status=400)
+    user_id = parse_id(data['user_id'])
+    if user_id is None:
+        return FastJsonResponse({'success': False, 'error': 'Invalid User ID'}, status=400)
+    # type() rather than isinstance(): JSON true/false must not become ids 1 and 0.
+    if not all(isinstance(values, list) and all(type(value) is int for value in values) for values in ids.values()):
+        return FastJsonResponse({'success': False, 'error': 'wish_ids and speech_ids must be arrays of integers'}, status=400)
+    if len(ids['wish']) + len(ids['speech']) > MAX_BULK_ITEMS:
+        return FastJsonResponse({'success': False, 'error': f'At most {MAX_BULK_ITEMS} items can be picked at once'}, status=400)
+
+    try:
+        outcomes = pick_many(user_id, {WishStatus: ids['wish'], SpeechStatus: ids['speech']})
+
+    except SeekersInstitutes.DoesNotExist:
+        return FastJsonResponse({'success': False, 'error': 'Invalid User ID'}, status=400)
+
+    except Exception as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+    results = [
+        {'type': item_type, 'id': item_id, 'outcome': outcome}
+        for item_type, status_model in (('wish', WishStatus), ('speech', SpeechStatus))
+        for item_id, outcome in outcomes.get(status_model, {}).items()
+    ]
+    return FastJsonResponse({
+        'success': True,
+        'data': {
+            'picked': sum(result['outcome'] == 'picked' for result in results),
+            'results': results
+        }
+    })
     
 
 @require_GET
 def list_wishes(request):
-    wishes = Wishes.objects.all().select_related('wish_status', 'created_by')
-    paginator = Paginator(wishes, 10)
+    wishes = Wishes.objects.order_by('created_date', 'wish_id')
+    if 'cursor' in request.GET:
+        return cursor_response(request, wishes.only('wish_id', 'created_date'), wish_page)
+
+    paginator = Paginator(wishes.values_list('wish_id', flat=True), 10)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
     
-    wishes_list = [wish_to_dict(wish) for wish in page_obj]
+    wishes_list = wish_payloads(page_obj)
 
-    return JsonResponse({
+    return FastJsonResponse({
         'success': True,
         'data': {
             'items': wishes_list,
@@ -402,14 +557,17 @@ def list_wishes(request):
 
 @require_GET
 def list_speeches(request):
-    speeches = Speeches.objects.all().select_related('speech_status', 'created_by')
-    paginator = Paginator(speeches, 10)
+    speeches = Speeches.objects.order_by('created_date', 'speech_id')
+    if 'cursor' in request.GET:
+        return cursor_response(request, speeches.only('speech_id', 'created_date'), speech_page)
+
+    paginator = Paginator(speeches.values_list('speech_id', flat=True), 10)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
     
-    speeches_list = [speech_to_dict(speech) for speech in page_obj]
+    speeches_list = speech_payloads(page_obj)
 
-    return JsonResponse({
+    return FastJsonResponse({
         'success': True,
         'data':  {
             'items': speeches_list,
@@ -425,14 +583,21 @@ def list_speeches(request):
 
 @require_GET
 def wish_by_category(request, category):
-    wishes = Wishes.objects.filter(category__iexact=category).select_related('wish_status', 'created_by').order_by('created_date')
-    paginator = Paginator(wishes, 10)
+    key = category_key(category)
+    if key is None:
+        # filter(category_key=None) would list every uncategorized wish.
+        return FastJsonResponse({'success': False, 'error': 'Category is required'}, status=400)
+    wishes = Wishes.objects.filter(category_key=key).order_by('created_date', 'wish_id')
+    if 'cursor' in request.GET:
+        return cursor_response(request, wishes.only('wish_id', 'created_date'), wish_page)
+
+    paginator = Paginator(wishes.values_list('wish_id', flat=True), 10)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
-    wishes_list = [wish_to_dict(wish) for wish in page_obj]
+    wishes_list = wish_payloads(page_obj)
 
-    return JsonResponse({
+    return FastJsonResponse({
         'success': True,
         'data': {
             'items': wishes_list,
@@ -448,14 +613,17 @@ def wish_by_category(request, category):
 @require_GET
 def user_wishes(request, user_id):
     try:
-        wishes = Wishes.objects.filter(created_by_id=user_id).select_related('wish_status', 'created_by').order_by('-created_date')
-        paginator = Paginator(wishes, 10)
+        wishes = Wishes.objects.filter(created_by_id=user_id).order_by('-created_date', '-wish_id')
+        if 'cursor' in request.GET:
+            return cursor_response(request, wishes.only('wish_id', 'created_date'), wish_page, descending=True)
+
+        paginator = Paginator(wishes.values_list('wish_id', flat=True), 10)
         page_number = request.GET.get('page', 1)
         page_obj = paginator.get_page(page_number)
 
-        wishes_list = [wish_to_dict(wish) for wish in page_obj]
+        wishes_list = wish_payloads(page_obj)
 
-        return JsonResponse({
+        return FastJsonResponse({
             'success': True,
             'data': {
                 'items': wishes_list,
@@ -467,17 +635,7 @@ def user_wishes(request, user_id):
         })
 
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
-
-
-def haversine(lat1, lon1, lat2, lon2):
-    R = 6371  # Radius of the Earth in km
-    dlat = radians(lat2 - lat1)
-    dlon = radians(lon2 - lon1)
-    a = sin(dlat / 2) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
-    c = 2 * atan2(sqrt(a), sqrt(1 - a))
-    distance = R * c
-    return distance
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
 @require_GET
@@ -487,20 +645,12 @@ def wishes_by_location_view(request):
         longitude = float(request.GET.get('longitude'))
         radius = float(request.GET.get('radius', 10))
     except (TypeError, ValueError):
-        return JsonResponse({'success': False, 'error': 'Invalid or missing latitude, longitude, or radius parameters'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Invalid or missing latitude, longitude, or radius parameters'}, status=400)
 
-    wishes = Wishes.objects.all().select_related('wish_status', 'created_by')
-    nearby_wishes = []
-
-    for wish in wishes:
-        wish_lat, wish_lon = wish.latitude, wish.longitude
-        if wish_lat is not None and wish_lon is not None:
-            distance = haversine(latitude, longitude, wish_lat, wish_lon)
-            if distance <= radius:
-                nearby_wishes.append(wish)
+    nearby_wishes = ids_within_radius(Wishes.objects.all(), latitude, longitude, radius)
 
     if not nearby_wishes:
-        return JsonResponse({'success': True, 'data': {
+        return FastJsonResponse({'success': True, 'data': {
             "items": [] , 
             'total_pages': 0, 
             'count': 0,
@@ -523,10 +673,10 @@ def wishes_by_location_view(request):
         'total_pages': paginator.num_pages,
         'has_next': wishes_page.has_next(),
         'has_previous': wishes_page.has_previous(),
-        'items': [wish_to_dict(wish) for wish in wishes_page.object_list]
+        'items': wish_payloads(wishes_page.object_list)
     }
 
-    return JsonResponse({'success': True, 'data': data}, safe=False)
+    return FastJsonResponse({'success': True, 'data': data}, safe=False)
 
 
 
@@ -535,75 +685,75 @@ def check_user_exists(request):
     try:
         email = request.GET.get('email')
         if not email:
-            return JsonResponse({'success': False, 'error': 'Email parameter is required'}, status=400)
+            return FastJsonResponse({'success': False, 'error': 'Email parameter is required'}, status=400)
 
         try:
             user = SeekersInstitutes.objects.get(email=email)
             user_data = user_backend_to_dict(user)
-            return JsonResponse({'success': True, 'data': {'user_exists': True, 'user_data': user_data}}, status=200)
+            return FastJsonResponse({'success': True, 'data': {'user_exists': True, 'user_data': user_data}}, status=200)
         except SeekersInstitutes.DoesNotExist:
-            return JsonResponse({'success': True, 'data': {'user_exists': False}}, status=200)
+            return FastJsonResponse({'success': True, 'data': {'user_exists': False}}, status=200)
 
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
+
 
+def categories_etag(request):
+    return get_cached_categories()['etag']
 
 
 @require_GET    
+@condition(etag_func=categories_etag)
 def get_categories(request):
     try:
-        speech_categories = Speeches.objects.values_list('category', flat=True).distinct()
-        wish_categories = Wishes.objects.values_list('category', flat=True).distinct()
+        entry = get_cached_categories()
         
-        all_categories = set(list(speech_categories) + list(wish_categories) + [
-            "Education", "Personal", "Other", "Technology", "Finance", "Travel", "Environment",
-            "Hobbies", "Entrepreneurship", "Spirituality and Religion", "Entertainment",
-            "Literature", "Music", "Lifestyle"
-        ])
-        
-        return JsonResponse({'success': True, 'data': {'categories': list(all_categories)}}, status=200)
+        return FastJsonResponse({'success': True, 'data': {'categories': entry['categories'], 'counts': entry['counts']}}, status=200)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
     
 
 @require_GET
 def get_wish_details(request, wishID):
     try:
-        wish = get_object_or_404(Wishes, wish_id=wishID)
-        wish_details = wish_to_dict(wish)
-        return JsonResponse({'success': True, 'data': wish_details}, status=200)
+        wish_details = get_payload('wish', wishID, load_wishes)
+        if wish_details is None:
+            raise Http404('No Wishes matches the given query.')
+        return FastJsonResponse({'success': True, 'data': wish_details}, status=200)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
 @require_GET
 def get_speech_details(request, speechID):
     try:
-        speech = get_object_or_404(Speeches, speech_id=speechID)
-        speech_details = speech_to_dict(speech)
-        return JsonResponse({'success': True, 'data': speech_details}, status=200)
+        speech_details = get_payload('speech', speechID, load_speeches)
+        if speech_details is None:
+            raise Http404('No Speeches matches the given query.')
+        return FastJsonResponse({'success': True, 'data': speech_details}, status=200)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
     
 @require_GET
 def get_user_speeches(request, userID):
 
     try:
         user = get_object_or_404(SeekersInstitutes, user_id=userID)
-        speeches = Speeches.objects.filter(created_by=user).select_related('speech_status')
+        speeches = Speeches.objects.filter(created_by=user).order_by('speech_id')
         
-        speeches_data = [speech_to_dict(speech) for speech in speeches]
+        speeches_data = speech_payloads(speeches.values_list('speech_id', flat=True))
         
-        return JsonResponse({'success': True, 'data': {'speeches': speeches_data}}, status=200)
+        return FastJsonResponse({'success': True, 'data': {'speeches': speeches_data}}, status=200)
     
     except SeekersInstitutes.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'User does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'User does not exist'}, status=404)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
 
@@ -619,7 +769,7 @@ def create_social_media_post(request):
         user_id = data.get('user_id')
 
         if not user_id:
-            return JsonResponse({'success': False, 'error': 'User ID is required'}, status=400)
+            return FastJsonResponse({'success': False, 'error': 'User ID is required'}, status=400)
 
         # Check if the request contains either wish_id or speech_id
         if 'wish_id' in data:
@@ -627,7 +777,7 @@ def create_social_media_post(request):
             wish = Wishes.objects.get(pk=wish_id)
             user = SeekersInstitutes.objects.get(pk=user_id)
             social_media = SocialMedia.objects.create(wish=wish, url=url, description=description, platform=platform, user=user)
-            return JsonResponse( {'success': True, 'data': {'message': f'Social media entry created for Wish {wish_id}' , 'social_media_id': social_media.social_media_id }  }, status=201)
+            return FastJsonResponse( {'success': True, 'data': {'message': f'Social media entry created for Wish {wish_id}' , 'social_media_id': social_media.social_media_id }  }, status=201)
         
 
         elif 'speech_id' in data:
@@ -635,22 +785,22 @@ def create_social_media_post(request):
             speech = Speeches.objects.get(pk=speech_id)
             user = SeekersInstitutes.objects.get(pk=user_id)
             social_media = SocialMedia.objects.create(speech=speech, url=url, description=description, platform=platform , user=user)
-            return JsonResponse({'success': True, 'data': {'message': f'Social media entry created for Speech {speech_id}' ,  'social_media_id': social_media.social_media_id }  }, status=201)
+            return FastJsonResponse({'success': True, 'data': {'message': f'Social media entry created for Speech {speech_id}' ,  'social_media_id': social_media.social_media_id }  }, status=201)
         
         else:
-            return JsonResponse({'success': False, 'error': 'Invalid request payload'}, status=400)
+            return FastJsonResponse({'success': False, 'error': 'Invalid request payload'}, status=400)
     
     except KeyError:
-        return JsonResponse({'success': False, 'error': 'Missing required fields in request payload'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Missing required fields in request payload'}, status=400)
     
     except Wishes.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Wish does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'Wish does not exist'}, status=404)
     
     except Speeches.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Speech does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'Speech does not exist'}, status=404)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
     
 
 
@@ -662,19 +812,22 @@ def event(request):
     page_number = request.GET.get('page', 1)
     items_per_page = 10  # You can adjust this number as needed
     
-    social_media_entries = SocialMedia.objects.select_related('wish', 'speech').all()
+    social_media_entries = SocialMedia.objects.select_related('wish', 'speech').order_by('created_date', 'social_media_id')
     
     if is_completed:
         social_media_entries = social_media_entries.filter(
-            Q(wish__wish_status__status='Completed') | Q(speech__speech_status__status='Completed')
+            Q(wish__status='Completed') | Q(speech__status='Completed')
         )
+
+    if 'cursor' in request.GET:
+        return cursor_response(request, social_media_entries, social_media_page)
     
     paginator = Paginator(social_media_entries, items_per_page)
     page_obj = paginator.get_page(page_number)
     
     formatted_items = [social_media_to_dict(item) for item in page_obj.object_list]
     
-    return JsonResponse({
+    return FastJsonResponse({
         'success': True,
         'data': {
             'items': formatted_items,
@@ -688,7 +841,7 @@ def event(request):
 
 def event_by_id(request, event_type, event_id):
     if event_type not in ['wish', 'speech']:
-        return JsonResponse({
+        return FastJsonResponse({
             'success': False,
             'error': 'Invalid event type. Must be either "wish" or "speech".'
         }, status=400)
@@ -702,30 +855,30 @@ def event_by_id(request, event_type, event_id):
             social_media = SocialMedia.objects.filter(speech=speech).first()
 
         if not social_media:
-            return JsonResponse({
+            return FastJsonResponse({
                 'success': False,
                 'error': f'No social media entry found for the given {event_type} ID'
             }, status=404)
 
         data = {
             'social_media_id': social_media.social_media_id,
-            'wish_id': social_media.wish.wish_id if social_media.wish else None,
-            'speech_id': social_media.speech.speech_id if social_media.speech else None,
+            'wish_id': social_media.wish_id,
+            'speech_id': social_media.speech_id,
             'url': social_media.url,
             'description': social_media.description,
             'created_date': social_media.created_date.strftime('%Y-%m-%d %H:%M:%S'),
             'platform': social_media.platform,
-            'wish': wish_to_dict(social_media.wish) if social_media.wish else None,
-            'speech': speech_to_dict(social_media.speech) if social_media.speech else None,
+            'wish': get_payload('wish', social_media.wish_id, load_wishes) if social_media.wish_id else None,
+            'speech': get_payload('speech', social_media.speech_id, load_speeches) if social_media.speech_id else None,
         }
 
-        return JsonResponse({
+        return FastJsonResponse({
             'success': True,
             'data': data
         })
 
     except (Wishes.DoesNotExist, Speeches.DoesNotExist):
-        return JsonResponse({
+        return FastJsonResponse({
             'success': False,
             'error': f'No {event_type} found with the given ID'
         }, status=404)
@@ -737,11 +890,11 @@ def event_speech(request):
     is_completed = request.GET.get('isCompleted', 'false').lower() == 'true'
     
     if is_completed:
-        social_media_entries = SocialMedia.objects.filter(speech__speech_status__status='Completed').values()
+        social_media_entries = SocialMedia.objects.filter(speech__status='Completed').values()
     else:
         social_media_entries = SocialMedia.objects.filter(speech__isnull=False).values()
     
-    return JsonResponse({'success': True, 'data': list(social_media_entries)}, safe=False)
+    return FastJsonResponse({'success': True, 'data': list(social_media_entries)}, safe=False)
 
 
 
@@ -752,14 +905,20 @@ def speeches_by_category(request, category):
         page_number = request.GET.get('page', 1)
         items_per_page = 10  # You can adjust this number as needed
 
-        speeches = Speeches.objects.filter(category=category).select_related('speech_status', 'created_by')
+        key = category_key(category)
+        if key is None:
+            return FastJsonResponse({'success': False, 'error': 'Category is required'}, status=400)
+        # Any case and spacing of the category matches, as for wishes.
+        speeches = Speeches.objects.filter(category_key=key).order_by('created_date', 'speech_id')
+        if 'cursor' in request.GET:
+            return cursor_response(request, speeches.only('speech_id', 'created_date'), speech_page)
         
-        paginator = Paginator(speeches, items_per_page)
+        paginator = Paginator(speeches.values_list('speech_id', flat=True), items_per_page)
         page_obj = paginator.get_page(page_number)
         
-        speeches_list = [speech_to_dict(speech) for speech in page_obj]
+        speeches_list = speech_payloads(page_obj)
         
-        return JsonResponse({
+        return FastJsonResponse({
             'success': True,
             'data': {
                 'items': speeches_list,
@@ -771,7 +930,7 @@ def speeches_by_category(request, category):
         }, safe=False, status=200)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
 @require_GET
@@ -781,19 +940,12 @@ def speeches_by_location_view(request):
         longitude = float(request.GET.get('longitude'))
         radius = float(request.GET.get('radius', 20))
     except (TypeError, ValueError):
-        return JsonResponse({'success': False, 'error': 'Invalid or missing latitude, longitude, or radius parameters'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Invalid or missing latitude, longitude, or radius parameters'}, status=400)
 
-    speeches = Speeches.objects.all().select_related('speech_status', 'created_by')
-    nearby_speeches = []
-    for speech in speeches:
-        speech_lat, speech_lon = speech.latitude, speech.longitude
-        if speech_lat is not None and speech_lon is not None:
-            distance = haversine(latitude, longitude, speech_lat, speech_lon)
-            if distance <= radius:
-                nearby_speeches.append(speech)
+    nearby_speeches = ids_within_radius(Speeches.objects.all(), latitude, longitude, radius)
 
     if not nearby_speeches:
-        return JsonResponse({'success': True, 'data': {
+        return FastJsonResponse({'success': True, 'data': {
             "items": [] , 
             'total_pages': 0, 
             'count': 0,
@@ -816,10 +968,144 @@ def speeches_by_location_view(request):
         'total_pages': paginator.num_pages,
         'has_next': speeches_page.has_next(),
         'has_previous': speeches_page.has_previous(),
-        'items': [speech_to_dict(speech) for speech in speeches_page.object_list]
+        'items': speech_payloads(speeches_page.object_list)
     }
 
-    return JsonResponse({'success': True, 'data': data}, safe=False)
+    return FastJsonResponse({'success': True, 'data': data}, safe=False)
+
+
+
+@require_GET
+def nearest_view(request):
+    item_type = request.GET.get('type', 'wish')
+    if item_type not in ['wish', 'speech']:
+        return FastJsonResponse({'success': False, 'error': 'Invalid type. Must be either "wish" or "speech".'}, status=400)
+
+    try:
+        latitude = float(request.GET.get('latitude'))
+        longitude = float(request.GET.get('longitude'))
+        k = int(request.GET.get('k', 10))
+    except (TypeError, ValueError):
+        return FastJsonResponse({'success': False, 'error': 'Invalid or missing latitude, longitude, or k parameters'}, status=400)
+
+    if not 1 <= k <= 100:
+        return FastJsonResponse({'success': False, 'error': 'k must be between 1 and 100'}, status=400)
+
+    if item_type == 'wish':
+        model, kind, loader = Wishes, 'wish', load_wishes
+    else:
+        model, kind, loader = Speeches, 'speech', load_speeches
+
+    nearest = nearest_ids(model.objects.all(), latitude, longitude, k)
+    distances = dict(nearest)
+    items = [
+        {**payload, 'distance': distances[payload[f'{kind}_id']]}
+        for payload in get_payloads(kind, [pk for pk, _ in nearest], loader)
+    ]
+
+    data = {
+        'count': len(items),
+        'items': items
+    }
+
+    return FastJsonResponse({'success': True, 'data': data})
+
+
+
+@require_GET
+def search_view(request):
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return FastJsonResponse({'success': False, 'error': 'Missing search query q'}, status=400)
+
+    item_type = request.GET.get('type')
+    if item_type not in [None, 'wish', 'speech']:
+        return FastJsonResponse({'success': False, 'error': 'Invalid type. Must be either "wish" or "speech".'}, status=400)
+
+    try:
+        results, next_cursor = search(
+            query,
+            kinds=[item_type] if item_type else ['wish', 'speech'],
+            category=request.GET.get('category'),
+            status=request.GET.get('status'),
+            cursor=request.GET.get('cursor'),
+        )
+    except InvalidCursor as e:
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=400)
+
+    payloads = {}
+    for kind, load_payloads in (('wish', wish_payloads), ('speech', speech_payloads)):
+        for payload in load_payloads([pk for result_kind, pk, _ in results if result_kind == kind]):
+            payloads[kind, payload[f'{kind}_id']] = payload
+    items = [
+        {**payloads[kind, pk], 'type': kind, 'score': round(score, 6)}
+        for kind, pk, score in results
+        if (kind, pk) in payloads
+    ]
+
+    return FastJsonResponse({
+        'success': True,
+        'data': {
+            'items': items,
+            'next_cursor': next_cursor,
+            'has_next': next_cursor is not None
+        }
+    })
+
+
+
+@require_GET
+def suggest_view(request):
+    prefix = request.GET.get('q', '')
+    fields = request.GET.getlist('field')
+    if any(field not in suggest.FIELDS for field in fields):
+        return FastJsonResponse({'success': False, 'error': f'Invalid field. Must be one of: {", ".join(suggest.FIELDS)}'}, status=400)
+
+    try:
+        limit = int(request.GET.get('limit', 10))
+    except ValueError:
+        return FastJsonResponse({'success': False, 'error': 'Invalid limit'}, status=400)
+    if not 1 <= limit <= 50:
+        return FastJsonResponse({'success': False, 'error': 'limit must be between 1 and 50'}, status=400)
+
+    return FastJsonResponse({
+        'success': True,
+        'data': {
+            'items': suggest.suggest(prefix, limit, fields)
+        }
+    })
+
+
+
+def export_options(request):
+    """(type, format, since) of an export/ request, or an error response."""
+    source = request.GET.get('type', 'wishes')
+    if source not in export.SOURCES:
+        return FastJsonResponse({'success': False, 'error': f'Invalid type. Must be one of: {", ".join(export.SOURCES)}'}, status=400)
+    output = request.GET.get('format', 'ndjson')
+    if output not in export.FORMATS:
+        return FastJsonResponse({'success': False, 'error': f'Invalid format. Must be one of: {", ".join(export.FORMATS)}'}, status=400)
+    since = None
+    if request.GET.get('since'):
+        since = export.parse_since(request.GET['since'])
+        if since is None:
+            return FastJsonResponse({'success': False, 'error': 'Invalid since. Use an ISO 8601 date or datetime'}, status=400)
+    return source, output, since
+
+
+def export_response(content, source, output):
+    response = StreamingHttpResponse(content, content_type=export.FORMATS[output][0])
+    response['Content-Disposition'] = f'attachment; filename="{source}.{output}"'
+    return response
+
+
+@require_GET
+def export_view(request):
+    options = export_options(request)
+    if isinstance(options, HttpResponse):
+        return options
+    source, output, since = options
+    return export_response(export.stream(source, output, since), source, output)
 
 
 
@@ -841,16 +1127,16 @@ def update_user(request, user_id):
         
         user.save()
         
-        return JsonResponse({'success': True, 'data': {'message': f'User {user_id} updated successfully'}}, status=200)
+        return FastJsonResponse({'success': True, 'data': {'message': f'User {user_id} updated successfully'}}, status=200)
     
     except SeekersInstitutes.DoesNotExist:
-        return JsonResponse({'success': False, 'error': f'User with user_id {user_id} does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': f'User with user_id {user_id} does not exist'}, status=404)
     
     except KeyError:
-        return JsonResponse({'success': False, 'error': 'Missing required fields in request payload'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Missing required fields in request payload'}, status=400)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
 @csrf_exempt
@@ -866,50 +1152,60 @@ def change_status(request):
             wish = Wishes.objects.get(pk=wish_id)
             
             if social.wish_id != wish.wish_id:
-                return JsonResponse({'success': False, 'error': 'Social media entry not related to this wish'}, status=400)
+                return FastJsonResponse({'success': False, 'error': 'Social media entry not related to this wish'}, status=400)
             
-            wish_status, created = WishStatus.objects.get_or_create(wish=wish)
-            wish_status.status = 'Completed'
-            wish_status.save()
+            with transaction.atomic():
+                # Locked, so concurrent calls move the pickers' counters once.
+                wish_status = lock_status(WishStatus, wish.pk)
+                old_status = wish_status.status
+                wish_status.status = 'Completed'
+                wish_status.save(update_fields=['status'])
+                
+                wish.selected_fulfillment = social
+                wish.save()
+
+                record_status_change('wishes', wish_status.picked_by.values_list('pk', flat=True), old_status, 'Completed')
             
-            wish.selected_fulfillment = social
-            wish.save()
-            
-            return JsonResponse({'success': True, 'data': {'message': f'Wish {wish_id} status updated to Completed for user {social.user.user_id}'}}, status=200)
+            return FastJsonResponse({'success': True, 'data': {'message': f'Wish {wish_id} status updated to Completed for user {social.user.user_id}'}}, status=200)
         
         elif 'speech_id' in data:
             speech_id = data['speech_id']
             speech = Speeches.objects.get(pk=speech_id)
             
             if social.speech_id != speech.speech_id:
-                return JsonResponse({'success': False, 'error': 'Social media entry not related to this speech'}, status=400)
-            
-            speech_status, created = SpeechStatus.objects.get_or_create(speech=speech)
-            speech_status.status = 'Completed'
-            speech_status.save()
+                return FastJsonResponse({'success': False, 'error': 'Social media entry not related to this speech'}, status=400)
             
-            speech.selected_fulfillment = social
-            speech.save()
+            with transaction.atomic():
+                # Locked, so concurrent calls move the pickers' counters once.
+                speech_status = lock_status(SpeechStatus, speech.pk)
+                old_status = speech_status.status
+                speech_status.status = 'Completed'
+                speech_status.save(update_fields=['status'])
+                
+                speech.selected_fulfillment = social
+                speech.save()
+
+                record_status_change('speeches', speech_status.picked_by.values_list('pk', flat=True), old_status, 'Completed')
             
-            return JsonResponse({'success': True, 'data': {'message': f'Speech {speech_id} status updated to Completed for user {social.user.user_id}'}}, status=200)
+            return FastJsonResponse({'success': True, 'data': {'message': f'Speech {speech_id} status updated to Completed for user {social.user.user_id}'}}, status=200)
         
         else:
-            return JsonResponse({'success': False, 'error': 'Invalid request payload'}, status=400)
+            return FastJsonResponse({'success': False, 'error': 'Invalid request payload'}, status=400)
     
     except SocialMedia.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Social media entry not found'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'Social media entry not found'}, status=404)
     
     except Wishes.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Wish does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'Wish does not exist'}, status=404)
     
     except Speeches.DoesNotExist:
-        return JsonResponse({'success': False, 'error': 'Speech does not exist'}, status=404)
+        return FastJsonResponse({'success': False, 'error': 'Speech does not exist'}, status=404)
     
     except json.JSONDecodeError:
-        return JsonResponse({'success': False, 'error': 'Invalid JSON in request body'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Invalid JSON in request body'}, status=400)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 @csrf_exempt
 @require_POST
@@ -919,10 +1215,10 @@ def get_fulfill_details(request):
         
         if 'wish_id' in data:
             wish_id = data['wish_id']
-            socialMedia = SocialMedia.objects.filter(wish_id=wish_id)
+            socialMedia = SocialMedia.objects.filter(wish_id=wish_id).select_related('user')
             
 
-            data = [{'wish_id': item.wish.wish_id,
+            data = [{'wish_id': item.wish_id,
                      'user': user_to_dict(item.user) ,
                      'url': item.url , 
                      'social_media_id': item.social_media_id,
@@ -931,14 +1227,14 @@ def get_fulfill_details(request):
                      }
                     for item in socialMedia]
             
-            return JsonResponse({'success': True, 'data': data}, safe=False)
+            return FastJsonResponse({'success': True, 'data': data}, safe=False)
         
         elif 'speech_id' in data:
             speech_id = data['speech_id']
-            socialMedia = SocialMedia.objects.filter(speech_id=speech_id)
+            socialMedia = SocialMedia.objects.filter(speech_id=speech_id).select_related('user')
 
             data = [{
-                     'speech_id': item.speech.speech_id,
+                     'speech_id': item.speech_id,
                      'user': user_to_dict(item.user) ,
                      'url': item.url,
                      'social_media_id': item.social_media_id,
@@ -946,76 +1242,86 @@ def get_fulfill_details(request):
                      'platform': item.platform}
                     for item in socialMedia]
             
-            return JsonResponse({'success': True, 'data': data}, safe=False)
+            return FastJsonResponse({'success': True, 'data': data}, safe=False)
         
         else:
-            return JsonResponse({'success': False, 'error': 'Invalid request payload'}, status=400)
+            return FastJsonResponse({'success': False, 'error': 'Invalid request payload'}, status=400)
     
     except KeyError:
-        return JsonResponse({'success': False, 'error': 'Missing required fields in request payload'}, status=400)
+        return FastJsonResponse({'success': False, 'error': 'Missing required fields in request payload'}, status=400)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
 
 
 @require_GET
 def get_social_media(request, socialMediaID):
     try:
 
-        socialMedia = get_object_or_404(SocialMedia, social_media_id=socialMediaID)
+        socialMedia = get_object_or_404(SocialMedia.objects.select_related('user'), social_media_id=socialMediaID)
 
         if not socialMedia:
-            return JsonResponse({'success': False, 'error': 'Social media entry not found'}, status=404)
+            return FastJsonResponse({'success': False, 'error': 'Social media entry not found'}, status=404)
 
         data = {
             'social_media_id': socialMedia.social_media_id,
-            'wish_id': socialMedia.wish.wish_id if socialMedia.wish else None,
-            'speech_id': socialMedia.speech.speech_id if socialMedia.speech else None,
+            'wish_id': socialMedia.wish_id,
+            'speech_id': socialMedia.speech_id,
             'url': socialMedia.url,
             'description': socialMedia.description,
             'created_date': socialMedia.created_date.strftime('%Y-%m-%d %H:%M:%S'),
             'user': user_to_dict(socialMedia.user),
-            'wish': wish_to_dict(socialMedia.wish) if socialMedia.wish else None,
-            'speech': speech_to_dict(socialMedia.speech) if socialMedia.speech else None,
+            'wish': get_payload('wish', socialMedia.wish_id, load_wishes) if socialMedia.wish_id else None,
+            'speech': get_payload('speech', socialMedia.speech_id, load_speeches) if socialMedia.speech_id else None,
             'platform': socialMedia.platform,
         }
 
-        return JsonResponse({'success': True, 'data': data }, status=200)
+        return FastJsonResponse({'success': True, 'data': data }, status=200)
     
     except Exception as e:
-        return JsonResponse({'success': False, 'error': str(e)}, status=500)
+        return FastJsonResponse({'success': False, 'error': str(e)}, status=500)
+
 
 
+SUMMARY_SECTIONS = (
+    "wishes_created", "wishes_pending", "wishes_fulfilled",
+    "speeches_created", "speeches_pending", "speeches_fulfilled",
+)
+
 
 @require_GET
 def get_user_summary(request, userId):
     # Fetch the user details
     user = get_object_or_404(SeekersInstitutes, pk=userId)
 
-    # Helper function to format wish/speech data
-    def format_item(item, item_type):
-        return {
-            f"{item_type}_id": getattr(item, f"{item_type}_id"),
-            f"{item_type}_title": getattr(item, f"{item_type}_title"),
-            f"{item_type}_description": getattr(item, f"{item_type}_description"),
-            "created_by": {
-                "picture": item.created_by.picture,
-                "first_name": item.created_by.first_name,
-            },
-            "status": getattr(item, f"{item_type}_status").status if hasattr(item, f"{item_type}_status") else None,
-            "category": item.category,
-            "created_date": item.created_date.strftime('%Y-%m-%d %H:%M:%S'),
-        }
+    # Optional per-section limits: ?limit=N applies to every section and
+    # ?<section>_limit=N overrides it for one section.
+    limits = {}
+    try:
+        for section in SUMMARY_SECTIONS:
+            value = request.GET.get(f"{section}_limit", request.GET.get("limit"))
+            limits[section] = int(value) if value is not None else None
+            if limits[section] is not None and limits[section] < 0:
+                raise ValueError
+    except ValueError:
+        return FastJsonResponse({"success": False, "error": "Limits must be non-negative integers"}, status=400)
+
+    # Items are rendered straight from values() rows; no model instances.
+    def fetch(queryset, section, plan):
+        queryset = queryset.order_by("-created_date", "-pk").values(*plan.columns())
+        if limits[section] is not None:
+            queryset = queryset[:limits[section]]
+        return [plan.render_row(row) for row in queryset]
 
     # Fetch and format wishes
-    wishes_created = [format_item(wish, "wish") for wish in Wishes.objects.filter(created_by=user)]
-    wishes_pending = [format_item(status.wish, "wish") for status in WishStatus.objects.filter(picked_by=user, status='In-Progress')]
-    wishes_fulfilled = [format_item(status.wish, "wish") for status in WishStatus.objects.filter(picked_by=user, status='Completed')]
+    wishes_created = fetch(Wishes.objects.filter(created_by=user), "wishes_created", WISH_SUMMARY_PLAN)
+    wishes_pending = fetch(Wishes.objects.filter(wish_status__picked_by=user, status='In-Progress'), "wishes_pending", WISH_SUMMARY_PLAN)
+    wishes_fulfilled = fetch(Wishes.objects.filter(wish_status__picked_by=user, status='Completed'), "wishes_fulfilled", WISH_SUMMARY_PLAN)
 
     # Fetch and format speeches
-    speeches_created = [format_item(speech, "speech") for speech in Speeches.objects.filter(created_by=user)]
-    speeches_pending = [format_item(status.speech, "speech") for status in SpeechStatus.objects.filter(picked_by=user, status='In-Progress')]
-    speeches_fulfilled = [format_item(status.speech, "speech") for status in SpeechStatus.objects.filter(picked_by=user, status='Completed')]
+    speeches_created = fetch(Speeches.objects.filter(created_by=user), "speeches_created", SPEECH_SUMMARY_PLAN)
+    speeches_pending = fetch(Speeches.objects.filter(speech_status__picked_by=user, status='In-Progress'), "speeches_pending", SPEECH_SUMMARY_PLAN)
+    speeches_fulfilled = fetch(Speeches.objects.filter(speech_status__picked_by=user, status='Completed'), "speeches_fulfilled", SPEECH_SUMMARY_PLAN)
 
     # Prepare the response data
     data = {
@@ -1028,10 +1334,36 @@ def get_user_summary(request, userId):
         "speeches_fulfilled": speeches_fulfilled,
     }
 
-    return JsonResponse({"success": True, "data": data})
+    return FastJsonResponse({"success": True, "data": data})
+
+
+
+
+
+@require_GET
+def user_stats(request, user_id):
+    stats = UserStats.objects.filter(user_id=user_id).first()
+    if stats is None:
+        if not SeekersInstitutes.objects.filter(pk=user_id).exists():
+            return FastJsonResponse({'success': False, 'error': 'User does not exist'}, status=404)
+        stats = UserStats(user_id=user_id)
+
+    return FastJsonResponse({'success': True, 'data': {
+        'user_id': stats.user_id,
+        'wishes_created': stats.wishes_created,
+        'wishes_pending': stats.wishes_pending,
+        'wishes_fulfilled': stats.wishes_fulfilled,
+        'speeches_created': stats.speeches_created,
+        'speeches_pending': stats.speeches_pending,
+        'speeches_fulfilled': stats.speeches_fulfilled,
+    }}, status=200)
 
 
 
+@require_GET
+def metrics_view(request):
+    return HttpResponse(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
 
 
 @csrf_exempt
@@ -1040,11 +1372,11 @@ def user_details(request, userID):
     try:
         user = SeekersInstitutes.objects.get(user_id=userID)
         user_data = user_backend_to_dict(user)
-        return JsonResponse({'success': True, 'data': user_data}, status=200)
+        return FastJsonResponse({'success': True, 'data': user_data}, status=200)
 
     except SeekersInstitutes.DoesNotExist:
 
-        return JsonResponse({ 'success': False, 'error': 'User does not exist'}, status=404)
+        return FastJsonResponse({ 'success': False, 'error': 'User does not exist'}, status=404)
     
 
 
@@ -1058,7 +1390,7 @@ def sign_up_user_view(request):
         missing_fields = [field for field in mandatory_fields if field not in data]
 
         if missing_fields:
-            return JsonResponse({'error': f'Missing fields: {", ".join(missing_fields)}' , 'success': False}, status=400)
+            return FastJsonResponse({'error': f'Missing fields: {", ".join(missing_fields)}' , 'success': False}, status=400)
 
         email = data['email']
         password = data['password']
@@ -1067,7 +1399,7 @@ def sign_up_user_view(request):
         is_institute = data.get('is_institute', False)
 
         if User.objects.filter(username=email).exists():
-            return JsonResponse({'error': 'Email already exists'}, status=400)
+            return FastJsonResponse({'error': 'Email already exists'}, status=400)
 
         user = User.objects.create_user(username=email, email=email, password=password)
         data = SeekersInstitutes.objects.create(
@@ -1083,12 +1415,12 @@ def sign_up_user_view(request):
         response = user_to_dict(data)
         print(response)
 
-        return JsonResponse({'data':response, 'success':True}, status=201)
+        return FastJsonResponse({'data':response, 'success':True}, status=201)
 
     except json.JSONDecodeError:
-        return JsonResponse({'error': 'Invalid JSON payload' , 'success': False}, status=400)
+        return FastJsonResponse({'error': 'Invalid JSON payload' , 'success': False}, status=400)
     except Exception as e:
-        return JsonResponse({'error': str(e) , 'success': False}, status=500)
+        return FastJsonResponse({'error': str(e) , 'success': False}, status=500)
 
 @csrf_exempt
 @require_http_methods(["POST"])
@@ -1102,7 +1434,7 @@ def sign_in_view(request):
         password = data.get('password')
 
         if not email or not password:
-            return JsonResponse({'error': 'Email and password are required' , 'success': False}, status=400)
+            return FastJsonResponse({'error': 'Email and password are required' , 'success': False}, status=400)
 
         # Authenticate user
         user = authenticate(request, username=email, password=password)
@@ -1116,25 +1448,25 @@ def sign_in_view(request):
             # print(data)
             
             
-            return JsonResponse( {
+            return FastJsonResponse( {
                 "success": True,
                 "data": data 
                 }, status=200)
         else:
-            return JsonResponse({'error': 'Invalid email or password', 'success': False}, status=401)
+            return FastJsonResponse({'error': 'Invalid email or password', 'success': False}, status=401)
 
     except SeekersInstitutes.DoesNotExist:
-        return JsonResponse({'error': 'User details not found in SeekersInstitutes' , 'success': False}, status=404)
+        return FastJsonResponse({'error': 'User details not found in SeekersInstitutes' , 'success': False}, status=404)
     except json.JSONDecodeError:
-        return JsonResponse({'error': 'Invalid JSON payload' , 'success': False}, status=400)
+        return FastJsonResponse({'error': 'Invalid JSON payload' , 'success': False}, status=400)
     except Exception as e:
-        return JsonResponse({'error': str(e) , 'success': False}, status=500)
+        return FastJsonResponse({'error': str(e) , 'success': False}, status=500)
 
 @require_http_methods(["POST"])
 def sign_out_view(request):
     try:
         # Log the user out by flushing the session
         request.session.flush()
-        return JsonResponse({'message': 'Successfully signed out'}, status=200)
+        return FastJsonResponse({'message': 'Successfully signed out'}, status=200)
     except Exception as e:
-        return JsonResponse({'error': str(e)}, status=500)
\ No newline at end of file
+        return FastJsonResponse({'error': str(e)}, status=500)
\ No newline at end of file